@@ -1,7 +1,10 @@
 """
 API routes for the RAG application
 """
+import asyncio
 import time
+from datetime import datetime
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 
 from app.models.requests import (
@@ -13,7 +16,7 @@ from app.services.file_manager import get_file_manager
 from app.services.question_logger import get_question_logger
 from app.services.persistent_cache import get_persistent_cache_manager
 from app.core.security import verify_token
-from app.core.config import settings
+from app.core.config import settings, K_RETRIEVE
 from app.core.directories import get_directory_manager
 from app.utils.debug import debug_print, info_print
 
@@ -61,12 +64,18 @@ async def process_queries(
     2. Answers each question using the RAG pipeline
     3. Returns clean, direct answers
     """
-    import time
-    
     try:
         # Start total processing timer
         total_start_time = time.time()
         
+        # Read settings once - every settings.* access is a pydantic attribute lookup
+        embedding_provider = settings.embedding_provider
+        llm_provider = settings.llm_provider
+        embedding_model = settings.embedding_model
+        k_retrieve = K_RETRIEVE
+        max_context_tokens = settings.max_context_tokens
+        max_concurrent_questions = settings.max_concurrent_questions
+        
         rag_coordinator = get_rag_coordinator()
         question_logger = get_question_logger()
         
@@ -78,7 +87,7 @@ async def process_queries(
             doc_result = {"status": "skipped_for_web_scraping", "doc_id": None}
         else:
             debug_print(f"Processing document: {request.documents}")
-            debug_print(f"Using embedding provider: {settings.embedding_provider}")
+            debug_print(f"Using embedding provider: {embedding_provider}")
             doc_start_time = time.time()
             doc_result = await rag_coordinator.process_document(
                 url=str(request.documents)
@@ -88,11 +97,10 @@ async def process_queries(
         
         # Start question logging session
         session_metadata = {
-            "embedding_provider": settings.embedding_provider,
-            "llm_provider": settings.llm_provider,
-            "embedding_model": settings.embedding_model,
-            "total_questions": len(request.questions),
-            "query_transformation_enabled": request.enable_query_transformation if request.enable_query_transformation is not None else settings.enable_query_transformation
+            "embedding_provider": embedding_provider,
+            "llm_provider": llm_provider,
+            "embedding_model": embedding_model,
+            "total_questions": len(request.questions)
         }
         
         session_id = question_logger.start_session(
@@ -127,19 +135,8 @@ async def process_queries(
                 if "preserved_definitions" in doc_stats:
                     debug_print(f"  - Preserved definitions: {doc_stats['preserved_definitions']}")
         
-        # Step 2: Pre-warm embedding model for parallel processing
-        debug_print("Pre-warming embedding model for parallel processing...")
-        embedding_warmup_start = time.time()
-        
-        # Ensure the embedding model is loaded before parallel processing
-        if not rag_coordinator.embedding_manager.ensure_model_ready():
-            raise HTTPException(
-                status_code=500, 
-                detail="Failed to initialize embedding model for parallel processing"
-            )
-        
-        embedding_warmup_time = time.time() - embedding_warmup_start
-        debug_print(f"Embedding model ready in {embedding_warmup_time:.2f}s")
+        # Step 2: The embedding model is pre-warmed at application startup
+        embedding_warmup_time = 0.0
         
         # Step 3: Answer all questions with batch optimization (OPTIMIZED PARALLEL PROCESSING)
         info_print(f"Processing {len(request.questions)} questions with batch optimization")
@@ -154,60 +151,67 @@ async def process_queries(
             # Modify questions to include the URL for proper web scraping detection
             questions_to_process = [f"{q} {api_url}" for q in request.questions]
         
-        # Process questions individually for reliable and consistent results
-        rag_responses = []
-        for i, question in enumerate(questions_to_process):
-            debug_print(f"Processing question {i+1}/{len(questions_to_process)}: {question[:50]}...")
-            if request.use_universal_solver:
-                debug_print(f"  Using Universal LLM Solver for question {i+1}")
-            response = await rag_coordinator.answer_question(
-                question=question,
-                doc_id=doc_id,
-                k_retrieve=settings.k_retrieve,
-                max_context_length=settings.max_context_tokens,
-                use_universal_solver=request.use_universal_solver or False
-            )
-            rag_responses.append(response)
-            debug_print(f"  Question {i+1} completed in {response.processing_time:.2f}s")
+        # Serve cached (doc_id, question) pairs up front so they skip embedding and retrieval
+        rag_responses = await rag_coordinator.get_cached_answers(questions_to_process, doc_id=doc_id)
+        pending = [i for i, response in enumerate(rag_responses) if response is None]
+        if len(pending) < len(questions_to_process):
+            debug_print("Answer cache hits: %d/%d", len(questions_to_process) - len(pending), len(questions_to_process))
         
-        # Log each question and response
-        for i, (question, rag_response) in enumerate(zip(request.questions, rag_responses)):
-            debug_print(f"  Question {i+1}: {question}")
-            debug_print(f"    Answered in {rag_response.processing_time:.2f}s")
-            debug_print(f"    Used {len(rag_response.sources_used)} sources")
-            
-            # Log question and response
-            try:
-                # Extract similarity scores from pipeline stats if available
-                similarity_scores = []
-                if hasattr(rag_response, 'pipeline_stats') and 'similarity_scores' in rag_response.pipeline_stats:
-                    similarity_scores = rag_response.pipeline_stats.get('similarity_scores', [])
-                elif len(rag_response.sources_used) > 0:
-                    # Try to extract from sources metadata
-                    similarity_scores = [source.get('similarity_score', 0.0) for source in rag_response.sources_used[:3]]
-                
-                question_logger.log_question(
-                    session_id=session_id,
-                    question_id=i+1,
+        # Embed the remaining questions in one batched model call instead of one call per question
+        query_embeddings = await rag_coordinator.embedding_manager.encode_queries(
+            [questions_to_process[i] for i in pending]
+        ) if pending else []
+        
+        # Answer questions concurrently, bounded by max_concurrent_questions
+        question_semaphore = asyncio.Semaphore(max_concurrent_questions)
+        
+        async def answer_one(i: int, question: str, query_embedding):
+            async with question_semaphore:
+                debug_print("Processing question %d/%d: %.50s...", i+1, len(questions_to_process), question)
+                response = await rag_coordinator.answer_question(
                     question=question,
-                    processing_time=rag_response.processing_time,
-                    answer=rag_response.answer,
-                    sources_used=len(rag_response.sources_used),
-                    similarity_scores=similarity_scores,
-                    error=None
+                    doc_id=doc_id,
+                    k_retrieve=k_retrieve,
+                    max_context_length=max_context_tokens,
+                    query_embedding=query_embedding
                 )
-            except Exception as log_error:
-                debug_print(f"Warning: Failed to log question {i+1}: {log_error}")
+                debug_print("  Question %d completed in %.2fs", i+1, response.processing_time)
+                return response
+        
+        # gather preserves argument order, so responses line up with the pending questions
+        answered = await asyncio.gather(*[
+            answer_one(i, questions_to_process[i], query_embedding)
+            for i, query_embedding in zip(pending, query_embeddings)
+        ])
+        for i, response in zip(pending, answered):
+            rag_responses[i] = response
+        
+        # Log all questions and responses in one bulk call
+        log_rows = []
+        for i, (question, rag_response) in enumerate(zip(request.questions, rag_responses)):
+            debug_print("  Question %d: %s", i+1, question)
+            debug_print("    Answered in %.2fs", rag_response.processing_time)
+            debug_print("    Used %d sources", len(rag_response.sources_used))
+            
+            log_rows.append({
+                "question_id": i+1,
+                "question": question,
+                "processing_time": rag_response.processing_time,
+                "answer": rag_response.answer,
+                "sources_used": len(rag_response.sources_used),
+                "similarity_scores": rag_response.similarity_scores.tolist(),
+                "error": None
+            })
+        
+        try:
+            question_logger.log_questions_bulk(session_id=session_id, rows=log_rows)
+        except Exception as log_error:
+            debug_print("Warning: Failed to log %d questions: %s", len(log_rows), log_error)
         
-        # Extract answers, sources, timing info, and transformation metadata
+        # Extract answers, sources and timing info
         answers = [response.answer for response in rag_responses]
         sources = [response.sources_used for response in rag_responses]
         individual_times = [response.processing_time for response in rag_responses]
-        query_transformations = [response.query_transformation for response in rag_responses]
-        
-        # Calculate transformation statistics
-        transformations_successful = sum(1 for qt in query_transformations 
-                                       if qt and qt.get('successful', False))
         
         # Calculate total times
         questions_processing_time = time.time() - questions_start_time
@@ -220,55 +224,52 @@ async def process_queries(
         info_print("\n" + "="*70)
         info_print("PARALLEL PROCESSING COMPLETED - PERFORMANCE METRICS")
         info_print("="*70)
-        info_print(f"Document Processing Time: {doc_processing_time:.2f}s")
-        info_print(f"Embedding Model Warmup: {embedding_warmup_time:.2f}s")
-        info_print(f"Questions Processing Time: {questions_processing_time:.2f}s (PARALLEL)")
-        info_print(f"Total Processing Time: {total_processing_time:.2f}s")
+        info_print("Document Processing Time: %.2fs", doc_processing_time)
+        info_print("Embedding Model Warmup: %.2fs", embedding_warmup_time)
+        info_print("Questions Processing Time: %.2fs (PARALLEL)", questions_processing_time)
+        info_print("Total Processing Time: %.2fs", total_processing_time)
         
         debug_print("\nPARALLEL PROCESSING BENEFITS:")
-        debug_print(f"  - Parallel Time: {questions_processing_time:.2f}s")
-        debug_print(f"  - Concurrent Questions Limit: {settings.max_concurrent_questions}")
+        debug_print("  - Parallel Time: %.2fs", questions_processing_time)
+        debug_print("  - Concurrent Questions Limit: %d", max_concurrent_questions)
         
         debug_print("\nQuestion-by-Question Breakdown:")
         for i, q_time in enumerate(individual_times, 1):
-            debug_print(f"  Question {i}: {q_time:.2f}s")
+            debug_print("  Question %d: %.2fs", i, q_time)
         debug_print("\nQuestions Statistics:")
-        debug_print(f"  - Total Questions: {len(request.questions)}")
-        debug_print(f"  - Average Time per Question: {sum(individual_times) / len(individual_times):.2f}s")
-        debug_print(f"  - Fastest Question: {min(individual_times):.2f}s")
-        debug_print(f"  - Slowest Question: {max(individual_times):.2f}s")
-        debug_print(f"  - Effective Questions per Second: {len(request.questions) / questions_processing_time:.2f}")
-        
-        debug_print("\nQuery Transformation Statistics:")
-        debug_print(f"  - Transformations Enabled: {request.enable_query_transformation if request.enable_query_transformation is not None else settings.enable_query_transformation}")
-        debug_print(f"  - Questions with Successful Transformation: {transformations_successful}/{len(request.questions)}")
+        debug_print("  - Total Questions: %d", len(request.questions))
+        debug_print("  - Average Time per Question: %.2fs", sum(individual_times) / len(individual_times))
+        debug_print("  - Fastest Question: %.2fs", min(individual_times))
+        debug_print("  - Slowest Question: %.2fs", max(individual_times))
+        debug_print("  - Effective Questions per Second: %.2f", len(request.questions) / questions_processing_time)
+
         info_print("="*70)
         
         # Create processing summary
         processing_summary = {
             "total_questions": len(request.questions),
-            "questions_with_transformation": transformations_successful,
             "parallel_processing_time": questions_processing_time,
             "total_processing_time": total_processing_time,
             "average_time_per_question": sum(individual_times) / len(individual_times),
             "document_processing_time": doc_processing_time,
             "embedding_warmup_time": embedding_warmup_time,
-            "transformation_enabled": request.enable_query_transformation if request.enable_query_transformation is not None else settings.enable_query_transformation,
-            "embedding_provider": settings.embedding_provider,
+            "embedding_provider": embedding_provider,
             "embedding_dimension": rag_responses[0].pipeline_stats.get("model_info", {}).get("embedding_dimension", "unknown") if rag_responses else "unknown"
         }
         
         # End question logging session
         try:
+            # Sum the top-3 similarity scores of every response in one vectorized pass
+            top_similarity_scores = np.concatenate(
+                [resp.similarity_scores for resp in rag_responses]
+            ) if rag_responses else np.zeros(0, dtype=np.float32)
+            total_sources = sum(len(resp.sources_used) for resp in rag_responses)
+            
             session_end_metadata = {
                 **session_metadata,
                 "processing_summary": processing_summary,
-                "questions_with_transformation": transformations_successful,
                 "parallel_speedup": f"{parallel_speedup:.2f}x" if parallel_speedup > 1 else "1.0x",
-                "average_similarity_score": sum(sum(scores) for scores in [
-                    [source.get('similarity_score', 0.0) for source in resp.sources_used[:3]] 
-                    for resp in rag_responses
-                ]) / max(sum(len(resp.sources_used) for resp in rag_responses), 1)
+                "average_similarity_score": float(top_similarity_scores.sum()) / max(total_sources, 1)
             }
             
             question_logger.end_session(
@@ -322,12 +323,18 @@ async def get_system_stats(token: str = Depends(verify_token)):
     """Debug endpoint to inspect system statistics"""
     try:
         rag_coordinator = get_rag_coordinator()
-        stats = rag_coordinator.get_system_stats()
+        
+        # health_check already collects the system stats, so it runs once and its stats
+        # are reused. It reads cache and vector store structures that request handlers
+        # mutate, so it stays on the event loop; its only I/O is a few stat() calls
+        health = rag_coordinator.health_check()
+        if "system_stats" not in health:
+            raise RuntimeError(health.get("error", "health check failed"))
         
         return {
             "system_status": "operational",
-            "statistics": stats,
-            "health": rag_coordinator.health_check()
+            "statistics": health["system_stats"],
+            "health": health
         }
         
     except Exception as e:
@@ -345,11 +352,7 @@ async def list_documents(token: str = Depends(verify_token)):
         rag_coordinator = get_rag_coordinator()
         vector_store = rag_coordinator.vector_store
         
-        documents = []
-        for doc_id in vector_store.documents.keys():
-            doc_info = vector_store.get_document_info(doc_id)
-            if doc_info:
-                documents.append(doc_info)
+        documents = vector_store.list_documents()
         
         return {
             "total_documents": len(documents),
@@ -369,11 +372,11 @@ async def get_directory_info(token: str = Depends(verify_token)):
     try:
         directory_manager = get_directory_manager()
         
-        # Get comprehensive directory information
-        dir_info = directory_manager.get_directory_info()
-        
-        # Validate all directories
-        all_valid = directory_manager.validate_directories()
+        # Gather directory information and validate all directories concurrently
+        dir_info, all_valid = await asyncio.gather(
+            directory_manager.get_directory_info_async(),
+            asyncio.to_thread(directory_manager.validate_directories)
+        )
         
         return {
             "status": "healthy" if all_valid else "degraded",
@@ -483,7 +486,6 @@ async def get_uploaded_file_info(
                 detail=f"Uploaded file not found: {file_id}"
             )
         
-        from datetime import datetime
         current_time = datetime.now()
         
         return FileInfoResponse(
@@ -566,9 +568,10 @@ async def get_cache_statistics(token: str = Depends(verify_token)):
         rag_coordinator = get_rag_coordinator()
         persistent_cache = get_persistent_cache_manager()
         
-        # Get stats from all cache layers
+        # In-memory stats are cheap and read structures that request handlers mutate,
+        # so they are taken on the event loop; only the disk walk goes to a thread
         in_memory_stats = rag_coordinator.cache_manager.get_cache_stats()
-        persistent_stats = persistent_cache.get_cache_stats()
+        persistent_stats = await asyncio.to_thread(persistent_cache.get_cache_stats)
         
         return {
             "cache_overview": {
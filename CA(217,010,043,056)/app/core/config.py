@@ -1,6 +1,7 @@
 """
 Application configuration
 """
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -22,6 +23,7 @@ class Settings(BaseSettings):
     temp_dir: Optional[str] = None
     save_parsed_text: bool = True  # Save parsed text to files for validation
     parsed_text_dir: str = "parsed_documents"
+    return_page_texts: bool = False  # Keep a labelled copy of every PDF page's text (debugging; doubles text memory)
     
     # PDF Blob Storage
     save_pdf_blobs: bool = True  # Save PDF files in blob format for caching
@@ -56,7 +58,9 @@ class Settings(BaseSettings):
     table_confidence: float = 0.7  # Table detection confidence threshold
     use_gpu_ocr: bool = True  # GPU OCR acceleration (not applicable for Tesseract)
     parallel_pages: bool = True  # Process pages in parallel when possible
+    parallel_pdf_pages: bool = False  # Extract PDF pages in a process pool (worker startup cost; best for large/OCR-heavy PDFs)
     ocr_provider: str = "rapidocr"  # Options: "tesseract", "paddleocr", "rapidocr"
+    ocr_workers: int = 4  # Threads sharing the OCR engine when a document has several OCR pages
     
     
     table_extraction_method: str = "pdfplumber"  # Primary method for table extraction
@@ -96,6 +100,12 @@ class Settings(BaseSettings):
     enable_embedding_cache: bool = True  # Cache embeddings for repeated chunks
     enable_reranker_cache: bool = True  # Cache reranker scores
     enable_answer_cache: bool = True  # Cache complete answers for semantic search documents only
+    enable_translation_cache: bool = True  # Cache chunk translations in memory and on disk
+    query_cache_max_size: int = 1024  # Max query results kept in memory (LRU eviction)
+    embedding_cache_max_size: int = 50000  # Max chunk embeddings kept in memory (LRU eviction)
+    query_embedding_cache_max_size: int = 2000  # Max query embeddings kept in memory (LRU eviction)
+    reranker_cache_max_size: int = 600  # Max reranker score lists kept in memory (LRU eviction)
+    answer_cache_max_size: int = 500  # Max complete answers kept in memory (LRU eviction)
     max_concurrent_requests: int = 4  # Limit concurrent API calls
     max_concurrent_questions: int = 2  # Max questions to process in parallel
     api_timeout_seconds: int = 50  # Balanced timeout for comprehensive responses
@@ -114,6 +124,9 @@ class Settings(BaseSettings):
     openai_api_key: str = ""  # Set via environment variable OPENAI_API_KEY
     llm_max_tokens: int = 2048  # Increased for comprehensive document analysis with metadata
     llm_temperature: float = 0.2  # Lower temperature for more factual, precise responses
+    translation_chunk_chars: int = 2000  # Max characters per translation request (split on paragraphs)
+    translation_concurrency: int = 4  # Max concurrent translation requests per document
+    translation_min_script_ratio: float = 0.15  # Only translate when this share of letters is non-Latin script
     
     # Performance optimizations
     performance_mode: bool = False  # Enable performance optimizations
@@ -124,5 +137,16 @@ class Settings(BaseSettings):
     class Config:   
         env_file = ".env"
         case_sensitive = False
+        frozen = True  # Settings are read-only once loaded
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the application settings, validated once per process"""
+    return Settings()
+
+settings = get_settings()
+
+# Hot-path values frozen at import time (plain module globals, no model attribute access)
+BEARER_TOKEN = settings.bearer_token
+CHUNK_SIZE = settings.chunk_size
+K_RETRIEVE = settings.k_retrieve
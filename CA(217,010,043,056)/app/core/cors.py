@@ -0,0 +1,40 @@
+"""
+CORS middleware with cached preflight responses
+"""
+from starlette.datastructures import Headers
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response
+
+# Upper bound on distinct (origin, method, headers) preflight combinations kept in memory
+PREFLIGHT_CACHE_SIZE = 256
+
+
+class CachedPreflightCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware that reuses preflight responses
+    
+    The CORS configuration never changes at runtime, so the response to a
+    preflight request depends only on its Origin, Access-Control-Request-Method
+    and Access-Control-Request-Headers values. Responses are built once per
+    combination and served from memory afterwards.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._preflight_cache: dict = {}
+    
+    def preflight_response(self, request_headers: Headers) -> Response:
+        key = (
+            request_headers.get("origin"),
+            request_headers.get("access-control-request-method"),
+            request_headers.get("access-control-request-headers"),
+        )
+        
+        response = self._preflight_cache.get(key)
+        if response is None:
+            response = super().preflight_response(request_headers=request_headers)
+            if len(self._preflight_cache) >= PREFLIGHT_CACHE_SIZE:
+                self._preflight_cache.clear()
+            self._preflight_cache[key] = response
+        
+        return response
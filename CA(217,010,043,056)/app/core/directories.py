@@ -1,7 +1,10 @@
 """
 Directory management utilities for the RAG application
 """
+import asyncio
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import logging
@@ -10,6 +13,15 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# open() flags that fail with ENOTDIR unless the path is a directory (O_DIRECTORY is POSIX-only)
+_DIR_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)
+
+# Permission checks can be made relative to an open directory fd where faccessat() is available
+_ACCESS_SUPPORTS_DIR_FD = os.access in os.supports_dir_fd
+
+# Directories already created (and, for required directories, verified writable) in this process
+_ensured_directories = set()
+
 
 class DirectoryManager:
     """Manages creation and validation of required directories"""
@@ -29,26 +41,30 @@ class DirectoryManager:
         Create all required directories if they don't exist
         
         This method creates directories with proper permissions and
-        handles nested directory creation automatically.
+        handles nested directory creation automatically. Directories are
+        created concurrently, and directories already ensured in this
+        process are skipped without touching the filesystem.
         """
+        pending_dirs = [d for d in self.required_directories if d not in _ensured_directories]
+        if not pending_dirs:
+            return
+        
         created_dirs = []
         failed_dirs = []
+        # Resolve relative paths against one getcwd() instead of one per directory
+        cwd = os.getcwd()
         
-        for dir_path in self.required_directories:
-            try:
-                path = Path(dir_path)
-                
-                # Create directory with parents if needed
-                path.mkdir(parents=True, exist_ok=True)
-                
-                # Verify directory is writable
-                if not os.access(path, os.W_OK):
-                    logger.warning(f"Directory {dir_path} exists but is not writable")
-                else:
-                    created_dirs.append(str(path.absolute()))
-                    
-            except Exception as e:
-                logger.error(f"Failed to create directory {dir_path}: {str(e)}")
+        with ThreadPoolExecutor(max_workers=len(pending_dirs)) as executor:
+            results = list(executor.map(self._ensure_one, pending_dirs))
+        
+        for dir_path, (status, detail) in zip(pending_dirs, results):
+            if status == "ok":
+                created_dirs.append(dir_path if os.path.isabs(dir_path) else os.path.join(cwd, dir_path))
+                _ensured_directories.add(dir_path)
+            elif status == "not_writable":
+                logger.warning(f"Directory {dir_path} exists but is not writable")
+            else:
+                logger.error(f"Failed to create directory {dir_path}: {detail}")
                 failed_dirs.append(dir_path)
         
         # Log results
@@ -63,6 +79,31 @@ class DirectoryManager:
                 logger.error(f"  ✗ {dir_path}")
             raise RuntimeError(f"Failed to create required directories: {failed_dirs}")
     
+    def _ensure_one(self, dir_path: str) -> tuple:
+        """
+        Create one directory (with parents) and check it is writable
+        
+        Args:
+            dir_path: Directory path to create
+            
+        Returns:
+            Tuple of (status, detail) - ("ok", None), ("not_writable", None)
+            or ("failed", error message)
+        """
+        try:
+            path = Path(dir_path)
+            
+            # Create directory with parents if needed
+            path.mkdir(parents=True, exist_ok=True)
+            
+            # Verify directory is writable
+            if not os.access(path, os.W_OK):
+                return "not_writable", None
+            return "ok", None
+            
+        except Exception as e:
+            return "failed", str(e)
+    
     def create_directory(self, path: str, description: Optional[str] = None) -> Path:
         """
         Create a single directory with error handling
@@ -77,12 +118,17 @@ class DirectoryManager:
         Raises:
             RuntimeError: If directory creation fails
         """
+        # Already created in this process - skip the mkdir syscalls
+        if path in _ensured_directories:
+            return Path(path)
+        
         try:
             dir_path = Path(path)
             dir_path.mkdir(parents=True, exist_ok=True)
+            _ensured_directories.add(path)
             
             if description:
-                logger.info(f"Created directory for {description}: {dir_path.absolute()}")
+                logger.info(f"Created directory for {description}: {os.path.abspath(path)}")
             
             return dir_path
             
@@ -105,15 +151,23 @@ class DirectoryManager:
         all_valid = True
         
         for dir_path in self.required_directories:
-            path = Path(dir_path)
+            # Known-good directories only need the permission check
+            if dir_path in _ensured_directories:
+                if os.access(dir_path, os.R_OK | os.W_OK):
+                    logger.debug(f"Directory validated: {dir_path}")
+                    continue
+                # Changed since it was verified - fall back to the full checks
+                _ensured_directories.discard(dir_path)
+            
+            status = self._check_directory(dir_path)
             
-            if not path.exists():
+            if status == "missing":
                 logger.error(f"Required directory does not exist: {dir_path}")
                 all_valid = False
-            elif not path.is_dir():
+            elif status == "not_directory":
                 logger.error(f"Path exists but is not a directory: {dir_path}")
                 all_valid = False
-            elif not os.access(path, os.R_OK | os.W_OK):
+            elif status == "no_access":
                 logger.error(f"Directory exists but is not readable/writable: {dir_path}")
                 all_valid = False
             else:
@@ -121,51 +175,175 @@ class DirectoryManager:
         
         return all_valid
     
+    def _check_directory(self, dir_path: str) -> str:
+        """
+        Check that a path is an accessible directory with one path lookup
+        
+        The path is opened once with O_DIRECTORY, which fails unless it is a
+        directory; the type and permission checks then run against the open
+        descriptor instead of resolving the path again.
+        
+        Args:
+            dir_path: Directory path to check
+            
+        Returns:
+            "ok", "missing", "not_directory" or "no_access"
+        """
+        try:
+            fd = os.open(dir_path, _DIR_OPEN_FLAGS)
+        except NotADirectoryError:
+            return "not_directory"
+        except PermissionError:
+            return "no_access"
+        except OSError:
+            return "missing"
+        
+        try:
+            if not stat.S_ISDIR(os.fstat(fd).st_mode):
+                return "not_directory"
+            
+            if _ACCESS_SUPPORTS_DIR_FD:
+                accessible = os.access(".", os.R_OK | os.W_OK, dir_fd=fd)
+            else:
+                accessible = os.access(dir_path, os.R_OK | os.W_OK)
+            return "ok" if accessible else "no_access"
+        finally:
+            os.close(fd)
+    
     def get_directory_info(self) -> dict:
         """
         Get information about all managed directories
         
+        Returns:
+            Dictionary with directory information
+        """
+        return self._summarize_directory_info(
+            [self._get_single_directory_info(dir_path) for dir_path in self.required_directories]
+        )
+    
+    async def get_directory_info_async(self) -> dict:
+        """
+        Get information about all managed directories, scanning them concurrently
+        
+        Each directory walk runs in a worker thread so the stat() calls of
+        independent trees overlap instead of running one after another.
+        
+        Returns:
+            Dictionary with directory information
+        """
+        dir_infos = await asyncio.gather(*[
+            asyncio.to_thread(self._get_single_directory_info, dir_path)
+            for dir_path in self.required_directories
+        ])
+        return self._summarize_directory_info(dir_infos)
+    
+    def _get_single_directory_info(self, dir_path: str) -> dict:
+        """
+        Collect status, size and file count for one managed directory
+        
+        Args:
+            dir_path: Directory path to inspect
+            
+        Returns:
+            Dictionary with directory information
+        """
+        # One stat() answers both "exists" and "is a directory"
+        try:
+            st = os.stat(dir_path)
+        except OSError:
+            st = None
+        exists = st is not None
+        is_directory = exists and stat.S_ISDIR(st.st_mode)
+        
+        dir_info = {
+            "path": os.path.abspath(dir_path),
+            "exists": exists,
+            "is_directory": is_directory,
+            "readable": os.access(dir_path, os.R_OK) if exists else False,
+            "writable": os.access(dir_path, os.W_OK) if exists else False,
+            "size_mb": 0,
+            "disk_usage_mb": 0,
+            "file_count": 0
+        }
+        
+        if is_directory:
+            try:
+                # Calculate directory size and file count
+                total_size, disk_usage, file_count = self._scan_tree(dir_path)
+                
+                dir_info["size_mb"] = round(total_size / (1024 * 1024), 2)
+                dir_info["disk_usage_mb"] = round(disk_usage / (1024 * 1024), 2)
+                dir_info["file_count"] = file_count
+                
+            except Exception as e:
+                logger.warning(f"Could not calculate size for {dir_path}: {str(e)}")
+        
+        return dir_info
+    
+    def _scan_tree(self, root: str) -> tuple:
+        """
+        Sum file sizes and disk usage and count files below a directory
+        
+        Uses os.scandir so entry types come from the directory listing itself and
+        each file costs a single stat() call, instead of the several per entry
+        that Path.rglob + is_file() + stat() issue. Disk usage is taken from
+        st_blocks (like du), so sparse files and block rounding are accounted for.
+        
+        Args:
+            root: Directory to scan
+            
+        Returns:
+            Tuple of (total size in bytes, disk usage in bytes, file count)
+        """
+        total_size = 0
+        disk_usage = 0
+        file_count = 0
+        pending = [root]
+        
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                st = entry.stat(follow_symlinks=False)
+                                total_size += st.st_size
+                                # st_blocks is not available on Windows - fall back to the apparent size
+                                blocks = getattr(st, "st_blocks", None)
+                                disk_usage += blocks * 512 if blocks is not None else st.st_size
+                                file_count += 1
+                        except OSError:
+                            # Entry vanished or is unreadable - skip it
+                            pass
+            except OSError:
+                # Directory vanished or is unreadable - skip it and keep counting the rest
+                continue
+        
+        return total_size, disk_usage, file_count
+    
+    def _summarize_directory_info(self, dir_infos: list) -> dict:
+        """
+        Combine per-directory information into the overall directory report
+        
+        Args:
+            dir_infos: Directory information in the order of required_directories
+            
         Returns:
             Dictionary with directory information
         """
         info = {
             "directories": {},
             "total_size_mb": 0,
+            "total_disk_usage_mb": 0,
             "status": "healthy"
         }
         
-        for dir_path in self.required_directories:
-            path = Path(dir_path)
-            
-            dir_info = {
-                "path": str(path.absolute()),
-                "exists": path.exists(),
-                "is_directory": path.is_dir() if path.exists() else False,
-                "readable": os.access(path, os.R_OK) if path.exists() else False,
-                "writable": os.access(path, os.W_OK) if path.exists() else False,
-                "size_mb": 0,
-                "file_count": 0
-            }
-            
-            if path.exists() and path.is_dir():
-                try:
-                    # Calculate directory size and file count
-                    total_size = 0
-                    file_count = 0
-                    
-                    for item in path.rglob("*"):
-                        if item.is_file():
-                            total_size += item.stat().st_size
-                            file_count += 1
-                    
-                    dir_info["size_mb"] = round(total_size / (1024 * 1024), 2)
-                    dir_info["file_count"] = file_count
-                    info["total_size_mb"] += dir_info["size_mb"]
-                    
-                except Exception as e:
-                    logger.warning(f"Could not calculate size for {dir_path}: {str(e)}")
-            
+        for dir_path, dir_info in zip(self.required_directories, dir_infos):
             info["directories"][dir_path] = dir_info
+            info["total_size_mb"] += dir_info["size_mb"]
+            info["total_disk_usage_mb"] += dir_info["disk_usage_mb"]
             
             # Update overall status
             if not (dir_info["exists"] and dir_info["is_directory"] and 
@@ -173,27 +351,23 @@ class DirectoryManager:
                 info["status"] = "degraded"
         
         info["total_size_mb"] = round(info["total_size_mb"], 2)
+        info["total_disk_usage_mb"] = round(info["total_disk_usage_mb"], 2)
         return info
 
 
-# Singleton instance
-_directory_manager = None
+# Singleton instance, created eagerly at import (construction only reads settings)
+directory_manager = DirectoryManager()
 
 def get_directory_manager() -> DirectoryManager:
     """Get singleton directory manager instance"""
-    global _directory_manager
-    if _directory_manager is None:
-        _directory_manager = DirectoryManager()
-    return _directory_manager
+    return directory_manager
 
 
 def ensure_directories() -> None:
     """Convenience function to ensure all directories exist"""
-    directory_manager = get_directory_manager()
     directory_manager.ensure_directories_exist()
 
 
 def create_directory(path: str, description: Optional[str] = None) -> Path:
     """Convenience function to create a single directory"""
-    directory_manager = get_directory_manager()
     return directory_manager.create_directory(path, description)
\ No newline at end of file
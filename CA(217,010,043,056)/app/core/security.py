@@ -1,20 +1,22 @@
 """
 Security and authentication utilities
 """
-from fastapi import HTTPException, Security
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+import hmac
 
-from app.core.config import settings
+from fastapi import HTTPException, Request
 
-# Security scheme
-security = HTTPBearer()
+from app.core.config import BEARER_TOKEN
 
-async def verify_token(credentials: HTTPAuthorizationCredentials = Security(security)) -> str:
+# Expected Authorization header as bytes, built once for constant-time comparison
+_EXPECTED_AUTHORIZATION = b"Bearer " + BEARER_TOKEN.encode("utf-8")
+
+async def verify_token(request: Request) -> str:
     """Verify bearer token authentication"""
-    if credentials.credentials != settings.bearer_token:
+    authorization = request.headers.get("authorization", "")
+    if not hmac.compare_digest(authorization.encode("utf-8"), _EXPECTED_AUTHORIZATION):
         raise HTTPException(
-            status_code=401, 
+            status_code=401,
             detail="Invalid authentication token",
             headers={"WWW-Authenticate": "Bearer"}
         )
-    return credentials.credentials
\ No newline at end of file
+    return BEARER_TOKEN
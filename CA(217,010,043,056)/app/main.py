@@ -1,27 +1,40 @@
 """
 Main FastAPI application
 """
+import asyncio
 import logging
 import sys
 import os
-from contextlib import contextmanager
+from contextlib import asynccontextmanager, contextmanager
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
-from app.api.routes import router
 from app.core.config import settings
+from app.core.cors import CachedPreflightCORSMiddleware
 from app.core.directories import ensure_directories
 
+# /dev/null opened once for fd-level stdout redirection
+_devnull_fd = None
+
+def _get_devnull_fd() -> int:
+    """Open /dev/null for writing once and reuse the descriptor"""
+    global _devnull_fd
+    if _devnull_fd is None:
+        _devnull_fd = os.open(os.devnull, os.O_WRONLY)
+    return _devnull_fd
+
 @contextmanager
 def suppress_stdout():
-    """Context manager to suppress stdout"""
-    with open(os.devnull, "w") as devnull:
-        old_stdout = sys.stdout
-        sys.stdout = devnull
-        try:
-            yield
-        finally:
-            sys.stdout = old_stdout
+    """Context manager to suppress stdout, including output written by C extensions"""
+    sys.stdout.flush()
+    saved_fd = os.dup(1)
+    os.dup2(_get_devnull_fd(), 1)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        os.dup2(saved_fd, 1)
+        os.close(saved_fd)
 
 def configure_logging():
     """Configure logging levels based on debug_mode"""
@@ -41,12 +54,36 @@ def configure_logging():
         logging.getLogger("httpx").setLevel(logging.WARNING)
         logging.getLogger("httpcore").setLevel(logging.WARNING)
         
-        # Suppress ALL stdout (print statements) globally when not in debug mode
-        sys.stdout = open(os.devnull, "w")
+        # Suppress ALL stdout globally when not in debug mode. Redirecting fd 1 also
+        # silences native libraries (torch, faiss, OCR engines) that bypass sys.stdout;
+        # stderr stays attached so errors and tracebacks remain visible.
+        sys.stdout.flush()
+        os.dup2(_get_devnull_fd(), 1)
     else:
         # Enable detailed logging for debug mode
         logging.getLogger().setLevel(logging.DEBUG)
 
+def warm_embedding_model():
+    """Load the embedding model once so the first request does not pay for it"""
+    from app.services.rag_coordinator import get_rag_coordinator
+    
+    if not get_rag_coordinator().embedding_manager.ensure_model_ready():
+        logging.getLogger(__name__).warning("Embedding model could not be pre-warmed - it will load on first use")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application startup/shutdown hooks"""
+    # Keep model loading off the event loop and off the request path
+    await asyncio.to_thread(warm_embedding_model)
+    yield
+    
+    # Release pooled LLM and download connections
+    from app.services.copilot_provider import close_http_client
+    from app.services.document_processor import close_http_session, shutdown_page_executor
+    await close_http_client()
+    await close_http_session()
+    shutdown_page_executor()
+
 def create_application() -> FastAPI:
     """Create and configure FastAPI application"""
     
@@ -66,29 +103,38 @@ def create_application() -> FastAPI:
         debug=settings.debug,
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
-    # Add CORS middleware
+    # Add CORS middleware (preflight responses are cached - the config is static)
     app.add_middleware(
-        CORSMiddleware,
+        CachedPreflightCORSMiddleware,
         allow_origins=["*"],  # Configure properly for production
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
     
-    # Include API routes
+    # Include API routes - imported here so the heavy service stack (torch, faiss,
+    # sentence-transformers) only loads when an application is actually built
+    from app.api.routes import router
+    from app.services.cache_manager import RequestClockMiddleware
     app.include_router(router)
     
+    # Read the cache clock once per request instead of on every cache probe
+    app.add_middleware(RequestClockMiddleware)
+    
     return app
 
-# Create the application instance
-app = create_application()
+# The application is built by uvicorn through the factory (app.main:create_application)
+# so importing this module does not load the service stack
 
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_application",
+        factory=True,
         host=settings.host,
         port=settings.port,
         reload=settings.debug_mode,  # Use debug_mode instead of debug
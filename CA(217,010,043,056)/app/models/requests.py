@@ -1,10 +1,51 @@
 """
 Request/Response models for the API
 """
+from dataclasses import dataclass
+from functools import lru_cache
 from pydantic import BaseModel, HttpUrl, field_validator
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+@lru_cache(maxsize=2048)
+def _validate_http_url(url: str) -> str:
+    """Validate an HTTP document URL; valid URLs are cached so repeats skip parsing"""
+    HttpUrl(url)
+    return url
+
+_QUERY_REQUEST_SCHEMA_EXTRA = {
+    "example": {
+        "documents": "https://example.com/document.pdf",
+        "questions": [
+            "What are the key requirements mentioned?",
+            "What are the specified limits or constraints?"
+        ]
+    },
+    "examples": {
+        "http_url": {
+            "summary": "HTTP URL Example",
+            "value": {
+                "documents": "https://example.com/document.pdf",
+                "questions": ["What is covered?", "What are the limits?"]
+            }
+        },
+        "local_file": {
+            "summary": "Local File Example", 
+            "value": {
+                "documents": "file:///absolute/path/to/document.pdf",
+                "questions": ["What is covered?", "What are the limits?"]
+            }
+        },
+        "uploaded_file": {
+            "summary": "Uploaded File Example",
+            "value": {
+                "documents": "upload://abc123def456ghi789",
+                "questions": ["What is covered?", "What are the limits?"]
+            }
+        }
+    }
+}
+
 class QueryRequest(BaseModel):
     """Request model for document query processing"""
     documents: str  # Accept HTTP URLs, file:// paths, or upload file IDs
@@ -14,64 +55,91 @@ class QueryRequest(BaseModel):
     @classmethod
     def validate_documents(cls, v: str) -> str:
         """Validate that documents is either a valid URL, file path, or upload file ID"""
-        if v.startswith('file://'):
+        # Dispatch on the first character so the common HTTP case skips both prefix checks
+        c0 = v[:1]
+        if c0 == 'f' and v[:7] == 'file://':
             # For file:// URLs, just ensure the path exists and is readable
-            file_path = v[7:]  # Remove 'file://' prefix
-            if not file_path:
+            if not v[7:]:
                 raise ValueError('file:// URL must specify a path')
             return v
-        elif v.startswith('upload://'):
+        elif c0 == 'u' and v[:9] == 'upload://':
             # For upload file IDs, validate format
-            file_id = v[9:]  # Remove 'upload://' prefix
+            file_id = v[9:]
             if not file_id or len(file_id) < 10:
                 raise ValueError('upload:// URL must specify a valid file ID')
             return v
         else:
-            # For HTTP URLs, validate using HttpUrl
+            # For HTTP URLs, validate using HttpUrl (cached for repeated URLs)
             try:
-                HttpUrl(v)
-                return v
+                return _validate_http_url(v)
             except Exception:
                 raise ValueError('documents must be a valid HTTP URL, file:// path, or upload:// file ID')
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "documents": "https://example.com/document.pdf",
-                "questions": [
-                    "What are the key requirements mentioned?",
-                    "What are the specified limits or constraints?"
-                ]
-            },
-            "examples": {
-                "http_url": {
-                    "summary": "HTTP URL Example",
-                    "value": {
-                        "documents": "https://example.com/document.pdf",
-                        "questions": ["What is covered?", "What are the limits?"]
-                    }
-                },
-                "local_file": {
-                    "summary": "Local File Example", 
-                    "value": {
-                        "documents": "file:///absolute/path/to/document.pdf",
-                        "questions": ["What is covered?", "What are the limits?"]
-                    }
-                },
-                "uploaded_file": {
-                    "summary": "Uploaded File Example",
-                    "value": {
-                        "documents": "upload://abc123def456ghi789",
-                        "questions": ["What is covered?", "What are the limits?"]
-                    }
-                }
-            }
-        }
+        json_schema_extra = _QUERY_REQUEST_SCHEMA_EXTRA
 
 class SimpleQueryResponse(BaseModel):
     """Simple response model with just answers"""
     answers: List[str]
 
+_QUERY_RESPONSE_SCHEMA_EXTRA = {
+    "example": {
+        "answers": [
+            "The submission deadline is 30 days from notification.",
+            "The maximum limit is $100,000 per request."
+        ],
+        "sources": [
+            [
+                {
+                    "number": 1,
+                    "doc_id": "abc123",
+                    "page": 5,
+                    "heading": "Submission Requirements",
+                    "section": "2.1",
+                    "similarity_score": 0.92,
+                    "text_preview": "Deadline provisions...",
+                    "chunk_type": "text"
+                }
+            ],
+            [
+                {
+                    "number": 1,
+                    "doc_id": "abc123",
+                    "page": 12,
+                    "heading": "Specifications",
+                    "section": "4.3",
+                    "similarity_score": 0.89,
+                    "text_preview": "Maximum amounts allowed...",
+                    "chunk_type": "table"
+                }
+            ]
+        ],
+        "query_transformations": [
+            {
+                "original_query": "What is the grace period?",
+                "transformation_successful": False,
+                "sub_queries": ["What is the grace period?"]
+            },
+            {
+                "original_query": "Compare coverage and limits",
+                "transformation_successful": True,
+                "sub_queries": [
+                    "What coverage is provided?",
+                    "What are the coverage limits?"
+                ]
+            }
+        ],
+        "processing_summary": {
+            "total_questions": 2,
+            "questions_with_transformation": 1,
+            "parallel_processing_time": 1.5,
+            "average_time_per_question": 0.75,
+            "embedding_provider": "bge-m3",
+            "embedding_dimension": 1024
+        }
+    }
+}
+
 class QueryResponse(BaseModel):
     """Response model for document query processing with transformation metadata"""
     answers: List[str]
@@ -80,80 +148,42 @@ class QueryResponse(BaseModel):
     processing_summary: Optional[Dict[str, Any]] = None  # Overall processing statistics
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "answers": [
-                    "The submission deadline is 30 days from notification.",
-                    "The maximum limit is $100,000 per request."
-                ],
-                "sources": [
-                    [
-                        {
-                            "number": 1,
-                            "doc_id": "abc123",
-                            "page": 5,
-                            "heading": "Submission Requirements",
-                            "section": "2.1",
-                            "similarity_score": 0.92,
-                            "text_preview": "Deadline provisions...",
-                            "chunk_type": "text"
-                        }
-                    ],
-                    [
-                        {
-                            "number": 1,
-                            "doc_id": "abc123",
-                            "page": 12,
-                            "heading": "Specifications",
-                            "section": "4.3",
-                            "similarity_score": 0.89,
-                            "text_preview": "Maximum amounts allowed...",
-                            "chunk_type": "table"
-                        }
-                    ]
-                ],
-                "query_transformations": [
-                    {
-                        "original_query": "What is the grace period?",
-                        "transformation_successful": False,
-                        "sub_queries": ["What is the grace period?"]
-                    },
-                    {
-                        "original_query": "Compare coverage and limits",
-                        "transformation_successful": True,
-                        "sub_queries": [
-                            "What coverage is provided?",
-                            "What are the coverage limits?"
-                        ]
-                    }
-                ],
-                "processing_summary": {
-                    "total_questions": 2,
-                    "questions_with_transformation": 1,
-                    "parallel_processing_time": 1.5,
-                    "average_time_per_question": 0.75,
-                    "embedding_provider": "bge-m3",
-                    "embedding_dimension": 1024
-                }
-            }
-        }
+        json_schema_extra = _QUERY_RESPONSE_SCHEMA_EXTRA
+
+# Lightweight models that need no validation are plain slotted dataclasses
+# (FastAPI still accepts HealthResponse as a response_model)
 
-class DocumentContent(BaseModel):
+@dataclass(slots=True)
+class DocumentContent:
     """Internal model for processed document content"""
     text: str
     pages: int
     metadata: Dict[str, Any]
     
-class HealthResponse(BaseModel):
+@dataclass(slots=True)
+class HealthResponse:
     """Health check response model"""
     status: str
     service: str
     
-class ErrorResponse(BaseModel):
+@dataclass(slots=True)
+class ErrorResponse:
     """Error response model"""
     detail: str
 
 
+_UPLOAD_RESPONSE_SCHEMA_EXTRA = {
+    "example": {
+        "file_id": "abc123def456ghi789",
+        "original_filename": "sample_document.pdf",
+        "file_size": 2048576,
+        "content_type": "application/pdf",
+        "uploaded_at": "2025-01-15T10:30:00",
+        "expires_at": "2025-01-16T10:30:00",
+        "upload_url": "upload://abc123def456ghi789"
+    }
+}
+
 class UploadResponse(BaseModel):
     """Response model for file upload"""
     file_id: str
@@ -165,33 +195,25 @@ class UploadResponse(BaseModel):
     upload_url: str  # The upload:// URL to use in queries
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "file_id": "abc123def456ghi789",
-                "original_filename": "sample_document.pdf",
-                "file_size": 2048576,
-                "content_type": "application/pdf",
-                "uploaded_at": "2025-01-15T10:30:00",
-                "expires_at": "2025-01-16T10:30:00",
-                "upload_url": "upload://abc123def456ghi789"
-            }
-        }
+        json_schema_extra = _UPLOAD_RESPONSE_SCHEMA_EXTRA
+
 
+_UPLOAD_REQUEST_SCHEMA_EXTRA = {
+    "example": {
+        "questions": [
+            "What are the submission deadlines?",
+            "What are the specified limits?",
+            "What conditions are excluded?"
+        ]
+    }
+}
 
 class UploadRequest(BaseModel):
     """Request model for file upload with immediate processing"""
     questions: List[str]
     
     class Config:
-        json_schema_extra = {
-            "example": {
-                "questions": [
-                    "What are the submission deadlines?",
-                    "What are the specified limits?",
-                    "What conditions are excluded?"
-                ]
-            }
-        }
+        json_schema_extra = _UPLOAD_REQUEST_SCHEMA_EXTRA
 
 
 class FileInfoResponse(BaseModel):
@@ -1,37 +1,130 @@
 """
 Performance-optimized cache manager for RAG system
 """
-import hashlib
-import json
+import heapq
+import logging
+import sys
 import time
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+import xxhash
 from app.core.config import settings
 from app.utils.debug import conditional_print
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Approximate per-entry bookkeeping bytes (CacheEntry + dict slot + heap record)
+_ENTRY_OVERHEAD = 64
+
+# Cache-clock deciseconds between expiry sweeps over every shard of a sharded cache
+_SHARD_SWEEP_INTERVAL = 6000  # 10 minutes
+
+
+# Cache clock: integer deciseconds of time.monotonic(), frozen once per HTTP request
+# by RequestClockMiddleware so every cache probe in a request shares one clock read
+_request_clock: ContextVar[int] = ContextVar("_request_clock", default=0)
+
+
+def _now() -> int:
+    """Current cache clock in deciseconds (the request's frozen tick when set)"""
+    return _request_clock.get() or int(time.monotonic() * 10)
+
+
+class RequestClockMiddleware:
+    """ASGI middleware that reads the cache clock once per HTTP request"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        token = _request_clock.set(int(time.monotonic() * 10))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_clock.reset(token)
+
+
+@lru_cache(maxsize=4096)
+def _norm(question: str) -> str:
+    """Normalize a question for cache keys (memoized - equal questions share one normalized string)"""
+    return question.lower().strip()
+
+
+@dataclass(slots=True)
 class CacheEntry:
-    """Cache entry with TTL"""
+    """Cache entry with TTL (timestamp and ttl in cache-clock deciseconds)"""
     value: Any
-    timestamp: float
-    ttl: float
+    timestamp: int
+    ttl: int
+    referenced: bool = False  # CLOCK reference bit (second-chance eviction caches only)
+    size: int = 0  # Approximate bytes held by this entry (see _entry_size)
+
+
+class _CacheShard:
+    """One document's partition of a sharded cache - LRU entries plus their expiry heap"""
+    __slots__ = ("entries", "heap")
+    
+    def __init__(self):
+        self.entries: OrderedDict = OrderedDict()
+        self.heap: List[Tuple[int, Any]] = []
+
+
+class _ShardedCache:
+    """A cache partitioned by doc_id under one global entry budget"""
+    __slots__ = ("shards", "size", "next_sweep")
     
-    def is_expired(self) -> bool:
-        """Check if cache entry is expired"""
-        return time.time() - self.timestamp > self.ttl
+    def __init__(self):
+        self.shards: OrderedDict[str, _CacheShard] = OrderedDict()  # Least recently used document first
+        self.size = 0  # Entries across all shards
+        self.next_sweep = 0  # Cache-clock time of the next expiry sweep over all shards
 
 
 class CacheManager:
-    """High-performance in-memory cache manager"""
+    """
+    High-performance in-memory cache manager
+    
+    Only the reranker score cache is on the live path (EnhancedAnswerGenerator).
+    Query results, embeddings, query embeddings and answers for the RAG pipeline
+    are cached by HighPerformanceCacheManager in lru_cache_manager.py; the
+    equivalent caches here have no callers in the request flow.
+    """
     
     def __init__(self):
         """Initialize cache manager"""
-        self.query_cache: Dict[str, CacheEntry] = {}
-        self.embedding_cache: Dict[str, CacheEntry] = {}
-        self.query_embedding_cache: Dict[str, CacheEntry] = {}  # Cache for query embeddings specifically
-        self.reranker_cache: Dict[str, CacheEntry] = {}
-        self.answer_cache: Dict[str, CacheEntry] = {}
+        # Bounded LRU caches - least recently used entries are evicted once max size is reached
+        self.embedding_cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.query_embedding_cache: OrderedDict[str, CacheEntry] = OrderedDict()  # Cache for query embeddings specifically
+        self.reranker_cache: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        
+        # Per-document caches, sharded by doc_id - lookups and expiry touch only the
+        # active document's shard. Max size is one budget across all shards; over it,
+        # the least recently used document gives up its oldest entry
+        self.query_cache = _ShardedCache()
+        self.answer_cache = _ShardedCache()
+        
+        # One expiry min-heap of (expires_at, key) per cache - due entries are popped lazily
+        self._expiry_heaps: Dict[str, List[Tuple[int, Any]]] = {
+            "embedding": [],
+            "query_embedding": [],
+            "reranker": []
+        }
+        
+        # Running byte counts per cache, updated on store/evict/expire so stats are O(1)
+        self._bytes: Dict[str, int] = {
+            "query": 0,
+            "embedding": 0,
+            "query_embedding": 0,
+            "reranker": 0,
+            "answer": 0
+        }
         
         # Performance metrics
         self.hits = 0
@@ -49,30 +142,147 @@ class CacheManager:
         if settings.enable_reranker_cache:
             conditional_print("  - Reranker score caching enabled")
     
-    def _generate_cache_key(self, data: Any) -> str:
-        """Generate cache key from data"""
-        if isinstance(data, str):
-            content = data
-        elif isinstance(data, dict):
-            content = json.dumps(data, sort_keys=True)
-        elif isinstance(data, (list, tuple)):
-            content = json.dumps(list(data), sort_keys=True)
+    def _generate_cache_key(self, data: str) -> str:
+        """Generate cache key from text (non-cryptographic xxh3 hash)"""
+        return xxhash.xxh3_64_hexdigest(data.encode())
+    
+    def _query_cache_key(self, question: str, k_retrieve: int) -> tuple:
+        """Query result cache key within a document shard - a plain tuple, hashed natively by the dict"""
+        return (_norm(question), k_retrieve)
+    
+    def _reranker_cache_key(self, question: str, chunk_texts: List[str]) -> tuple:
+        """Reranker cache key - a plain tuple, hashed natively by the dict"""
+        return (_norm(question), tuple(chunk_texts))
+    
+    def _entry_size(self, key: Any, value: Any) -> int:
+        """
+        Approximate bytes for one entry
+        
+        sys.getsizeof is exact for numpy arrays that own their data and strings, and
+        shallow for containers (query results, answers), so those are undercounted.
+        """
+        return sys.getsizeof(value) + sys.getsizeof(key) + _ENTRY_OVERHEAD
+    
+    def _store(self, name: str, cache_dict: OrderedDict, heap: List[Tuple[int, Any]],
+               key: Any, value: Any, ttl: float, now: int, max_size: int,
+               second_chance: bool = False) -> None:
+        """
+        Store an entry as most recently used, schedule its expiry and evict entries over max_size
+        
+        Eviction is LRU by default. With second_chance (CLOCK), reads only set the entry's
+        reference bit instead of reordering the cache; at eviction time a referenced entry
+        has its bit cleared and is requeued instead of being dropped.
+        """
+        ttl = int(ttl * 10)  # seconds -> cache-clock deciseconds
+        size = self._entry_size(key, value)
+        
+        replaced = cache_dict.get(key)
+        if replaced is not None:
+            self._bytes[name] -= replaced.size
         else:
-            content = str(data)
-        
-        return hashlib.md5(content.encode()).hexdigest()
+            # Make room before inserting, so the CLOCK sweep only ever sees existing
+            # entries and cannot pick the new key as its victim
+            while cache_dict and len(cache_dict) >= max_size:
+                old_key, old_entry = cache_dict.popitem(last=False)
+                if second_chance and old_entry.referenced:
+                    old_entry.referenced = False
+                    cache_dict[old_key] = old_entry
+                else:
+                    self._bytes[name] -= old_entry.size
+        
+        cache_dict[key] = CacheEntry(value=value, timestamp=now, ttl=ttl, size=size)
+        cache_dict.move_to_end(key)
+        heapq.heappush(heap, (now + ttl, key))
+        self._bytes[name] += size
+        
+        self._compact_heap(cache_dict, heap)
     
-    def _cleanup_expired(self, cache_dict: Dict[str, CacheEntry]) -> int:
-        """Remove expired entries from cache"""
-        expired_keys = [
-            key for key, entry in cache_dict.items() 
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del cache_dict[key]
+    def _compact_heap(self, cache_dict: Dict[Any, CacheEntry], heap: List[Tuple[int, Any]]) -> None:
+        """
+        Rebuild an expiry heap from the live entries once stale records dominate it
+        
+        Overwritten and evicted keys leave their records behind until they come due,
+        so without this the heap grows with the write rate rather than the cache size.
+        Rebuilding at twice the entry count keeps it bounded at amortized O(1) per write.
+        """
+        if len(heap) > 2 * len(cache_dict):
+            heap[:] = [(entry.timestamp + entry.ttl, key) for key, entry in cache_dict.items()]
+            heapq.heapify(heap)
+    
+    def _purge_due(self, name: str, cache_dict: Dict[Any, CacheEntry], heap: List[Tuple[int, Any]], now: int) -> int:
+        """Remove entries whose expiry time has passed, oldest first"""
+        purged = 0
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            entry = cache_dict.get(key)
+            # Skip heap records left behind by keys that were re-set with a later expiry
+            if entry is not None and entry.timestamp + entry.ttl <= now:
+                del cache_dict[key]
+                self._bytes[name] -= entry.size
+                purged += 1
+        return purged
+    
+    def _purge_shard(self, name: str, sharded: _ShardedCache, doc_id: str, shard: _CacheShard, now: int) -> int:
+        """Purge due entries from one shard, dropping the shard once it is empty"""
+        purged = self._purge_due(name, shard.entries, shard.heap, now)
+        sharded.size -= purged
+        if not shard.entries:
+            del sharded.shards[doc_id]
+        return purged
+    
+    def _purge_shards(self, name: str, sharded: _ShardedCache, now: int) -> int:
+        """Purge due entries from every shard and drop shards left empty"""
+        sharded.next_sweep = now + _SHARD_SWEEP_INTERVAL
+        return sum(
+            self._purge_shard(name, sharded, doc_id, shard, now)
+            for doc_id, shard in list(sharded.shards.items())
+        )
+    
+    def _sharded_get(self, name: str, sharded: _ShardedCache, doc_id: str, key: Any) -> Optional[CacheEntry]:
+        """Look up a key in a document's shard, marking entry and shard as most recently used"""
+        now = _now()
+        # Documents that are no longer queried still expire, on a periodic sweep
+        if now >= sharded.next_sweep:
+            self._purge_shards(name, sharded, now)
+        
+        shard = sharded.shards.get(doc_id)
+        if shard is None:
+            return None
         
-        return len(expired_keys)
+        self._purge_shard(name, sharded, doc_id, shard, now)
+        entry = shard.entries.get(key)
+        if entry is not None:
+            shard.entries.move_to_end(key)
+            sharded.shards.move_to_end(doc_id)
+        return entry
+    
+    def _sharded_store(self, name: str, sharded: _ShardedCache, doc_id: str, key: Any,
+                       value: Any, ttl: float, max_size: int) -> None:
+        """Store an entry in a document's shard, then evict across shards down to max_size"""
+        now = _now()
+        if now >= sharded.next_sweep:
+            self._purge_shards(name, sharded, now)
+        
+        shard = sharded.shards.get(doc_id)
+        if shard is None:
+            shard = sharded.shards[doc_id] = _CacheShard()
+        sharded.shards.move_to_end(doc_id)
+        
+        count = len(shard.entries)
+        self._store(name, shard.entries, shard.heap, key, value, ttl, now, max_size)
+        sharded.size += len(shard.entries) - count
+        
+        # The active shard is last and holds at most max_size entries, so anything over
+        # budget comes from other documents, least recently used first
+        while sharded.size > max_size:
+            lru_doc_id, lru_shard = next(iter(sharded.shards.items()))
+            _, old_entry = lru_shard.entries.popitem(last=False)
+            self._bytes[name] -= old_entry.size
+            sharded.size -= 1
+            if lru_shard.entries:
+                self._compact_heap(lru_shard.entries, lru_shard.heap)
+            else:
+                del sharded.shards[lru_doc_id]
     
     def get_query_result(self, question: str, doc_id: str, k_retrieve: int) -> Optional[Dict[str, Any]]:
         """Get cached query result"""
@@ -82,22 +292,14 @@ class CacheManager:
         self.total_requests += 1
         
         # Create cache key from query parameters
-        cache_key = self._generate_cache_key({
-            'question': question.lower().strip(),
-            'doc_id': doc_id,
-            'k_retrieve': k_retrieve
-        })
-        
-        # Check cache
-        if cache_key in self.query_cache:
-            entry = self.query_cache[cache_key]
-            if not entry.is_expired():
-                self.hits += 1
-                print(f"  Cache HIT for query: {question[:30]}...")
-                return entry.value
-            else:
-                # Remove expired entry
-                del self.query_cache[cache_key]
+        cache_key = self._query_cache_key(question, k_retrieve)
+        
+        # Drop due entries, then check the document's shard - anything left is still fresh
+        entry = self._sharded_get("query", self.query_cache, doc_id, cache_key)
+        if entry is not None:
+            self.hits += 1
+            conditional_print("  Cache HIT for query: %s...", question[:30])
+            return entry.value
         
         self.misses += 1
         return None
@@ -107,39 +309,28 @@ class CacheManager:
         if not settings.enable_result_caching:
             return
         
-        cache_key = self._generate_cache_key({
-            'question': question.lower().strip(),
-            'doc_id': doc_id,
-            'k_retrieve': k_retrieve
-        })
-        
-        self.query_cache[cache_key] = CacheEntry(
-            value=result,
-            timestamp=time.time(),
-            ttl=settings.cache_ttl_seconds
-        )
+        cache_key = self._query_cache_key(question, k_retrieve)
         
-        print(f"  Cached query result: {question[:30]}...")
+        self._sharded_store("query", self.query_cache, doc_id, cache_key,
+                            result, settings.cache_ttl_seconds,
+                            settings.query_cache_max_size)
         
-        # Periodic cleanup (every 50 entries)
-        if len(self.query_cache) % 50 == 0:
-            cleaned = self._cleanup_expired(self.query_cache)
-            if cleaned > 0:
-                print(f"  Cleaned {cleaned} expired query cache entries")
+        conditional_print("  Cached query result: %s...", question[:30])
     
-    def get_embedding(self, text: str) -> Optional[List[float]]:
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
         """Get cached embedding"""
         if not settings.enable_embedding_cache:
             return None
         
         cache_key = self._generate_cache_key(text)
         
-        if cache_key in self.embedding_cache:
-            entry = self.embedding_cache[cache_key]
-            if not entry.is_expired():
-                return entry.value
-            else:
-                del self.embedding_cache[cache_key]
+        self._purge_due("embedding", self.embedding_cache, self._expiry_heaps["embedding"], _now())
+        entry = self.embedding_cache.get(cache_key)
+        if entry is not None:
+            # CLOCK: a hit only sets the reference bit - no reordering on reads
+            entry.referenced = True
+            # Stored as float16 - hand back float32 for FAISS/numpy consumers
+            return entry.value.astype(np.float32)
         
         return None
     
@@ -150,46 +341,73 @@ class CacheManager:
         
         self.query_embedding_requests += 1
         
-        # Normalize query for consistent caching
-        normalized_query = query.lower().strip()
-        cache_key = self._generate_cache_key(normalized_query)
+        # Normalized query is the key itself - queries are short, and a miss
+        # then costs one dict probe with no hash digest computed first
+        cache_key = _norm(query)
+        
+        self._purge_due("query_embedding", self.query_embedding_cache, self._expiry_heaps["query_embedding"], _now())
+        entry = self.query_embedding_cache.get(cache_key)
+        if entry is not None:
+            self.query_embedding_cache.move_to_end(cache_key)
+            self.query_embedding_hits += 1
+            conditional_print("Query embedding cache HIT: %s...", query[:40])
+            # Stored as float16 - hand back float32 for FAISS/numpy consumers
+            return entry.value.astype(np.float32)
         
-        if cache_key in self.query_embedding_cache:
-            entry = self.query_embedding_cache[cache_key]
-            if not entry.is_expired():
+        return None
+    
+    def get_query_embeddings_batch(self, queries: List[str]) -> Tuple[List[Optional[np.ndarray]], List[int]]:
+        """
+        Look up several query embeddings in one pass
+        
+        Args:
+            queries: Query strings
+            
+        Returns:
+            Tuple of (embeddings with None for misses, indices of the misses) - the
+            misses can then be embedded with a single batched provider call
+        """
+        if not settings.enable_embedding_cache:
+            return [None] * len(queries), list(range(len(queries)))
+        
+        self.query_embedding_requests += len(queries)
+        
+        # One purge for the whole batch, then plain lookups
+        self._purge_due("query_embedding", self.query_embedding_cache, self._expiry_heaps["query_embedding"], _now())
+        
+        embeddings: List[Optional[np.ndarray]] = []
+        miss_indices: List[int] = []
+        for i, query in enumerate(queries):
+            cache_key = _norm(query)
+            entry = self.query_embedding_cache.get(cache_key)
+            if entry is not None:
+                self.query_embedding_cache.move_to_end(cache_key)
                 self.query_embedding_hits += 1
-                conditional_print(f"Query embedding cache HIT: {query[:40]}...")
-                return entry.value
+                embeddings.append(entry.value.astype(np.float32))
             else:
-                del self.query_embedding_cache[cache_key]
+                embeddings.append(None)
+                miss_indices.append(i)
         
-        return None
+        return embeddings, miss_indices
     
     def set_query_embedding(self, query: str, embedding: Any) -> None:
         """Cache query embedding for fast reuse"""
         if not settings.enable_embedding_cache:
             return
         
-        # Normalize query for consistent caching
-        normalized_query = query.lower().strip()
-        cache_key = self._generate_cache_key(normalized_query)
+        # Normalized query is the key itself - queries are short, and a miss
+        # then costs one dict probe with no hash digest computed first
+        cache_key = _norm(query)
         
         # Cache query embeddings for longer (they're expensive to compute)
-        self.query_embedding_cache[cache_key] = CacheEntry(
-            value=embedding,
-            timestamp=time.time(),
-            ttl=settings.cache_ttl_seconds * 6  # 6 hours - longer TTL for queries
-        )
+        # Store as float16 - half the memory of float32, a fraction of a list of floats
+        self._store("query_embedding", self.query_embedding_cache, self._expiry_heaps["query_embedding"], cache_key,
+                    np.asarray(embedding, dtype=np.float16), settings.cache_ttl_seconds * 6,  # 6 hours - longer TTL for queries
+                    _now(), settings.query_embedding_cache_max_size)
         
-        conditional_print(f"Cached query embedding: {query[:40]}...")
-        
-        # Cleanup every 25 entries to maintain performance
-        if len(self.query_embedding_cache) % 25 == 0:
-            cleaned = self._cleanup_expired(self.query_embedding_cache)
-            if cleaned > 0:
-                conditional_print(f"Cleaned {cleaned} expired query embedding cache entries")
+        conditional_print("Cached query embedding: %s...", query[:40])
     
-    def set_embedding(self, text: str, embedding: List[float]) -> None:
+    def set_embedding(self, text: str, embedding: Any) -> None:
         """Cache embedding"""
         if not settings.enable_embedding_cache:
             return
@@ -197,28 +415,23 @@ class CacheManager:
         cache_key = self._generate_cache_key(text)
         
         # Use longer TTL for embeddings (they don't change)
-        self.embedding_cache[cache_key] = CacheEntry(
-            value=embedding,
-            timestamp=time.time(),
-            ttl=settings.cache_ttl_seconds * 24  # 24 hours
-        )
+        # Store as float16 - half the memory of float32, a fraction of a list of floats
+        self._store("embedding", self.embedding_cache, self._expiry_heaps["embedding"], cache_key,
+                    np.asarray(embedding, dtype=np.float16), settings.cache_ttl_seconds * 24,  # 24 hours
+                    _now(), settings.embedding_cache_max_size, second_chance=True)
     
     def get_reranker_scores(self, question: str, chunk_texts: List[str]) -> Optional[List[float]]:
         """Get cached reranker scores"""
         if not settings.enable_reranker_cache:
             return None
         
-        cache_key = self._generate_cache_key({
-            'question': question.lower().strip(),
-            'texts': chunk_texts
-        })
+        cache_key = self._reranker_cache_key(question, chunk_texts)
         
-        if cache_key in self.reranker_cache:
-            entry = self.reranker_cache[cache_key]
-            if not entry.is_expired():
-                return entry.value
-            else:
-                del self.reranker_cache[cache_key]
+        self._purge_due("reranker", self.reranker_cache, self._expiry_heaps["reranker"], _now())
+        entry = self.reranker_cache.get(cache_key)
+        if entry is not None:
+            self.reranker_cache.move_to_end(cache_key)
+            return entry.value
         
         return None
     
@@ -227,44 +440,28 @@ class CacheManager:
         if not settings.enable_reranker_cache:
             return
         
-        cache_key = self._generate_cache_key({
-            'question': question.lower().strip(),
-            'texts': chunk_texts
-        })
+        cache_key = self._reranker_cache_key(question, chunk_texts)
         
-        self.reranker_cache[cache_key] = CacheEntry(
-            value=scores,
-            timestamp=time.time(),
-            ttl=settings.cache_ttl_seconds * 2  # 2 hours
-        )
+        self._store("reranker", self.reranker_cache, self._expiry_heaps["reranker"], cache_key,
+                    scores, settings.cache_ttl_seconds * 2,  # 2 hours
+                    _now(), settings.reranker_cache_max_size)
     
-    async def get_answer_cache(self, cache_key: str):
-        """Get cached complete answer response"""
-        if cache_key in self.answer_cache:
-            entry = self.answer_cache[cache_key]
-            if not entry.is_expired():
-                self.hits += 1
-                return entry.value
-            else:
-                del self.answer_cache[cache_key]
+    async def get_answer_cache(self, cache_key: str, doc_id: Optional[str] = None):
+        """Get cached complete answer response from the document's shard"""
+        entry = self._sharded_get("answer", self.answer_cache, doc_id or "", cache_key)
+        if entry is not None:
+            self.hits += 1
+            return entry.value
         
         self.misses += 1
         return None
     
-    async def set_answer_cache(self, cache_key: str, response) -> None:
-        """Cache complete answer response"""
+    async def set_answer_cache(self, cache_key: str, response, doc_id: Optional[str] = None) -> None:
+        """Cache complete answer response in the document's shard"""
         # Cache answers for 1 hour
-        self.answer_cache[cache_key] = CacheEntry(
-            value=response,
-            timestamp=time.time(),
-            ttl=settings.cache_ttl_seconds * 1  # 1 hour
-        )
-        
-        # Periodic cleanup (every 25 entries)
-        if len(self.answer_cache) % 25 == 0:
-            cleaned = self._cleanup_expired(self.answer_cache)
-            if cleaned > 0:
-                print(f"  Cleaned {cleaned} expired answer cache entries")
+        self._sharded_store("answer", self.answer_cache, doc_id or "", cache_key,
+                            response, settings.cache_ttl_seconds * 1,  # 1 hour
+                            settings.answer_cache_max_size)
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache performance statistics"""
@@ -283,19 +480,15 @@ class CacheManager:
                 "performance_impact": "HIGH - saves embedding computation time"
             },
             "cache_sizes": {
-                "query_cache": len(self.query_cache),
+                "query_cache": self.query_cache.size,
                 "embedding_cache": len(self.embedding_cache),
                 "query_embedding_cache": len(self.query_embedding_cache),
                 "reranker_cache": len(self.reranker_cache),
-                "answer_cache": len(self.answer_cache)
+                "answer_cache": self.answer_cache.size
             },
-            "memory_usage_estimate_mb": round(
-                (len(self.query_cache) * 0.5 + 
-                 len(self.embedding_cache) * 0.1 + 
-                 len(self.query_embedding_cache) * 0.2 +
-                 len(self.reranker_cache) * 0.05 +
-                 len(self.answer_cache) * 1.0), 2  # Answers are larger
-            )
+            # Running sizes maintained on store/evict/expire (containers counted shallowly)
+            "memory_usage_estimate_mb": round(sum(self._bytes.values()) / (1024 * 1024), 2),
+            "memory_usage_bytes": dict(self._bytes)
         }
     
     def clear_cache(self, cache_type: str = "all") -> Dict[str, int]:
@@ -303,24 +496,32 @@ class CacheManager:
         cleared = {}
         
         if cache_type in ["all", "query"]:
-            cleared["query"] = len(self.query_cache)
-            self.query_cache.clear()
+            cleared["query"] = self.query_cache.size
+            self.query_cache = _ShardedCache()
+            self._bytes["query"] = 0
         
         if cache_type in ["all", "embedding"]:
             cleared["embedding"] = len(self.embedding_cache)
             self.embedding_cache.clear()
+            self._expiry_heaps["embedding"].clear()
+            self._bytes["embedding"] = 0
             
         if cache_type in ["all", "query_embedding"]:
             cleared["query_embedding"] = len(self.query_embedding_cache)
             self.query_embedding_cache.clear()
+            self._expiry_heaps["query_embedding"].clear()
+            self._bytes["query_embedding"] = 0
         
         if cache_type in ["all", "reranker"]:
             cleared["reranker"] = len(self.reranker_cache)
             self.reranker_cache.clear()
+            self._expiry_heaps["reranker"].clear()
+            self._bytes["reranker"] = 0
         
         if cache_type in ["all", "answer"]:
-            cleared["answer"] = len(self.answer_cache)
-            self.answer_cache.clear()
+            cleared["answer"] = self.answer_cache.size
+            self.answer_cache = _ShardedCache()
+            self._bytes["answer"] = 0
         
         if cache_type == "all":
             self.hits = 0
@@ -333,27 +534,25 @@ class CacheManager:
     
     def cleanup_expired_entries(self) -> Dict[str, int]:
         """Manual cleanup of expired entries"""
+        now = _now()
         cleaned = {
-            "query": self._cleanup_expired(self.query_cache),
-            "embedding": self._cleanup_expired(self.embedding_cache),
-            "query_embedding": self._cleanup_expired(self.query_embedding_cache),
-            "reranker": self._cleanup_expired(self.reranker_cache),
-            "answer": self._cleanup_expired(self.answer_cache)
+            "query": self._purge_shards("query", self.query_cache, now),
+            "embedding": self._purge_due("embedding", self.embedding_cache, self._expiry_heaps["embedding"], now),
+            "query_embedding": self._purge_due("query_embedding", self.query_embedding_cache, self._expiry_heaps["query_embedding"], now),
+            "reranker": self._purge_due("reranker", self.reranker_cache, self._expiry_heaps["reranker"], now),
+            "answer": self._purge_shards("answer", self.answer_cache, now)
         }
         
         total_cleaned = sum(cleaned.values())
         if total_cleaned > 0:
-            print(f"Cleaned {total_cleaned} expired cache entries")
+            logger.debug("Cleaned %d expired cache entries", total_cleaned)
         
         return cleaned
 
 
-# Singleton instance
-_cache_manager = None
+# Singleton instance, created eagerly at import (construction is cheap)
+_cache_manager = CacheManager()
 
 def get_cache_manager() -> CacheManager:
     """Get singleton cache manager instance"""
-    global _cache_manager
-    if _cache_manager is None:
-        _cache_manager = CacheManager()
     return _cache_manager
\ No newline at end of file
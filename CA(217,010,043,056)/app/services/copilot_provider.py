@@ -3,15 +3,55 @@ Custom GitHub Copilot provider for RAG system
 """
 
 import os
-import json
 import logging
+import threading
 import time
 from typing import Dict, Any, List, Optional, AsyncGenerator
 import httpx
+import orjson
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# One pooled HTTP client shared by every provider instance, so TCP/TLS connections
+# are kept alive across requests instead of being rebuilt per call
+_http_client: Optional[httpx.AsyncClient] = None
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared Copilot HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=60.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            http2=True
+        )
+    return _http_client
+
+async def close_http_client() -> None:
+    """Close the shared Copilot HTTP client (called on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+# Models offered through GitHub Copilot
+_AVAILABLE_MODELS = [
+    "gpt-4o",
+    "gpt-4o-mini", 
+    "gpt-4",
+    "gpt-4-turbo",
+    "claude-3.5-sonnet",
+    "claude-3.5-haiku",
+    "claude-3-opus",
+    "claude-3-sonnet", 
+    "claude-3-haiku",
+    "gemini-1.5-pro",
+    "gemini-1.5-flash",
+    "o1-preview",
+    "o1-mini"
+]
+
 @dataclass
 class CopilotResponse:
     """Response from Copilot API"""
@@ -29,6 +69,15 @@ class CopilotProvider:
         self.api_base = "https://api.githubcopilot.com"
         self.kwargs = kwargs
         
+        # Request fields that never change between calls, built once. Provider kwargs
+        # are spread after the per-call fields, so they override them as before
+        self._base_payload = {
+            "model": self.model,
+            "max_tokens": kwargs.get("max_tokens", 2048)
+        }
+        self._payload_overrides = {k: v for k, v in kwargs.items() if k != "max_tokens"}
+        self._stream_payload_overrides = {k: v for k, v in kwargs.items() if k not in ["max_tokens", "stream"]}
+        
         # Validate authentication
         self.api_token = os.getenv("COPILOT_ACCESS_TOKEN")
         if not self.api_token:
@@ -43,6 +92,21 @@ class CopilotProvider:
             "editor-version": "VSCode/1.85.0",
             "User-Agent": "RAG-System/1.0"
         }
+        # Normalized/encoded once and reused for every request
+        self._httpx_headers = httpx.Headers(self.headers)
+        
+        # Model info never changes for a provider instance
+        self._model_info = {
+            "provider": "github_copilot",
+            "model_name": self.model,
+            "api_base": self.api_base,
+            "features": {
+                "streaming": True,
+                "temperature_control": True,
+                "max_tokens_control": True,
+                "function_calling": True
+            }
+        }
         
         logger.info(f"Initialized GitHub Copilot provider with model: {model}")
     
@@ -62,7 +126,7 @@ class CopilotProvider:
         try:
             # Prepare the request payload
             payload = {
-                "model": self.model,
+                **self._base_payload,
                 "messages": [
                     {
                         "role": "user", 
@@ -70,69 +134,68 @@ class CopilotProvider:
                     }
                 ],
                 "temperature": temperature,
-                "max_tokens": self.kwargs.get("max_tokens", 2048),
-                **{k: v for k, v in self.kwargs.items() if k != "max_tokens"}
+                **self._payload_overrides
             }
             
             logger.debug(f"Sending request to Copilot API with model: {self.model}")
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.api_base}/chat/completions",
-                    headers=self.headers,
-                    json=payload
-                )
-                
-                processing_time = time.time() - start_time
-                
-                if response.status_code != 200:
-                    error_text = response.text
-                    logger.error(f"GitHub Copilot API error {response.status_code}: {error_text}")
-                    
-                    # Handle specific error cases
-                    if response.status_code == 401:
-                        error_msg = "GitHub Copilot authentication failed. Check your COPILOT_ACCESS_TOKEN."
-                    elif response.status_code == 403:
-                        error_msg = "GitHub Copilot access forbidden. Verify your Copilot subscription."
-                    elif response.status_code == 429:
-                        error_msg = "GitHub Copilot rate limit exceeded. Please wait and try again."
-                    else:
-                        error_msg = f"GitHub Copilot API error {response.status_code}: {error_text}"
-                    
-                    return CopilotResponse(
-                        content="",
-                        model=self.model,
-                        processing_time=processing_time,
-                        error=error_msg
-                    )
-                
-                response_data = response.json()
-                
-                # Extract the response content
-                choice = response_data.get("choices", [{}])[0]
-                message = choice.get("message", {})
-                content = message.get("content", "").strip()
-                
-                # Extract usage information
-                usage = None
-                if "usage" in response_data:
-                    usage_data = response_data["usage"]
-                    usage = {
-                        "prompt_tokens": usage_data.get("prompt_tokens", 0),
-                        "completion_tokens": usage_data.get("completion_tokens", 0),
-                        "total_tokens": usage_data.get("total_tokens", 0)
-                    }
+            client = _get_http_client()
+            response = await client.post(
+                f"{self.api_base}/chat/completions",
+                headers=self._httpx_headers,  # Content-Type: application/json
+                content=orjson.dumps(payload)
+            )
+            
+            processing_time = time.time() - start_time
+            
+            if response.status_code != 200:
+                error_text = response.text
+                logger.error(f"GitHub Copilot API error {response.status_code}: {error_text}")
                 
-                logger.info(f"Copilot response generated in {processing_time:.2f}s")
-                logger.debug(f"Response length: {len(content)} characters")
+                # Handle specific error cases
+                if response.status_code == 401:
+                    error_msg = "GitHub Copilot authentication failed. Check your COPILOT_ACCESS_TOKEN."
+                elif response.status_code == 403:
+                    error_msg = "GitHub Copilot access forbidden. Verify your Copilot subscription."
+                elif response.status_code == 429:
+                    error_msg = "GitHub Copilot rate limit exceeded. Please wait and try again."
+                else:
+                    error_msg = f"GitHub Copilot API error {response.status_code}: {error_text}"
                 
                 return CopilotResponse(
-                    content=content,
-                    model=response_data.get("model", self.model),
-                    usage=usage,
-                    processing_time=processing_time
+                    content="",
+                    model=self.model,
+                    processing_time=processing_time,
+                    error=error_msg
                 )
-                
+            
+            response_data = orjson.loads(response.content)
+            
+            # Extract the response content
+            choice = response_data.get("choices", [{}])[0]
+            message = choice.get("message", {})
+            content = message.get("content", "").strip()
+            
+            # Extract usage information
+            usage = None
+            if "usage" in response_data:
+                usage_data = response_data["usage"]
+                usage = {
+                    "prompt_tokens": usage_data.get("prompt_tokens", 0),
+                    "completion_tokens": usage_data.get("completion_tokens", 0),
+                    "total_tokens": usage_data.get("total_tokens", 0)
+                }
+            
+            logger.info(f"Copilot response generated in {processing_time:.2f}s")
+            logger.debug(f"Response length: {len(content)} characters")
+            
+            return CopilotResponse(
+                content=content,
+                model=response_data.get("model", self.model),
+                usage=usage,
+                processing_time=processing_time
+            )
+            
         except httpx.TimeoutException:
             processing_time = time.time() - start_time
             error_msg = "GitHub Copilot API request timed out"
@@ -178,7 +241,7 @@ class CopilotProvider:
         try:
             # Prepare the request payload
             payload = {
-                "model": self.model,
+                **self._base_payload,
                 "messages": [
                     {
                         "role": "user",
@@ -186,72 +249,98 @@ class CopilotProvider:
                     }
                 ],
                 "temperature": temperature,
-                "max_tokens": self.kwargs.get("max_tokens", 2048),
                 "stream": True,
-                **{k: v for k, v in self.kwargs.items() if k not in ["max_tokens", "stream"]}
+                **self._stream_payload_overrides
             }
             
             logger.debug("Starting streaming request to Copilot API")
             
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.api_base}/chat/completions",
-                    headers=self.headers,
-                    json=payload
-                ) as response:
-                    
-                    if response.status_code != 200:
-                        error_text = await response.aread()
-                        logger.error(f"GitHub Copilot streaming error {response.status_code}: {error_text}")
-                        yield f"Error: GitHub Copilot streaming failed: {response.status_code}"
-                        return
-                    
-                    async for line in response.aiter_lines():
-                        if line.startswith("data: "):
-                            data = line[6:]  # Remove "data: " prefix
-                            
-                            if data.strip() == "[DONE]":
-                                break
+            client = _get_http_client()
+            async with client.stream(
+                "POST",
+                f"{self.api_base}/chat/completions",
+                headers=self._httpx_headers,  # Content-Type: application/json
+                content=orjson.dumps(payload)
+            ) as response:
+                
+                if response.status_code != 200:
+                    error_text = await response.aread()
+                    logger.error(f"GitHub Copilot streaming error {response.status_code}: {error_text}")
+                    yield f"Error: GitHub Copilot streaming failed: {response.status_code}"
+                    return
+                
+                async for data in self._iter_sse_data(response):
+                    try:
+                        chunk = orjson.loads(data)
+                        
+                        # Extract delta content
+                        choices = chunk.get("choices", [])
+                        if choices:
+                            delta = choices[0].get("delta", {})
+                            content = delta.get("content", "")
                             
-                            try:
-                                chunk = json.loads(data)
-                                
-                                # Extract delta content
-                                choices = chunk.get("choices", [])
-                                if choices:
-                                    delta = choices[0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    
-                                    if content:
-                                        yield content
-                                        
-                            except json.JSONDecodeError:
-                                continue  # Skip invalid JSON lines
+                            if content:
+                                yield content
                                 
+                    except orjson.JSONDecodeError:
+                        continue  # Skip invalid JSON lines
+                            
         except Exception as e:
             logger.error(f"GitHub Copilot streaming error: {e}")
             yield f"Error: {str(e)}"
     
+    @staticmethod
+    async def _iter_sse_data(response: httpx.Response) -> AsyncGenerator[bytes, None]:
+        """
+        Yield the payload of each SSE "data: " line as raw bytes, stopping at [DONE]
+        
+        Lines are split from the byte stream directly, so nothing is decoded to str
+        (orjson parses the bytes payloads as they are).
+        
+        Args:
+            response: Streaming response from the Copilot API
+            
+        Yields:
+            Payload bytes of each data line
+        """
+        buffer = bytearray()
+        
+        async for raw in response.aiter_bytes():
+            buffer += raw
+            start = 0
+            
+            while True:
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                
+                line = buffer[start:end]
+                start = end + 1
+                
+                if line.startswith(b"data: "):
+                    data = bytes(line[6:]).strip()  # Remove "data: " prefix and CR
+                    if data == b"[DONE]":
+                        return
+                    yield data
+            
+            # Keep the trailing partial line for the next chunk
+            del buffer[:start]
+        
+        # A final line without a newline still counts, as it does for aiter_lines()
+        if buffer.startswith(b"data: "):
+            data = bytes(buffer[6:]).strip()
+            if data != b"[DONE]":
+                yield data
+    
     def get_available_models(self) -> List[str]:
         """
-        Get available models from GitHub Copilot
+        Get available models from GitHub Copilot (shared list - do not mutate)
         """
-        return [
-            "gpt-4o",
-            "gpt-4o-mini", 
-            "gpt-4",
-            "gpt-4-turbo",
-            "claude-3.5-sonnet",
-            "claude-3.5-haiku",
-            "claude-3-opus",
-            "claude-3-sonnet", 
-            "claude-3-haiku",
-            "gemini-1.5-pro",
-            "gemini-1.5-flash",
-            "o1-preview",
-            "o1-mini"
-        ]
+        return _AVAILABLE_MODELS
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client used by this provider"""
+        await close_http_client()
     
     async def test_connection(self) -> bool:
         """
@@ -268,26 +357,23 @@ class CopilotProvider:
             return False
     
     def get_model_info(self) -> Dict[str, Any]:
-        """Get information about the current model"""
-        return {
-            "provider": "github_copilot",
-            "model_name": self.model,
-            "api_base": self.api_base,
-            "features": {
-                "streaming": True,
-                "temperature_control": True,
-                "max_tokens_control": True,
-                "function_calling": True
-            }
-        }
+        """Get information about the current model (built once per provider - do not mutate)"""
+        return self._model_info
 
 
 # Singleton instance for easy usage
 _copilot_provider = None
+_copilot_provider_lock = threading.Lock()
 
 def get_copilot_provider(model: str = "gpt-4o", **kwargs) -> CopilotProvider:
     """Get singleton Copilot provider instance"""
     global _copilot_provider
-    if _copilot_provider is None or _copilot_provider.model != model:
-        _copilot_provider = CopilotProvider(model=model, **kwargs)
-    return _copilot_provider
\ No newline at end of file
+    provider = _copilot_provider
+    if provider is not None and provider.model == model:
+        return provider
+    
+    # Double-checked under the lock so concurrent first calls build one instance
+    with _copilot_provider_lock:
+        if _copilot_provider is None or _copilot_provider.model != model:
+            _copilot_provider = CopilotProvider(model=model, **kwargs)
+        return _copilot_provider
\ No newline at end of file
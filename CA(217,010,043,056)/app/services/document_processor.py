@@ -2,13 +2,21 @@
 Document processing service for PDF download and text extraction
 """
 import os
+import stat
+import asyncio
+import multiprocessing
 import aiohttp
 import pymupdf
+import xxhash
 import hashlib
 import time
+from collections import Counter, deque
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from fastapi import HTTPException
 
@@ -21,6 +29,455 @@ from app.services.extractors import (
 )
 import re
 
+# Read size for streamed remote downloads
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shared download session - keeps DNS results and keep-alive connections across downloads
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Get the shared download session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=settings.download_timeout),
+            connector=aiohttp.TCPConnector(
+                limit_per_host=16,
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True
+            )
+        )
+    return _http_session
+
+async def close_http_session() -> None:
+    """Close the shared download session (called on application shutdown)"""
+    global _http_session
+    if _http_session is not None:
+        await _http_session.close()
+        _http_session = None
+
+# Literal translation prompt - filled per chunk with lang_name and text
+_TRANSLATION_PROMPT = """Translate the following {lang_name} text to English with complete literal accuracy.
+
+CRITICAL REQUIREMENTS:
+- Translate EXACTLY as stated in the original text - do not add or remove specificity
+- Preserve ALL qualifying terms like "foreign-made", "domestic", "imported", "manufactured", "produced"
+- Keep precise distinctions between products vs companies vs manufacturing processes
+- Maintain exact subject references (if original says "computers", keep "computers" not "companies")
+- Preserve ALL qualifying context and conditions exactly as written
+- For exemptions and exceptions: preserve exact subjects ("computers manufactured" vs "companies committed")
+- Do not enhance, expand, or interpret the meaning beyond what is explicitly stated
+- Maintain the document's natural phrasing and terminology level
+
+EXAMPLES of good translation:
+- വില വർദ്ധന → "cost increases" (preserve original generality level)  
+- ഉപഭോക്താക്കൾക്ക് → "for consumers" (specify the target)
+- വാണിജ്യ പ്രതികരണങ്ങൾ → "trade retaliations" (literal translation without expansion)
+
+Translate this {lang_name} economic/policy text:
+{text}
+
+English translation:"""
+
+
+def _split_paragraphs(text: str, max_chars: int) -> list:
+    """
+    Split text into chunks of at most max_chars, breaking on paragraph boundaries
+    
+    Args:
+        text: Text to split
+        max_chars: Target maximum chunk length
+        
+    Returns:
+        Ordered list of (chunk, separator) pairs, where separator is the text that
+        followed the chunk in the source - joining every chunk + separator gives
+        back the original text
+    """
+    chunks = []
+    current = []
+    current_len = 0
+    for paragraph in text.split("\n\n"):
+        # Hard-split oversized paragraphs on the last space before the limit
+        while len(paragraph) > max_chars:
+            cut = paragraph.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                chunks.append(("\n\n".join(current), "\n\n"))
+                current, current_len = [], 0
+            # A piece of a split paragraph is followed by the spaces at the cut (or
+            # nothing, for a cut mid-word) - not by a paragraph break
+            rest = paragraph[cut:].lstrip(" ")
+            chunks.append((paragraph[:cut], paragraph[cut:len(paragraph) - len(rest)]))
+            paragraph = rest
+        
+        if current and current_len + len(paragraph) + 2 > max_chars:
+            chunks.append(("\n\n".join(current), "\n\n"))
+            current, current_len = [], 0
+        current.append(paragraph)
+        current_len += len(paragraph) + 2
+    
+    chunks.append(("\n\n".join(current), ""))
+    return chunks
+
+# Recent chunk translations keyed by blake2b digest of (language, text); backed by
+# the persistent cache so translations survive restarts
+TRANSLATION_CACHE_SIZE = 1024
+_translation_cache: Dict[str, str] = {}
+
+async def _get_cached_translation(key: str) -> Optional[str]:
+    """Look up a chunk translation in memory, then on disk"""
+    if not settings.enable_translation_cache:
+        return None
+    
+    translated = _translation_cache.pop(key, None)
+    if translated is None:
+        from app.services.persistent_cache import get_persistent_cache_manager
+        translated = await asyncio.to_thread(
+            get_persistent_cache_manager().get, "translations", key
+        )
+        if translated is None:
+            return None
+    
+    _remember_translation(key, translated)
+    return translated
+
+async def _cache_translation(key: str, translated: str) -> None:
+    """Store a successful chunk translation in memory and on disk"""
+    if not settings.enable_translation_cache:
+        return
+    
+    _remember_translation(key, translated)
+    from app.services.persistent_cache import get_persistent_cache_manager
+    await asyncio.to_thread(get_persistent_cache_manager().set, "translations", key, translated)
+
+def _remember_translation(key: str, translated: str) -> None:
+    """Insert into the in-memory translation LRU, evicting the oldest entry when full"""
+    _translation_cache[key] = translated
+    if len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+        _translation_cache.pop(next(iter(_translation_cache)), None)
+
+# Regex patterns compiled once per process (these run per page on large documents)
+_MALAYALAM_RANGE_RE = re.compile(r'[\u0D00-\u0D7F]')
+_ARTIFACT_RE = re.compile(r'^(English translation:|Translation:)', re.IGNORECASE)
+
+# Indic script blocks are laid out contiguously in 128-codepoint blocks from
+# U+0900, so (codepoint - 0x0900) >> 7 maps a character straight to its script
+_INDIC_BASE = 0x0900
+_INDIC_END = 0x0D7F
+_INDIC_BLOCKS = (
+    'hindi',      # U+0900 Devanagari
+    'bengali',    # U+0980
+    'punjabi',    # U+0A00 Gurmukhi
+    'gujarati',   # U+0A80
+    None,         # U+0B00 Oriya (not tracked)
+    'tamil',      # U+0B80
+    'telugu',     # U+0C00
+    'kannada',    # U+0C80
+    'malayalam',  # U+0D00
+)
+_SCRIPT_NAMES = ('malayalam', 'hindi', 'tamil', 'bengali', 'telugu', 'gujarati', 'punjabi', 'kannada')
+
+
+# Process pool for parallel PDF page extraction (see settings.parallel_pdf_pages)
+PARALLEL_PDF_MIN_PAGES = 4
+_page_executor: Optional[ProcessPoolExecutor] = None
+
+def _get_page_executor() -> ProcessPoolExecutor:
+    """Get the shared page extraction pool, creating it on first use"""
+    global _page_executor
+    if _page_executor is None:
+        # spawn rather than fork: the parent holds model threads and CUDA state
+        _page_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_page_worker
+        )
+    return _page_executor
+
+def _discard_page_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken page pool so the next document gets a fresh one"""
+    global _page_executor
+    if _page_executor is executor:
+        _page_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_page_executor() -> None:
+    """Shut down the page extraction pool (called on application shutdown)"""
+    global _page_executor
+    if _page_executor is not None:
+        _page_executor.shutdown(cancel_futures=True)
+        _page_executor = None
+
+# Page extractor of a pool process, set by _init_page_worker
+_worker_processor: Optional["DocumentProcessor"] = None
+
+def _init_page_worker() -> None:
+    """
+    Pool initializer: set up a bare DocumentProcessor for page extraction
+    
+    Page extraction uses none of the file extractors or directories that
+    DocumentProcessor.__init__ sets up, so workers skip building them.
+    """
+    global _worker_processor
+    _worker_processor = DocumentProcessor.__new__(DocumentProcessor)
+
+def _extract_pdf_page_range(pdf_data: bytes, start: int, stop: int) -> list:
+    """Worker entry point: extract pages [start, stop) in a pool process"""
+    processor = _worker_processor
+    pdf_doc = pymupdf.open(stream=pdf_data, filetype="pdf")
+    try:
+        return processor._extract_page_range(pdf_doc, pdf_data, range(start, stop))
+    finally:
+        pdf_doc.close()
+
+
+# Directory listings used to resolve local file names, keyed by directory path and
+# invalidated by the directory's mtime (any add/remove/rename bumps it)
+DIR_LISTING_CACHE_SIZE = 64
+_dir_listing_cache: Dict[str, Tuple[int, Dict[str, Path]]] = {}
+
+def _list_directory(parent_dir: Path) -> Optional[Dict[str, Path]]:
+    """Get {name: path} for the visible entries of a directory, or None if it is missing"""
+    key = str(parent_dir)
+    try:
+        mtime = parent_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+    
+    cached = _dir_listing_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    try:
+        with os.scandir(parent_dir) as entries:
+            listing = {
+                entry.name: Path(entry.path) for entry in entries
+                if not entry.name.startswith('.')
+            }
+    except OSError:
+        return None
+    
+    if len(_dir_listing_cache) >= DIR_LISTING_CACHE_SIZE:
+        _dir_listing_cache.clear()
+    _dir_listing_cache[key] = (mtime, listing)
+    return listing
+
+def _stat_local_file(file_path: Path) -> Optional[os.stat_result]:
+    """Stat a local file once, returning None if it is missing and 403 if access is denied"""
+    try:
+        return file_path.stat()
+    except FileNotFoundError:
+        return None
+    except PermissionError:
+        raise HTTPException(
+            status_code=403,
+            detail=f"Permission denied: Cannot access file {file_path}"
+        )
+
+# Recently detected (language, script ratio) pairs keyed by blake2b digest of the
+# text (insertion order doubles as LRU order: hits are popped and re-inserted at the end)
+LANGUAGE_CACHE_SIZE = 256
+_language_cache: Dict[bytes, Tuple[str, float]] = {}
+
+
+def _script_histogram(text: str):
+    """
+    Count Indic-script and Latin letters in a single pass over the text
+    
+    Args:
+        text: Text to analyze
+        
+    Returns:
+        Tuple of (per-script character counts, Latin letter count)
+    """
+    lang_counts = dict.fromkeys(_SCRIPT_NAMES, 0)
+    latin_chars = 0
+    # Counter tallies in C; only the distinct characters are classified in Python
+    for ch, n in Counter(text).items():
+        o = ord(ch)
+        if _INDIC_BASE <= o <= _INDIC_END:
+            name = _INDIC_BLOCKS[(o - _INDIC_BASE) >> 7]
+            if name is not None:
+                lang_counts[name] += n
+        elif 0x61 <= (o | 0x20) <= 0x7A:
+            latin_chars += n
+    return lang_counts, latin_chars
+
+# Malayalam OCR spacing fixes - (pattern, replacement[, trigger chars]), applied in order.
+# A pattern with trigger chars can only match text containing at least one of them.
+_RAW_MALAYALAM_PATTERNS = [
+    # Add space before Malayalam numbers and dates
+    (r'(\d+)([^\s\d\u0D00-\u0D7F])', r'\1 \2'),
+    
+    # Add space around key Malayalam terms that are often merged
+    (r'യുഎസ്സ്പ്രസിഡൻറ്', r'യുഎസ് പ്രസിഡൻറ്'),
+    (r'ഡോണൾഡ്ട്രംപ്', r'ഡോണൾഡ് ട്രംപ്'),
+    (r'കമ്പ്യൂട്ടർചിപ്പുകളുടെയും', r'കമ്പ്യൂട്ടർ ചിപ്പുകളുടെയും'),
+    (r'സെമിക്കണ്ടക്ടറുകളുടെയും', r'സെമിക്കണ്ടക്ടറുകളുടെയും'),
+    (r'അമേരിക്കൻഅന്തർസ്ഥാപന', r'അമേരിക്കൻ അന്തർസ്ഥാപന'),
+    (r'നിർമ്മാണംതാക്കോൽപ്പെടുത്തുകയും', r'നിർമ്മാണം ശക്തിപ്പെടുത്തുകയും'),
+    (r'ആശ്രിതത്വംകുറയ്ക്കുകയും', r'ആശ്രിതത്വം കുറയ്ക്കുകയും'),
+    (r'ബില്യൻഡോളർയുടെ', r'ബില്യൺ ഡോളർയുടെ'),
+    (r'ആഗാമിനിക്ഷേപം', r'ഭാവി നിക്ഷേപം'),
+    (r'പ്രഖ്യാപിച്ചപ്പോൾ', r'പ്രഖ്യാപിച്ചപ്പോൾ'),
+    
+    # Fix the critical text for question 4
+    (r'ഈകാറ്റമായിതുടരുന്നത്വില', r'ഈ കാറ്റമായി തുടരുന്നത് വില'),
+    (r'വർദ്ധിപ്പിക്കാനും', r'വർദ്ധിപ്പിക്കാനും'),
+    (r'വാണിജ്യവിരുദ്ധപ്രതികരണങ്ങൾക്കും', r'വാണിജ്യ വിരুദ്ധ പ്രതികരണങ്ങൾക്കും'),
+    (r'വഴിതുറക്കുന്നു', r'വഴി തുറക്കുന്നു'),
+    
+    # General patterns for compound words, combined into one pass: zero-width
+    # positions where a space is inserted (neither rule can create a match for the other)
+    (
+        r'(?<=[^\s\u0D00-\u0D7F])(?=[ാിീുൂൃെേൊോൗൌ])'  # Add space before vowel signs
+        r'|(?<=്)(?=[കഖഗഘങചഛജഝഞടഠഡഢണതഥദധനപഫബഭമയരലവശഷസഹളഴറ])',  # Add space after virama
+        ' ',
+        'ാിീുൂൃെേൊോൗൌ്'
+    ),
+]
+
+
+def _build_malayalam_patterns(raw_patterns):
+    """
+    Compile the Malayalam fixes, folding the run of plain word substitutions
+    into one alternation so they cost a single pass over the text
+    
+    Args:
+        raw_patterns: Ordered (pattern, replacement[, trigger chars]) tuples
+        
+    Returns:
+        Ordered list of (compiled regex, replacement string or callable, requirements),
+        where requirements is a tuple of character sets - the pattern can only match
+        if one of them is fully present in the text - or None to always apply it
+    """
+    literal_fixes = {
+        pattern: replacement for pattern, replacement, *_ in raw_patterns
+        if re.escape(pattern) == pattern
+    }
+    active_words = [word for word, replacement in literal_fixes.items() if replacement != word]
+    # Longest first so overlapping words prefer the most specific fix
+    literal_re = re.compile('|'.join(
+        re.escape(word) for word in sorted(active_words, key=len, reverse=True)
+    ))
+    # A word can only occur if every one of its characters does
+    literal_requirements = tuple(frozenset(word) for word in active_words)
+    
+    compiled = []
+    literals_added = False
+    for pattern, replacement, *trigger in raw_patterns:
+        if pattern not in literal_fixes:
+            requirements = tuple(frozenset(ch) for ch in trigger[0]) if trigger else None
+            compiled.append((re.compile(pattern), replacement, requirements))
+        elif not literals_added:
+            compiled.append((literal_re, lambda m: literal_fixes[m.group(0)], literal_requirements))
+            literals_added = True
+    return compiled
+
+
+_MALAYALAM_PATTERNS = _build_malayalam_patterns(_RAW_MALAYALAM_PATTERNS)
+
+
+# Per-page complexity analyses keyed by a digest of the page's text layout, geometry
+# and image references (least recently used entries are evicted first)
+PAGE_ANALYSIS_CACHE_SIZE = 4096
+_page_analysis_cache: Dict[bytes, Dict[str, Any]] = {}
+
+def _page_signature(page, text_blocks: list, image_list: list) -> bytes:
+    """
+    Digest of a page built from data the analysis extracts anyway
+    
+    Text blocks carry both the text and its positions, so the key costs one hash
+    over values already in hand rather than another pass over the content stream.
+    """
+    hasher = xxhash.xxh3_128()
+    hasher.update(repr((tuple(page.rect), text_blocks, image_list)).encode())
+    return hasher.digest()
+
+def _get_page_analysis(signature: bytes) -> Optional[Dict[str, Any]]:
+    """Look up a cached page analysis, marking it most recently used"""
+    analysis = _page_analysis_cache.pop(signature, None)
+    if analysis is not None:
+        _page_analysis_cache[signature] = analysis
+    return analysis
+
+def _cache_page_analysis(signature: bytes, analysis: Dict[str, Any]) -> None:
+    """Store a page analysis, evicting the least recently used one when full"""
+    if len(_page_analysis_cache) >= PAGE_ANALYSIS_CACHE_SIZE:
+        _page_analysis_cache.pop(next(iter(_page_analysis_cache)), None)
+    _page_analysis_cache[signature] = analysis
+
+
+# Page triage scoring is a pure function of a few scalars, and pages in the same
+# document often repeat the same metrics, so both steps are memoized
+@lru_cache(maxsize=4096)
+def _complexity_score(text_length: int, table_count: int, image_count: int,
+                      image_coverage: float, text_block_count: int, page_area: float) -> float:
+    """Complexity score (0-10) - see DocumentProcessor._calculate_complexity_score"""
+    score = 0.0
+    
+    # Text analysis (higher text = simpler, unless very fragmented)
+    if text_length < 50:
+        score += 3.0  # Very little text, likely image-heavy
+    elif text_length < 200:
+        score += 2.0  # Limited text
+    elif text_length > 2000:
+        score += 0.5  # Lots of text, likely simple
+    else:
+        score += 1.0  # Moderate text
+    
+    # Table complexity
+    score += min(table_count * 2.0, 4.0)  # Up to 4 points for tables
+    
+    # Image complexity
+    score += min(image_count * 1.0, 3.0)  # Up to 3 points for images
+    score += min(image_coverage * 5.0, 3.0)  # Up to 3 points for coverage
+    
+    # Layout fragmentation (more blocks = more complex layout)
+    if text_block_count > 20:
+        score += 2.0  # Highly fragmented
+    elif text_block_count > 10:
+        score += 1.0  # Moderately fragmented
+    
+    return min(score, 10.0)
+
+
+@lru_cache(maxsize=4096)
+def _optimal_processing(complexity_score: float, text_length: int, has_tables: bool,
+                        image_count: int, image_coverage: float, hybrid_enabled: bool,
+                        text_threshold: int, table_extraction_method: str) -> str:
+    """Processing method for a page - see DocumentProcessor._determine_optimal_processing"""
+    if not hybrid_enabled:
+        return 'text'
+    
+    # Very simple pages: Fast PyMuPDF text extraction
+    if complexity_score <= 2.0 and not has_tables and image_count == 0:
+        return 'text'
+    
+    # Complex pages with tables/images: Use RapidOCR for now (docling disabled)
+    elif complexity_score >= 6.0 or (has_tables and image_count > 0):
+        return 'ocr'
+    
+    # Image-heavy pages with minimal text: OCR processing
+    elif text_length < text_threshold or image_coverage > 0.5:
+        return 'ocr'
+    
+    # Table-only pages: Targeted table extraction
+    elif has_tables and image_count == 0:
+        if table_extraction_method == "auto":
+            return 'pdfplumber'
+        else:
+            return table_extraction_method
+    
+    # Moderate complexity: Hybrid approach
+    elif complexity_score <= 5.0:
+        return 'text'  # Fast text extraction for moderate pages
+    
+    # Default to OCR for uncertain cases (docling disabled)
+    else:
+        return 'ocr'
+
 
 @dataclass
 class ProcessedDocument:
@@ -71,11 +528,12 @@ class DocumentProcessor:
         Returns:
             Cleaned text with proper word boundaries
         """
-        if not text:
+        # Pure ASCII text (the common English case) cannot contain Malayalam
+        if not text or text.isascii():
             return text
             
         # Check if text contains Malayalam characters (Unicode range 0x0D00-0x0D7F)
-        has_malayalam = bool(re.search(r'[\u0D00-\u0D7F]', text))
+        has_malayalam = _MALAYALAM_RANGE_RE.search(text) is not None
         
         if not has_malayalam:
             return text
@@ -86,39 +544,18 @@ class DocumentProcessor:
         cleaned_text = text
         
         # Add spaces around Malayalam punctuation and English words
-        malayalam_patterns = [
-            # Add space before Malayalam numbers and dates
-            (r'(\d+)([^\s\d\u0D00-\u0D7F])', r'\1 \2'),
-            
-            # Add space around key Malayalam terms that are often merged
-            (r'യുഎസ്സ്പ്രസിഡൻറ്', r'യുഎസ് പ്രസിഡൻറ്'),
-            (r'ഡോണൾഡ്ട്രംപ്', r'ഡോണൾഡ് ട്രംപ്'),
-            (r'കമ്പ്യൂട്ടർചിപ്പുകളുടെയും', r'കമ്പ്യൂട്ടർ ചിപ്പുകളുടെയും'),
-            (r'സെമിക്കണ്ടക്ടറുകളുടെയും', r'സെമിക്കണ്ടക്ടറുകളുടെയും'),
-            (r'അമേരിക്കൻഅന്തർസ്ഥാപന', r'അമേരിക്കൻ അന്തർസ്ഥാപന'),
-            (r'നിർമ്മാണംതാക്കോൽപ്പെടുത്തുകയും', r'നിർമ്മാണം ശക്തിപ്പെടുത്തുകയും'),
-            (r'ആശ്രിതത്വംകുറയ്ക്കുകയും', r'ആശ്രിതത്വം കുറയ്ക്കുകയും'),
-            (r'ബില്യൻഡോളർയുടെ', r'ബില്യൺ ഡോളർയുടെ'),
-            (r'ആഗാമിനിക്ഷേപം', r'ഭാവി നിക്ഷേപം'),
-            (r'പ്രഖ്യാപിച്ചപ്പോൾ', r'പ്രഖ്യാപിച്ചപ്പോൾ'),
-            
-            # Fix the critical text for question 4
-            (r'ഈകാറ്റമായിതുടരുന്നത്വില', r'ഈ കാറ്റമായി തുടരുന്നത് വില'),
-            (r'വർദ്ധിപ്പിക്കാനും', r'വർദ്ധിപ്പിക്കാനും'),
-            (r'വാണിജ്യവിരുദ്ധപ്രതികരണങ്ങൾക്കും', r'വാണിജ്യ വിരুദ്ധ പ്രതികരണങ്ങൾക്കും'),
-            (r'വഴിതുറക്കുന്നു', r'വഴി തുറക്കുന്നു'),
-            
-            # General patterns for compound words
-            (r'([^\s\u0D00-\u0D7F])([ാിീുൂൃെേൊോൗൌ])', r'\1 \2'),  # Add space before vowel signs
-            (r'([്])([കഖഗഘങചഛജഝഞടഠഡഢണതഥദധനപഫബഭമയരലവശഷസഹളഴറ])', r'\1 \2'),  # Add space after virama
-        ]
-        
-        for pattern, replacement in malayalam_patterns:
-            cleaned_text = re.sub(pattern, replacement, cleaned_text)
-        
-        # Clean up multiple spaces
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
-        cleaned_text = cleaned_text.strip()
+        # Skip patterns whose required characters never occur in the text; the
+        # character set is refreshed whenever a substitution changes the text
+        present = set(cleaned_text)
+        for rx, replacement, requirements in _MALAYALAM_PATTERNS:
+            if requirements is not None and not any(chars <= present for chars in requirements):
+                continue
+            cleaned_text, count = rx.subn(replacement, cleaned_text)
+            if count:
+                present = set(cleaned_text)
+        
+        # Clean up multiple spaces (split/join collapses and strips in C)
+        cleaned_text = ' '.join(cleaned_text.split())
         
         # Log improvement if significant changes were made
         if len(cleaned_text) != len(text) or cleaned_text != text:
@@ -142,39 +579,68 @@ class DocumentProcessor:
         Returns:
             Language code (e.g., 'malayalam', 'hindi', 'tamil', 'english', 'mixed')
         """
+        return self.detect_language_with_ratio(text)[0]
+    
+    def detect_language_with_ratio(self, text: str) -> Tuple[str, float]:
+        """
+        Detect the primary language along with how much of the text is non-Latin script
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Tuple of (language code, share of letters that are Indic script, 0.0-1.0)
+        """
         if not text or not text.strip():
-            return 'english'
+            return 'english', 0.0
+        
+        # Pure ASCII text has no Indic script characters - no need to scan or hash it
+        if text.isascii():
+            return 'english', 0.0
+        
+        # The same document text is usually classified more than once (translation
+        # check, then final metadata), so remember recent results by content digest
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        result = _language_cache.pop(key, None)
+        if result is None:
+            result = self._classify_language(text)
+        _language_cache[key] = result
+        if len(_language_cache) > LANGUAGE_CACHE_SIZE:
+            _language_cache.pop(next(iter(_language_cache)), None)
+        return result
+    
+    def _classify_language(self, text: str) -> Tuple[str, float]:
+        """
+        Classify text by its dominant Unicode script (uncached)
         
+        Args:
+            text: Non-empty text to analyze
+            
+        Returns:
+            Tuple of (language code, share of letters that are Indic script)
+        """
         # Count characters in different language scripts
-        lang_counts = {
-            'malayalam': len(re.findall(r'[\u0D00-\u0D7F]', text)),
-            'hindi': len(re.findall(r'[\u0900-\u097F]', text)),
-            'tamil': len(re.findall(r'[\u0B80-\u0BFF]', text)),
-            'bengali': len(re.findall(r'[\u0980-\u09FF]', text)),
-            'telugu': len(re.findall(r'[\u0C00-\u0C7F]', text)),
-            'gujarati': len(re.findall(r'[\u0A80-\u0AFF]', text)),
-            'punjabi': len(re.findall(r'[\u0A00-\u0A7F]', text)),
-            'kannada': len(re.findall(r'[\u0C80-\u0CFF]', text)),
-        }
+        lang_counts, latin_chars = _script_histogram(text)
         
         # Find the dominant language
         total_non_latin = sum(lang_counts.values())
-        latin_chars = len(re.findall(r'[a-zA-Z]', text))
         
         if total_non_latin == 0:
-            return 'english'
+            return 'english', 0.0
+        
+        script_ratio = total_non_latin / (total_non_latin + latin_chars)
         
         # If mixed content, return 'mixed'
         if latin_chars > 0 and total_non_latin > 0:
             dominant_lang = max(lang_counts, key=lang_counts.get)
             if lang_counts[dominant_lang] > latin_chars:
-                return dominant_lang
+                return dominant_lang, script_ratio
             else:
-                return 'mixed'
+                return 'mixed', script_ratio
         
         # Return the language with the most characters
         dominant_lang = max(lang_counts, key=lang_counts.get)
-        return dominant_lang if lang_counts[dominant_lang] > 0 else 'english'
+        return (dominant_lang, script_ratio) if lang_counts[dominant_lang] > 0 else ('english', 0.0)
 
     async def translate_text_to_english(self, text: str, source_language: str = None) -> str:
         """
@@ -191,12 +657,18 @@ class DocumentProcessor:
             return text
         
         # Auto-detect language if not provided
+        detected_language, script_ratio = self.detect_language_with_ratio(text)
         if source_language is None:
-            source_language = self.detect_language(text)
+            source_language = detected_language
         
         # Skip translation if already English
         if source_language == 'english':
             return text
+        
+        # Mostly-English text with a few embedded Indic characters is not worth an LLM call
+        if script_ratio < settings.translation_min_script_ratio:
+            debug_print(f"Skipping translation: only {script_ratio:.0%} of letters are {source_language} script")
+            return text
             
         debug_print(f"Translating {source_language} text to English: {len(text)} characters")
         
@@ -219,49 +691,27 @@ class DocumentProcessor:
             
             lang_name = language_names.get(source_language, source_language.title())
             
-            # Literal translation prompt for accurate cross-language processing
-            translation_prompt = f"""Translate the following {lang_name} text to English with complete literal accuracy.
-
-CRITICAL REQUIREMENTS:
-- Translate EXACTLY as stated in the original text - do not add or remove specificity
-- Preserve ALL qualifying terms like "foreign-made", "domestic", "imported", "manufactured", "produced"
-- Keep precise distinctions between products vs companies vs manufacturing processes
-- Maintain exact subject references (if original says "computers", keep "computers" not "companies")
-- Preserve ALL qualifying context and conditions exactly as written
-- For exemptions and exceptions: preserve exact subjects ("computers manufactured" vs "companies committed")
-- Do not enhance, expand, or interpret the meaning beyond what is explicitly stated
-- Maintain the document's natural phrasing and terminology level
-
-EXAMPLES of good translation:
-- വില വർദ്ധന → "cost increases" (preserve original generality level)  
-- ഉപഭോക്താക്കൾക്ക് → "for consumers" (specify the target)
-- വാണിജ്യ പ്രതികരണങ്ങൾ → "trade retaliations" (literal translation without expansion)
-
-Translate this {lang_name} economic/policy text:
-{text}
-
-English translation:"""
-            
-            copilot_provider = get_copilot_provider(max_tokens=min(len(text) * 3, 4000))
-            
-            response = await copilot_provider.generate_answer(
-                prompt=translation_prompt,
-                temperature=0.1  # Low temperature for consistent translation
+            # Translate paragraph-aligned chunks concurrently; the provider's QPS is
+            # bounded by the semaphore and chunk order is preserved by gather
+            chunks = _split_paragraphs(text, settings.translation_chunk_chars)
+            copilot_provider = get_copilot_provider(
+                max_tokens=min(max(len(chunk) for chunk, _ in chunks) * 3, 4000)
+            )
+            semaphore = asyncio.Semaphore(settings.translation_concurrency)
+            
+            if len(chunks) > 1:
+                debug_print(f"Translating in {len(chunks)} parallel chunks")
+            
+            translated_chunks = await asyncio.gather(*(
+                self._translate_chunk(copilot_provider, semaphore, lang_name, chunk)
+                for chunk, _ in chunks
+            ))
+            # Rejoin with the separators from the source, so hard-split paragraphs
+            # are not given paragraph breaks they did not have
+            translated_text = "".join(
+                translated + separator
+                for translated, (_, separator) in zip(translated_chunks, chunks)
             )
-            
-            if response.error:
-                debug_print(f"Translation failed: {response.error}")
-                return text  # Return original text if translation fails
-            
-            translated_text = response.content.strip()
-            
-            # Basic validation - ensure we got a reasonable translation
-            if len(translated_text) < len(text) * 0.2:  # Translation too short, likely failed
-                debug_print("Translation appears too short, using original text")
-                return text
-                
-            # Remove common translation artifacts
-            translated_text = re.sub(r'^(English translation:|Translation:)', '', translated_text, flags=re.IGNORECASE).strip()
             
             debug_print(f"Translation successful: {len(text)} → {len(translated_text)} chars")
             return translated_text
@@ -270,6 +720,58 @@ English translation:"""
             debug_print(f"Translation error: {e}")
             return text  # Fallback to original text
     
+    async def _translate_chunk(self, copilot_provider, semaphore: asyncio.Semaphore,
+                               lang_name: str, text: str) -> str:
+        """
+        Translate one chunk of text, falling back to the original chunk on failure
+        
+        Args:
+            copilot_provider: Copilot provider used for the request
+            semaphore: Bounds concurrent translation requests
+            lang_name: Display name of the source language
+            text: Chunk to translate
+            
+        Returns:
+            English translation of the chunk (or the chunk itself if translation failed)
+        """
+        # Repeated chunks (headers, footers, reprocessed documents) reuse earlier translations
+        cache_key = hashlib.blake2b(
+            f"{lang_name}\0{text}".encode('utf-8', 'surrogatepass'), digest_size=16
+        ).hexdigest()
+        cached = await _get_cached_translation(cache_key)
+        if cached is not None:
+            return cached
+        
+        # Literal translation prompt for accurate cross-language processing
+        translation_prompt = _TRANSLATION_PROMPT.format(lang_name=lang_name, text=text)
+        
+        try:
+            async with semaphore:
+                response = await copilot_provider.generate_answer(
+                    prompt=translation_prompt,
+                    temperature=0.1  # Low temperature for consistent translation
+                )
+        except Exception as e:
+            debug_print(f"Translation error: {e}")
+            return text
+        
+        if response.error:
+            debug_print(f"Translation failed: {response.error}")
+            return text  # Return original text if translation fails
+        
+        translated_text = response.content.strip()
+        
+        # Basic validation - ensure we got a reasonable translation
+        if len(translated_text) < len(text) * 0.2:  # Translation too short, likely failed
+            debug_print("Translation appears too short, using original text")
+            return text
+            
+        # Remove common translation artifacts
+        translated_text = _ARTIFACT_RE.sub('', translated_text).strip()
+        
+        await _cache_translation(cache_key, translated_text)
+        return translated_text
+    
     async def download_pdf(self, url: str) -> bytes:
         """
         Download PDF from URL or read from local/uploaded file with proper error handling
@@ -321,15 +823,19 @@ English translation:"""
             
             print(f"Reading local file: {file_path}")
             
+            # A single stat answers existence, type and size
+            file_stat = _stat_local_file(file_path)
+            
             # If file doesn't exist, try looking for files with URL-encoded names
-            if not file_path.exists():
+            if file_stat is None:
                 # Try to find the file with different encoding patterns
                 parent_dir = file_path.parent
                 filename = file_path.name
                 
                 print(f"File not found, searching for alternatives in: {parent_dir}")
                 
-                if parent_dir.exists():
+                listing = _list_directory(parent_dir)
+                if listing is not None:
                     # Look for files with similar names (handling URL encoding variations)
                     
                     # Try different encoding patterns
@@ -340,45 +846,53 @@ English translation:"""
                         urllib.parse.unquote(filename),  # URL decode (in case it's double-encoded)
                     ]
                     
-                    for pattern in search_patterns:
-                        potential_files = list(parent_dir.glob(f"*{pattern.split('_')[0]}*"))  # Match by prefix
-                        if potential_files:
-                            file_path = potential_files[0]
-                            print(f"Found alternative file: {file_path}")
-                            break
-            
-            # Check if file exists
-            if not file_path.exists():
+                    # Exact name under any encoding first, then match by prefix
+                    alternative = next(
+                        (listing[pattern] for pattern in search_patterns if pattern in listing), None
+                    )
+                    if alternative is None:
+                        for pattern in search_patterns:
+                            prefix = pattern.split('_')[0]
+                            alternative = next(
+                                (path for name, path in listing.items() if prefix in name), None
+                            )
+                            if alternative is not None:
+                                break
+                    
+                    if alternative is not None:
+                        file_path = alternative
+                        print(f"Found alternative file: {file_path}")
+                        file_stat = _stat_local_file(file_path)
+            
+            if file_stat is None:
                 raise HTTPException(
                     status_code=404,
                     detail=f"Local file not found: {file_path}"
                 )
             
             # Check if it's actually a file (not a directory)
-            if not file_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 raise HTTPException(
                     status_code=400,
                     detail=f"Path is not a file: {file_path}"
                 )
             
-            # Basic security check - ensure file is readable
-            if not os.access(file_path, os.R_OK):
-                raise HTTPException(
-                    status_code=403,
-                    detail=f"Permission denied: Cannot read file {file_path}"
-                )
-            
             # Check file size before reading
-            file_size = file_path.stat().st_size
+            file_size = file_stat.st_size
             if file_size > settings.max_file_size:
                 raise HTTPException(
                     status_code=413,
                     detail=f"File too large: {file_size:,} bytes (max: {settings.max_file_size:,})"
                 )
             
-            # Read the file
-            with open(file_path, 'rb') as f:
-                content = f.read()
+            # Read the file off the event loop; open() doubles as the permission check
+            try:
+                content = await asyncio.to_thread(file_path.read_bytes)
+            except PermissionError:
+                raise HTTPException(
+                    status_code=403,
+                    detail=f"Permission denied: Cannot read file {file_path}"
+                )
             
             print(f"Read local PDF: {len(content):,} bytes from {local_path}")
             return content
@@ -455,28 +969,42 @@ English translation:"""
         conditional_print(f"WARNING: _download_remote_file called with URL: {url}")
         
         try:
-            timeout = aiohttp.ClientTimeout(total=settings.download_timeout)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                conditional_print(f"Attempting aiohttp GET request to: {url}")
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Failed to download: HTTP {response.status}"
-                        )
-                    
-                    content = await response.read()
-                    
-                    # Validate file size
-                    if len(content) > settings.max_file_size:
+            session = _get_http_session()
+            conditional_print(f"Attempting aiohttp GET request to: {url}")
+            async with session.get(url) as response:
+                if response.status != 200:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Failed to download: HTTP {response.status}"
+                    )
+                
+                max_size = settings.max_file_size
+                
+                # Reject up front when the server announces an oversized body
+                declared_size = response.content_length
+                if declared_size is not None and declared_size > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large: {declared_size} bytes (max: {max_size})"
+                    )
+                
+                # Stream the body so an oversized download is aborted as soon as
+                # it crosses the limit instead of being buffered in full first
+                content = bytearray()
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    content.extend(chunk)
+                    if len(content) > max_size:
+                        response.close()
                         raise HTTPException(
                             status_code=413,
-                            detail=f"File too large: {len(content)} bytes (max: {settings.max_file_size})"
+                            detail=f"File too large: more than {max_size} bytes (max: {max_size})"
                         )
-                    
-                    conditional_print(f"Downloaded PDF: {len(content):,} bytes")
-                    return content
-                    
+                
+                conditional_print(f"Downloaded PDF: {len(content):,} bytes")
+                return bytes(content)
+                
+        except HTTPException:
+            raise
         except aiohttp.ClientError as e:
             raise HTTPException(status_code=400, detail=f"Download failed: {str(e)}")
         except Exception as e:
@@ -493,13 +1021,13 @@ English translation:"""
             Dict with text, pages, and metadata
         """
         start_time = time.time()
-        print(f"Starting PDF processing... (File size: {len(pdf_data):,} bytes)")
+        debug_print("Starting PDF processing... (File size: %d bytes)", len(pdf_data))
         
         try:
             # Open PDF from bytes
             pdf_doc = pymupdf.open(stream=pdf_data, filetype="pdf")
             open_time = time.time() - start_time
-            print(f"PDF opened in {open_time:.2f}s")
+            debug_print("PDF opened in %.2fs", open_time)
             
             # Extract text from all pages using intelligent hybrid processing
             text_parts = []
@@ -515,16 +1043,13 @@ English translation:"""
             complexity_distribution = {'simple': 0, 'moderate': 0, 'complex': 0}
             processing_times = {}
             
-            for page_num in range(pdf_doc.page_count):
-                page = pdf_doc[page_num]
-                page_start_time = time.time()
-                
-                if settings.enable_hybrid_processing:
-                    # Intelligent page complexity analysis
-                    analysis = self._analyze_page_complexity(page)
-                    processing_method = analysis['processing_method']
-                    complexity_score = analysis['complexity_score']
-                    
+            if settings.parallel_pdf_pages and pdf_doc.page_count >= PARALLEL_PDF_MIN_PAGES:
+                page_results = self._extract_pages_parallel(pdf_doc, pdf_data)
+            else:
+                page_results = self._extract_page_range(pdf_doc, pdf_data, range(pdf_doc.page_count))
+            
+            for page_num, (page_text, processing_method, analysis, page_time) in enumerate(page_results):
+                if analysis is not None:
                     # Update statistics
                     processing_stats[processing_method] += 1
                     if analysis['is_simple']:
@@ -533,89 +1058,41 @@ English translation:"""
                         complexity_distribution['complex'] += 1
                     else:
                         complexity_distribution['moderate'] += 1
-                    
-                    print(f"  Page {page_num + 1}: Using {processing_method} processing "
-                          f"(complexity: {complexity_score:.1f}, text: {analysis['text_length']} chars, "
-                          f"tables: {analysis['table_count']}, images: {analysis['image_count']})")
-                    
-                    # Process page based on intelligent analysis
-                    if processing_method == 'pdfplumber':
-                        # Use PDFPlumber for table extraction (primary method)
-                        page_text = page.get_text()  # Get basic text
-                        table_text = self.extract_tables_with_pdfplumber(pdf_data, page_num + 1)
-                        
-                        # If PDFPlumber extraction is insufficient, note it but continue
-                        if not table_text or len(table_text.strip()) < 50:
-                            print(f"  Page {page_num + 1}: PDFPlumber table extraction insufficient")
-                        
-                        if table_text:
-                            page_text = f"{page_text}\n\n{table_text}"
-                    
-                    elif processing_method == 'pymupdf_table':
-                        # Use PyMuPDF table extraction
-                        page_text = page.get_text()  # Get basic text
-                        table_text = self.extract_tables_with_pymupdf(page)
-                        if table_text:
-                            page_text = f"{page_text}\n\n{table_text}"
-                    
-                    elif processing_method == 'ocr':
-                        # Use OCR for image-heavy pages
-                        page_text = self.extract_text_with_ocr(page)
-                        if not page_text or len(page_text.strip()) < 50:
-                            # Fallback to basic text if OCR fails
-                            page_text = page.get_text()
-                    
-                    else:  # processing_method == 'text'
-                        # Fast PyMuPDF text extraction for simple pages
-                        page_text = page.get_text()
-                
-                else:
-                    # Legacy processing (fallback for disabled hybrid mode)
-                    page_text = page.get_text()
-                    
-                    # OCR fallback for pages with minimal text
-                    if len(page_text.strip()) < settings.text_threshold:
-                        print(f"  Page {page_num + 1}: Minimal text detected ({len(page_text)} chars), attempting OCR...")
-                        ocr_text = self.extract_text_with_ocr(page)
-                        if len(ocr_text.strip()) > len(page_text.strip()):
-                            print(f"  Page {page_num + 1}: OCR extracted {len(ocr_text)} chars (vs {len(page_text)} native)")
-                            page_text = ocr_text
-                        else:
-                            print(f"  Page {page_num + 1}: OCR didn't improve extraction")
                 
                 # Track per-page processing time
-                page_time = time.time() - page_start_time
                 if processing_method not in processing_times:
                     processing_times[processing_method] = []
                 processing_times[processing_method].append(page_time)
                 
-                page_texts.append(f"--- Page {page_num + 1} ---\n{page_text}")
+                if settings.return_page_texts:
+                    page_texts.append(f"--- Page {page_num + 1} ---\n{page_text}")
                 text_parts.append(page_text)
             
-            # Print intelligent processing statistics
-            if settings.enable_hybrid_processing:
-                print("Intelligent Processing Statistics:")
+            # Print intelligent processing statistics (one summary instead of per-page output;
+            # skipped entirely when nothing would be printed)
+            if settings.enable_hybrid_processing and settings.debug_mode:
+                info_print("Intelligent Processing Statistics:")
                 total_pages = sum(processing_stats.values())
                 
                 # Processing method distribution
-                print("Processing method distribution:")
+                info_print("Processing method distribution:")
                 for method, count in processing_stats.items():
                     if count > 0:
                         avg_time = sum(processing_times.get(method, [])) / len(processing_times.get(method, [1]))
-                        print(f"  - {method}: {count} pages ({count/total_pages*100:.1f}%) "
+                        info_print(f"  - {method}: {count} pages ({count/total_pages*100:.1f}%) "
                               f"avg: {avg_time:.2f}s")
                 
                 # Complexity distribution
                 total_analyzed = sum(complexity_distribution.values())
                 if total_analyzed > 0:
-                    print("Page complexity distribution:")
+                    info_print("Page complexity distribution:")
                     for complexity, count in complexity_distribution.items():
-                        print(f"  - {complexity}: {count} pages ({count/total_analyzed*100:.1f}%)")
+                        info_print(f"  - {complexity}: {count} pages ({count/total_analyzed*100:.1f}%)")
                 
                 # Performance summary
                 if processing_times:
                     total_processing_time = sum([sum(times) for times in processing_times.values()])
-                    print(f"Total processing time: {total_processing_time:.2f}s "
+                    info_print(f"Total processing time: {total_processing_time:.2f}s "
                           f"({total_processing_time/total_pages:.2f}s per page)")
                     
                     # Efficiency analysis
@@ -623,7 +1100,7 @@ English translation:"""
                     complex_pages = complexity_distribution.get('complex', 0)
                     if simple_pages > 0 and complex_pages > 0:
                         efficiency_gain = (simple_pages * 2.0) / total_pages  # Estimated 2x speedup for simple pages
-                        print(f"Estimated efficiency gain from intelligent triage: {efficiency_gain:.1f}x")
+                        info_print(f"Estimated efficiency gain from intelligent triage: {efficiency_gain:.1f}x")
             
             # Combine all text
             full_text = "\n".join(text_parts)
@@ -636,7 +1113,7 @@ English translation:"""
             pdf_doc.close()
             
             extract_time = time.time() - start_time
-            print(f"Text extracted from {page_count} pages in {extract_time:.2f}s")
+            info_print("Text extracted from %d pages in %.2fs", page_count, extract_time)
             
             return {
                 "text": full_text,
@@ -649,12 +1126,170 @@ English translation:"""
                     "file_size": len(pdf_data),
                     "processing_time_seconds": extract_time
                 },
-                "page_texts": page_texts  # For debugging/validation
+                "page_texts": page_texts  # For debugging/validation (empty unless return_page_texts)
             }
             
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"PDF processing failed: {str(e)}")
     
+    def _extract_page(self, pdf_doc, pdf_data: bytes, page_num: int, defer_ocr: bool = False):
+        """
+        Extract the text of a single PDF page using intelligent hybrid processing
+        
+        Args:
+            pdf_doc: Open PyMuPDF document
+            pdf_data: PDF content as bytes (needed by pdfplumber)
+            page_num: Zero-based page index
+            defer_ocr: Return the native text for pages routed to OCR and leave the OCR
+                itself to the caller (see _extract_page_range)
+            
+        Returns:
+            Tuple of (page_text, processing_method, complexity analysis or None, page_time)
+        """
+        page = pdf_doc[page_num]
+        page_start_time = time.time()
+        
+        if settings.enable_hybrid_processing:
+            # Intelligent page complexity analysis (also keeps the page text and
+            # detected tables so they are not recomputed below)
+            page_cache = {}
+            analysis = self._analyze_page_complexity(page, page_cache)
+            base_text = page_cache['text'] if 'text' in page_cache else page.get_text()
+            processing_method = analysis['processing_method']
+            complexity_score = analysis['complexity_score']
+            
+            debug_print("  Page %d: Using %s processing (complexity: %.1f, text: %d chars, tables: %d, images: %d)",
+                        page_num + 1, processing_method, complexity_score, analysis['text_length'],
+                        analysis['table_count'], analysis['image_count'])
+            
+            # Process page based on intelligent analysis
+            if processing_method == 'pdfplumber':
+                # Use PDFPlumber for table extraction (primary method)
+                page_text = base_text
+                table_text = self.extract_tables_with_pdfplumber(pdf_data, page_num + 1)
+                
+                # If PDFPlumber extraction is insufficient, note it but continue
+                if not table_text or len(table_text.strip()) < 50:
+                    debug_print("  Page %d: PDFPlumber table extraction insufficient", page_num + 1)
+                
+                if table_text:
+                    page_text = f"{page_text}\n\n{table_text}"
+            
+            elif processing_method == 'pymupdf_table':
+                # Use PyMuPDF table extraction
+                page_text = base_text
+                table_text = self.extract_tables_with_pymupdf(page, page_cache.get('tables'))
+                if table_text:
+                    page_text = f"{page_text}\n\n{table_text}"
+            
+            elif processing_method == 'ocr' and defer_ocr:
+                # Placeholder - the caller OCRs these pages together in one batch
+                page_text = base_text
+            
+            elif processing_method == 'ocr':
+                # Use OCR for image-heavy pages
+                page_text = self.extract_text_with_ocr(page)
+                if not page_text or len(page_text.strip()) < 50:
+                    # Fallback to basic text if OCR fails
+                    page_text = base_text
+            
+            else:  # processing_method == 'text'
+                # Fast PyMuPDF text extraction for simple pages
+                page_text = base_text
+        
+        else:
+            # Legacy processing (fallback for disabled hybrid mode)
+            analysis = None
+            processing_method = 'text'
+            page_text = page.get_text()
+            
+            # OCR fallback for pages with minimal text
+            if len(page_text.strip()) < settings.text_threshold:
+                debug_print("  Page %d: Minimal text detected (%d chars), attempting OCR...", page_num + 1, len(page_text))
+                ocr_text = self.extract_text_with_ocr(page)
+                if len(ocr_text.strip()) > len(page_text.strip()):
+                    debug_print("  Page %d: OCR extracted %d chars (vs %d native)", page_num + 1, len(ocr_text), len(page_text))
+                    page_text = ocr_text
+                else:
+                    debug_print("  Page %d: OCR didn't improve extraction", page_num + 1)
+        
+        return page_text, processing_method, analysis, time.time() - page_start_time
+    
+    def _extract_page_range(self, pdf_doc, pdf_data: bytes, page_nums) -> list:
+        """
+        Extract several pages, running OCR for all OCR-routed pages as one batch
+        
+        Args:
+            pdf_doc: Open PyMuPDF document
+            pdf_data: PDF content as bytes
+            page_nums: Zero-based page indices, in output order
+            
+        Returns:
+            List of per-page results as returned by _extract_page
+        """
+        page_results = [
+            list(self._extract_page(pdf_doc, pdf_data, page_num, defer_ocr=True))
+            for page_num in page_nums
+        ]
+        
+        # Only the hybrid path defers OCR; its placeholder text is the native page text
+        ocr_indices = [
+            i for i, (_, method, analysis, _) in enumerate(page_results)
+            if method == 'ocr' and analysis is not None
+        ]
+        if ocr_indices:
+            ocr_start = time.time()
+            ocr_texts = self.extract_text_with_ocr_batch(
+                [pdf_doc[page_nums[i]] for i in ocr_indices]
+            )
+            ocr_time_per_page = (time.time() - ocr_start) / len(ocr_indices)
+            
+            for i, ocr_text in zip(ocr_indices, ocr_texts):
+                # Keep the native text if OCR fails
+                if ocr_text and len(ocr_text.strip()) >= 50:
+                    page_results[i][0] = ocr_text
+                page_results[i][3] += ocr_time_per_page
+        
+        return [tuple(result) for result in page_results]
+    
+    def _extract_pages_parallel(self, pdf_doc, pdf_data: bytes) -> list:
+        """
+        Extract PDF pages across worker processes, preserving page order
+        
+        If a worker dies, the pool is discarded and the document is extracted
+        in-process instead.
+        
+        Args:
+            pdf_doc: Open PyMuPDF document
+            pdf_data: PDF content as bytes
+            
+        Returns:
+            List of per-page results as returned by _extract_page
+        """
+        page_count = pdf_doc.page_count
+        workers = min(os.cpu_count() or 1, page_count)
+        # Contiguous page ranges so each worker opens the document only once
+        step = -(-page_count // workers)
+        ranges = [(start, min(start + step, page_count)) for start in range(0, page_count, step)]
+        
+        debug_print("Extracting %d pages with %d worker processes", page_count, len(ranges))
+        executor = _get_page_executor()
+        try:
+            futures = [
+                executor.submit(_extract_pdf_page_range, pdf_data, start, stop)
+                for start, stop in ranges
+            ]
+            
+            page_results = []
+            for future in futures:
+                page_results.extend(future.result())
+            return page_results
+        
+        except BrokenProcessPool as e:
+            info_print("Page worker pool failed (%s), extracting in-process", e)
+            _discard_page_executor(executor)
+            return self._extract_page_range(pdf_doc, pdf_data, range(page_count))
+    
     def analyze_page_content(self, page) -> Dict[str, Any]:
         """
         Analyze page content to determine optimal processing strategy
@@ -700,33 +1335,79 @@ English translation:"""
                 'is_image_heavy': False
             }
     
-    def _analyze_page_complexity(self, page) -> Dict[str, Any]:
+    def _analyze_page_complexity(self, page, page_cache: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Intelligent per-page complexity analysis for optimal processing triage
         
         Args:
             page: PyMuPDF page object
+            page_cache: Optional dict that receives the extracted 'text' and detected
+                'tables' so callers can reuse them instead of re-running extraction
             
         Returns:
             Dict containing complexity analysis and processing recommendation
         """
+        text_length = 0
         try:
-            # Fast initial scan for basic metrics
-            text_content = page.get_text()
+            # Fast initial scan for basic metrics. One TextPage serves both the plain
+            # text and the block scan below, so the content stream is parsed once
+            textpage = page.get_textpage(flags=pymupdf.TEXTFLAGS_TEXT)
+            text_content = textpage.extractText()
             text_length = len(text_content)
+            if page_cache is not None:
+                page_cache['text'] = text_content
+            
+            # Skip the table/image/block scans when the text alone fixes the route:
+            # without hybrid processing every page is 'text', and a page with almost
+            # no text scores >= 3.0 and falls under text_threshold, so it goes to OCR
+            page_area = page.rect.width * page.rect.height
+            if not settings.enable_hybrid_processing:
+                processing_method = 'text'
+            elif text_length < 50 and text_length < settings.text_threshold:
+                processing_method = 'ocr'
+            else:
+                processing_method = None
+            
+            if processing_method is not None:
+                complexity_score = self._calculate_complexity_score(
+                    text_length, 0, 0, 0.0, 0, page_area
+                )
+                analysis = {
+                    'text_length': text_length,
+                    'table_count': 0,
+                    'has_tables': False,
+                    'image_count': 0,
+                    'image_coverage': 0.0,
+                    'text_block_count': 0,
+                    'complexity_score': complexity_score,
+                    'processing_method': processing_method,
+                    'page_area': page_area,
+                    'is_simple': processing_method == 'text' and complexity_score <= 2.0,
+                    'is_complex': processing_method == 'ocr',  # Scanned/image-only page
+                    'confidence': 1.0
+                }
+                return analysis
+            
+            # Re-ingested documents reuse the analysis of identical pages, skipping the
+            # table detection and image bbox scans below (page_cache['text'] is already
+            # filled; a hit leaves 'tables' unset, so table extraction finds them itself)
+            text_blocks = textpage.extractBLOCKS()
+            image_list = page.get_images()
+            signature = _page_signature(page, text_blocks, image_list)
+            cached = _get_page_analysis(signature)
+            if cached is not None:
+                return dict(cached)
             
             # Table detection using PyMuPDF's fast method
             table_finder = page.find_tables()
             tables = list(table_finder)
             table_count = len(tables)
-            has_tables = table_count > 0
             
-            # Visual complexity assessment
-            page_rect = page.rect
-            page_area = page_rect.width * page_rect.height
+            if page_cache is not None:
+                page_cache['tables'] = tables
+            has_tables = table_count > 0
             
             # Image detection and analysis
-            image_list = page.get_images()
             image_count = len(image_list)
             
             # Calculate image coverage ratio
@@ -744,7 +1425,6 @@ English translation:"""
                         image_coverage += 0.1  # Assume 10% per image
             
             # Text density analysis
-            text_blocks = page.get_text("blocks")
             text_block_count = len([block for block in text_blocks if block[4].strip()])
             
             # Layout complexity scoring
@@ -758,7 +1438,7 @@ English translation:"""
                 complexity_score, text_length, has_tables, image_count, image_coverage
             )
             
-            return {
+            analysis = {
                 'text_length': text_length,
                 'table_count': table_count,
                 'has_tables': has_tables,
@@ -773,11 +1453,14 @@ English translation:"""
                 'confidence': min(abs(complexity_score - 4.0) / 4.0, 1.0)
             }
             
+            _cache_page_analysis(signature, analysis)
+            return dict(analysis)
+            
         except Exception as e:
             print(f"Page complexity analysis failed: {e}")
             # Fallback to simple text processing
             return {
-                'text_length': len(page.get_text()) if page else 0,
+                'text_length': text_length,
                 'table_count': 0,
                 'has_tables': False,
                 'image_count': 0,
@@ -802,32 +1485,9 @@ English translation:"""
         3-5: Moderate complexity → Hybrid approach
         6-10: Complex layouts → Full docling pipeline
         """
-        score = 0.0
-        
-        # Text analysis (higher text = simpler, unless very fragmented)
-        if text_length < 50:
-            score += 3.0  # Very little text, likely image-heavy
-        elif text_length < 200:
-            score += 2.0  # Limited text
-        elif text_length > 2000:
-            score += 0.5  # Lots of text, likely simple
-        else:
-            score += 1.0  # Moderate text
-        
-        # Table complexity
-        score += min(table_count * 2.0, 4.0)  # Up to 4 points for tables
-        
-        # Image complexity
-        score += min(image_count * 1.0, 3.0)  # Up to 3 points for images
-        score += min(image_coverage * 5.0, 3.0)  # Up to 3 points for coverage
-        
-        # Layout fragmentation (more blocks = more complex layout)
-        if text_block_count > 20:
-            score += 2.0  # Highly fragmented
-        elif text_block_count > 10:
-            score += 1.0  # Moderately fragmented
-        
-        return min(score, 10.0)
+        return _complexity_score(
+            text_length, table_count, image_count, image_coverage, text_block_count, page_area
+        )
     
     def _determine_optimal_processing(self, complexity_score: float, text_length: int,
                                     has_tables: bool, image_count: int, 
@@ -835,50 +1495,28 @@ English translation:"""
         """
         Determine optimal processing method based on complexity analysis
         """
-        if not settings.enable_hybrid_processing:
-            return 'text'
-        
-        # Very simple pages: Fast PyMuPDF text extraction
-        if complexity_score <= 2.0 and not has_tables and image_count == 0:
-            return 'text'
-        
-        # Complex pages with tables/images: Use RapidOCR for now (docling disabled)
-        elif complexity_score >= 6.0 or (has_tables and image_count > 0):
-            return 'ocr'
-        
-        # Image-heavy pages with minimal text: OCR processing
-        elif text_length < settings.text_threshold or image_coverage > 0.5:
-            return 'ocr'
-        
-        # Table-only pages: Targeted table extraction
-        elif has_tables and image_count == 0:
-            if settings.table_extraction_method == "auto":
-                return 'pdfplumber'
-            else:
-                return settings.table_extraction_method
-        
-        # Moderate complexity: Hybrid approach
-        elif complexity_score <= 5.0:
-            return 'text'  # Fast text extraction for moderate pages
-        
-        # Default to OCR for uncertain cases (docling disabled)
-        else:
-            return 'ocr'
+        return _optimal_processing(
+            complexity_score, text_length, has_tables, image_count, image_coverage,
+            settings.enable_hybrid_processing, settings.text_threshold,
+            settings.table_extraction_method
+        )
     
     
-    def extract_tables_with_pymupdf(self, page) -> str:
+    def extract_tables_with_pymupdf(self, page, tables: Optional[list] = None) -> str:
         """
         Extract tables from a page using PyMuPDF
         
         Args:
             page: PyMuPDF page object
+            tables: Tables already detected on this page (skips a second find_tables)
             
         Returns:
             Formatted table text
         """
         try:
-            table_finder = page.find_tables()
-            tables = list(table_finder)  # Convert TableFinder to list
+            if tables is None:
+                table_finder = page.find_tables()
+                tables = list(table_finder)  # Convert TableFinder to list
             if not tables:
                 return ""
             
@@ -920,6 +1558,67 @@ English translation:"""
         else:
             return self._extract_with_tesseract(page)
     
+    def extract_text_with_ocr_batch(self, pages: list) -> List[str]:
+        """
+        Extract text from several pages with OCR, sharing one engine across threads
+        
+        Pages are rendered on the calling thread (a MuPDF document must not be used
+        concurrently); recognition then runs on settings.ocr_workers threads, since
+        ONNX Runtime releases the GIL and its sessions accept concurrent runs. At most
+        2 * ocr_workers rendered pages are held at once, so memory does not grow
+        with the page count.
+        
+        Args:
+            pages: PyMuPDF page objects
+            
+        Returns:
+            Extracted text for each page, in order
+        """
+        if settings.ocr_provider != "rapidocr" or len(pages) < 2:
+            return [self.extract_text_with_ocr(page) for page in pages]
+        
+        try:
+            engine = self._get_rapid_ocr()
+        except Exception as e:
+            print(f"Batch OCR setup failed: {e}")
+            return [self.extract_text_with_ocr(page) for page in pages]
+        
+        def recognize(img_np):
+            try:
+                return self._rapidocr_text(engine, img_np)
+            except Exception as e:
+                print(f"RapidOCR failed: {e}")
+                return None
+        
+        workers = max(min(settings.ocr_workers, len(pages)), 1)
+        window = 2 * workers
+        texts: List[Optional[str]] = [None] * len(pages)
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = deque()
+            for i, page in enumerate(pages):
+                # Wait for the oldest page before rendering past the window
+                if len(in_flight) >= window:
+                    j, future = in_flight.popleft()
+                    texts[j] = future.result()
+                
+                try:
+                    img_np = self._render_page_array(page)
+                except Exception as e:
+                    print(f"Page render for OCR failed: {e}")
+                    continue
+                in_flight.append((i, executor.submit(recognize, img_np)))
+                del img_np  # The queued task holds the only reference
+            
+            for j, future in in_flight:
+                texts[j] = future.result()
+        
+        # Pages that failed take the same per-page path as unbatched OCR
+        return [
+            text if text is not None else self.extract_text_with_ocr(page)
+            for page, text in zip(pages, texts)
+        ]
+    
     def _extract_with_tesseract(self, page) -> str:
         """
         Fallback OCR extraction using Tesseract
@@ -933,12 +1632,10 @@ English translation:"""
         try:
             import pytesseract
             from PIL import Image
-            import io
             
-            # Get page as image
-            pix = page.get_pixmap(matrix=pymupdf.Matrix(2.0, 2.0))
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
+            # Get page as image, wrapping the raw RGB samples without a PNG round trip
+            pix = page.get_pixmap(matrix=pymupdf.Matrix(2.0, 2.0), alpha=False)
+            img = Image.frombuffer("RGB", (pix.width, pix.height), pix.samples, "raw", "RGB", pix.stride, 1)
             
             # Extract text using OCR
             ocr_text = pytesseract.image_to_string(img, config='--psm 6')
@@ -961,9 +1658,6 @@ English translation:"""
         try:
             import paddleocr
             import paddle
-            from PIL import Image
-            import io
-            import numpy as np
             
             # Initialize PaddleOCR (cached in class if needed)
             if not hasattr(self, '_paddle_ocr'):
@@ -981,13 +1675,8 @@ English translation:"""
                     lang='en'
                 )
             
-            # Get page as image with higher resolution for better OCR
-            pix = page.get_pixmap(matrix=pymupdf.Matrix(2.0, 2.0))
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # Convert PIL image to numpy array for PaddleOCR
-            img_np = np.array(img)
+            # Get page as image with higher resolution for better OCR (PaddleOCR expects BGR)
+            img_np = self._render_page_array(page, bgr=True)
             
             # Extract text using PaddleOCR
             result = self._paddle_ocr.predict(img_np)
@@ -1024,54 +1713,86 @@ English translation:"""
             Extracted text
         """
         try:
-            from rapidocr_onnxruntime import RapidOCR
-            from PIL import Image
-            import io
-            import numpy as np
-            
-            # Initialize RapidOCR (cached in class if needed)
-            if not hasattr(self, '_rapid_ocr'):
-                # Configure providers based on GPU settings
-                if settings.use_gpu_ocr:
-                    # Use GPU providers with fallback to CPU
-                    providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
-                    print("RapidOCR: Using GPU acceleration (CUDA + TensorRT)")
-                else:
-                    # CPU only
-                    providers = ["CPUExecutionProvider"]
-                    print("RapidOCR: Using CPU mode")
-                
-                self._rapid_ocr = RapidOCR(providers=providers)
+            engine = self._get_rapid_ocr()
             
             # Get page as image with higher resolution for better OCR
-            pix = page.get_pixmap(matrix=pymupdf.Matrix(2.0, 2.0))
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            
-            # Convert PIL image to numpy array for RapidOCR
-            img_np = np.array(img)
-            
-            # Extract text using RapidOCR
-            result, elapsed = self._rapid_ocr(img_np)
+            img_np = self._render_page_array(page)
             
-            # Parse results and extract text
-            extracted_text = []
-            if result:
-                for detection in result:
-                    # RapidOCR returns: [bbox, text, confidence]
-                    if len(detection) >= 3:
-                        text = detection[1]
-                        confidence = detection[2]
-                        if confidence > 0.5:  # Filter low confidence results
-                            extracted_text.append(text)
-            
-            return '\n'.join(extracted_text)
+            return self._rapidocr_text(engine, img_np)
             
         except Exception as e:
             print(f"RapidOCR failed: {e}")
             # Fallback to PaddleOCR if RapidOCR fails
             return self._extract_with_paddleocr(page)
     
+    def _get_rapid_ocr(self):
+        """Get the RapidOCR engine, initializing it on first use"""
+        from rapidocr_onnxruntime import RapidOCR
+        
+        # Initialize RapidOCR (cached in class if needed)
+        if not hasattr(self, '_rapid_ocr'):
+            # Configure providers based on GPU settings
+            if settings.use_gpu_ocr:
+                # Use GPU providers with fallback to CPU
+                providers = ["CUDAExecutionProvider", "CPUExecutionProvider"]
+                print("RapidOCR: Using GPU acceleration (CUDA + TensorRT)")
+            else:
+                # CPU only
+                providers = ["CPUExecutionProvider"]
+                print("RapidOCR: Using CPU mode")
+            
+            self._rapid_ocr = RapidOCR(providers=providers)
+        return self._rapid_ocr
+    
+    def _render_page_array(self, page, bgr: bool = False):
+        """
+        Render a page at 2x resolution as a numpy image array for OCR
+        
+        Args:
+            page: PyMuPDF page object
+            bgr: Return BGR channel order for OpenCV-based engines such as PaddleOCR
+            
+        Returns:
+            uint8 array of shape (height, width, 3)
+        """
+        import numpy as np
+        
+        pix = page.get_pixmap(matrix=pymupdf.Matrix(2.0, 2.0))
+        
+        if bgr:
+            import cv2
+            
+            # samples_mv is a view into the pixmap's own buffer, so no bytes copy is made.
+            # The view is only valid while pix is alive; cvtColor writes a new array
+            # before pix goes out of scope.
+            view = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+            code = cv2.COLOR_RGBA2BGR if pix.n == 4 else cv2.COLOR_RGB2BGR
+            return cv2.cvtColor(view, code)
+        
+        # Read the raw samples directly instead of encoding and decoding a PNG
+        img_np = np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width, pix.n)
+        if pix.n == 4:
+            img_np = img_np[:, :, :3]
+        return img_np
+    
+    def _rapidocr_text(self, engine, img_np) -> str:
+        """Run RapidOCR on an image array and join the confident text lines"""
+        # Extract text using RapidOCR
+        result, elapsed = engine(img_np)
+        
+        # Parse results and extract text
+        extracted_text = []
+        if result:
+            for detection in result:
+                # RapidOCR returns: [bbox, text, confidence]
+                if len(detection) >= 3:
+                    text = detection[1]
+                    confidence = detection[2]
+                    if confidence > 0.5:  # Filter low confidence results
+                        extracted_text.append(text)
+        
+        return '\n'.join(extracted_text)
+    
     def _extract_with_docling(self, pdf_data: bytes, page_num: int) -> str:
         """
         Extract text from specific page using Docling with RTMDet-S layout + RapidOCR
@@ -1215,23 +1936,17 @@ English translation:"""
             Cleaned DataFrame
         """
         try:
-            import pandas as pd
-            
             if df.empty:
                 return df
             
-            # Make a copy to avoid modifying the original
-            df_clean = df.copy()
-            
-            # Convert all values to strings and clean
-            for col in df_clean.columns:
-                df_clean[col] = df_clean[col].apply(lambda x: str(x).strip() if pd.notna(x) and x != '' else '')
-            
-            # Remove completely empty rows
-            df_clean = df_clean[df_clean.apply(lambda row: any(cell != '' for cell in row), axis=1)]
+            # Convert all values to stripped strings column-wise (missing/empty cells -> '');
+            # astype/str.strip/where produce a new frame, so the original is untouched
+            has_value = df.notna() & df.ne('')
+            df_clean = df.astype(str).apply(lambda col: col.str.strip()).where(has_value, '')
             
-            # Remove completely empty columns
-            df_clean = df_clean.loc[:, df_clean.apply(lambda col: any(cell != '' for cell in col), axis=0)]
+            # Remove completely empty rows and columns in one boolean-mask selection
+            non_empty = df_clean.ne('')
+            df_clean = df_clean.loc[non_empty.any(axis=1), non_empty.any(axis=0)]
             
             return df_clean
             
@@ -1255,22 +1970,22 @@ English translation:"""
             if df.empty:
                 return ""
             
-            # Get column headers
-            headers = df.columns.tolist()
+            # Get column headers (cleaned once rather than per cell)
+            headers = [str(header).strip() for header in df.columns]
             text_lines = []
 
             # Add a clear header for the table's content
             text_lines.append("The document includes a table with the following information:")
 
-            # Iterate over each row in the DataFrame
-            for index, row in df.iterrows():
+            # Iterate over plain row tuples - iterrows would box every row into a Series
+            for index, *values in df.itertuples(index=True, name=None):
                 row_parts = []
                 # Combine header and cell value for each item in the row
-                for header in headers:
-                    cell_value = str(row[header]).strip()
+                for header, value in zip(headers, values):
+                    cell_value = str(value).strip()
                     if cell_value and cell_value.lower() != 'nan':
                         # Create a "key: value" pair
-                        row_parts.append(f"{str(header).strip()}: {cell_value}")
+                        row_parts.append(f"{header}: {cell_value}")
                 
                 # Join the parts into a single line of text for the row
                 if row_parts:
@@ -1391,7 +2106,7 @@ English translation:"""
         
         try:
             # Generate filename
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            url_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
             # Extract name from URL if possible
@@ -1457,7 +2172,7 @@ English translation:"""
         
         try:
             # Generate filename
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            url_hash = hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"parsed_{timestamp}_{url_hash}.txt"
             
@@ -1497,7 +2212,7 @@ English translation:"""
         Returns:
             12-character document ID
         """
-        return hashlib.md5(url.encode()).hexdigest()[:12]
+        return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:12]
     
     @staticmethod
     def create_file_url(file_path: str) -> str:
@@ -1664,10 +2379,10 @@ English translation:"""
         processed_text = self.preprocess_malayalam_text(extraction_result["text"])
         
         # Detect language and create translated version if needed
-        detected_language = self.detect_language(processed_text)
+        detected_language, script_ratio = self.detect_language_with_ratio(processed_text)
         translated_text = None
         
-        if detected_language != 'english':
+        if detected_language != 'english' and script_ratio >= settings.translation_min_script_ratio:
             print(f"Detected {detected_language} content, creating English translation...")
             translated_text = await self.translate_text_to_english(processed_text, detected_language)
         
@@ -37,6 +37,11 @@ class EmbeddingProvider(ABC):
         """Generate embedding for a single query"""
         pass
     
+    @abstractmethod
+    async def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Generate embeddings for several queries in one batch"""
+        pass
+    
     @abstractmethod
     def get_embedding_dimension(self) -> int:
         """Get the embedding dimension"""
@@ -327,6 +332,56 @@ class BGEEmbeddingProvider(EmbeddingProvider):
         
         return embedding
     
+    async def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for several queries in a single model call
+        
+        Args:
+            queries: List of query strings
+            
+        Returns:
+            Numpy array of query embeddings (len(queries), embedding_dim)
+        """
+        self._load_model()
+        
+        debug_print("Generating embeddings for %d queries in one batch...", len(queries))
+        start_time = time.time()
+        
+        try:
+            with torch.no_grad():
+                result = self.model.encode(
+                    queries,
+                    batch_size=min(len(queries), 32),
+                    max_length=512,  # Queries are typically shorter
+                    return_dense=True,
+                    return_sparse=False,
+                    return_colbert_vecs=False
+                )
+            
+            # Extract dense embeddings from result dict
+            if isinstance(result, dict):
+                embeddings = result['dense_vecs']
+            else:
+                embeddings = result
+            
+            # Convert to numpy array
+            if hasattr(embeddings, 'numpy'):
+                embeddings = embeddings.numpy()
+            elif torch.is_tensor(embeddings):
+                embeddings = embeddings.cpu().numpy()
+            
+            # Ensure 2D array
+            if embeddings.ndim == 1:
+                embeddings = embeddings.reshape(1, -1)
+            
+            embeddings = self._normalize_embeddings(embeddings)
+            
+            debug_print("Generated %d query embeddings in %.2fs", len(queries), time.time() - start_time)
+            return embeddings
+            
+        except Exception as e:
+            raise RuntimeError(f"Batch query embedding generation failed: {str(e)}")
+    
     def get_embedding_dimension(self) -> int:
         """Get the embedding dimension for BGE-M3"""
         return 1024  # BGE-M3 embedding dimension
@@ -472,6 +527,30 @@ class EmbeddingManager:
         
         return embedding
     
+    async def encode_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """
+        Generate embeddings for several queries, encoding all cache misses in one batch
+        
+        Args:
+            queries: List of query strings
+            
+        Returns:
+            List of query embedding arrays, one (1, embedding_dim) array per query
+        """
+        from app.services.lru_cache_manager import get_lru_cache_manager
+        cache_manager = get_lru_cache_manager()
+        
+        embeddings, missing = cache_manager.get_query_embeddings_batch(queries)
+        
+        if missing:
+            batch = await self._provider.embed_queries([queries[i] for i in missing])
+            for row, i in enumerate(missing):
+                embedding = batch[row:row + 1]
+                cache_manager.set_query_embedding(queries[i], embedding)
+                embeddings[i] = embedding
+        
+        return embeddings
+    
     def ensure_model_ready(self) -> bool:
         """
         Ensure the model is ready for use (backward compatibility)
@@ -480,7 +559,7 @@ class EmbeddingManager:
             True if model is ready
         """
         try:
-            return self._provider.is_available()
+            return self._provider.ensure_model_ready()
         except Exception as e:
             logger.error(f"Model readiness check failed: {str(e)}")
             return False
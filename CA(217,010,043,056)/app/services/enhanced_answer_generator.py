@@ -13,7 +13,7 @@ from app.services.vector_store import SearchResult
 from app.services.copilot_provider import get_copilot_provider
 from app.services.openai_provider import get_openai_provider
 from app.services.cache_manager import get_cache_manager
-from app.core.config import Settings, settings
+from app.core.config import settings, K_RETRIEVE
 from app.utils.debug import debug_print, conditional_print
 
 
@@ -98,8 +98,6 @@ RERANKER = ThreadSafeReranker()
 # Note: TOP_K_INITIAL is now dynamically set via settings.k_retrieve (configurable in config.py or .env)
 # TOP_K_RERANKED is now configurable via settings.top_k_reranked in config.py
 
-settings = Settings()
-
 @dataclass
 class GeneratedAnswer:
     """Container for generated answer with metadata"""
@@ -522,7 +520,7 @@ ANSWER:"""
         
         # Determine complexity and adaptive parameters
         complexity = self.classify_query_complexity(question)
-        adaptive_k_initial = self.get_adaptive_k(question, settings.k_retrieve)
+        adaptive_k_initial = self.get_adaptive_k(question, K_RETRIEVE)
         
         # Adaptive TOP_K_RERANKED based on complexity (using configurable base value)
         base_reranked = settings.top_k_reranked
@@ -13,6 +13,9 @@ from fastapi import UploadFile, HTTPException
 from app.core.config import settings
 from app.core.directories import create_directory
 
+# Read size for streaming uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 
 @dataclass
 class UploadedFileInfo:
@@ -146,13 +149,21 @@ class FileManager:
         expires_at = uploaded_at + timedelta(hours=settings.upload_retention_hours)
         
         try:
-            # Save file to disk
+            # Stream the file to disk in fixed-size chunks so memory stays bounded
+            file_size = 0
             with open(file_path, "wb") as buffer:
-                content = await upload_file.read()
-                buffer.write(content)
-            
-            # Get actual file size
-            file_size = len(content)
+                while True:
+                    chunk = await upload_file.read(UPLOAD_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    file_size += len(chunk)
+                    # Reject oversized uploads as soon as the limit is crossed
+                    if file_size > settings.max_upload_size:
+                        raise HTTPException(
+                            status_code=413,
+                            detail=f"File too large: more than {settings.max_upload_size:,} bytes"
+                        )
+                    buffer.write(chunk)
             
             # Create file info
             file_info = UploadedFileInfo(
@@ -181,6 +192,8 @@ class FileManager:
                     file_path.unlink()
                 except:
                     pass
+            if isinstance(e, HTTPException):
+                raise
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to save uploaded file: {str(e)}"
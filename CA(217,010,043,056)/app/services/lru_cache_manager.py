@@ -3,11 +3,11 @@ High-Performance LRU Cache Manager for RAG System
 Optimized for latency reduction with bounded memory usage
 """
 import hashlib
-import json
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from collections import OrderedDict
+import orjson
 from app.core.config import settings
 from app.utils.debug import conditional_print
 
@@ -127,15 +127,14 @@ class HighPerformanceCacheManager:
     def _generate_cache_key(self, data: Any) -> str:
         """Generate cache key from data"""
         if isinstance(data, str):
-            content = data
-        elif isinstance(data, dict):
-            content = json.dumps(data, sort_keys=True)
-        elif isinstance(data, (list, tuple)):
-            content = json.dumps(list(data), sort_keys=True)
+            content = data.encode()
+        elif isinstance(data, (dict, list, tuple)):
+            # orjson emits UTF-8 bytes directly - no separate encode pass
+            content = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
         else:
-            content = str(data)
+            content = str(data).encode()
         
-        return hashlib.md5(content.encode()).hexdigest()
+        return hashlib.md5(content).hexdigest()
     
     # Query Results Cache (Complete Q&A responses)
     def get_query_result(self, question: str, doc_id: str, k_retrieve: int) -> Optional[Dict[str, Any]]:
@@ -182,6 +181,27 @@ class HighPerformanceCacheManager:
             conditional_print(f"⚡ Query embedding cache HIT (MAJOR LATENCY SAVE): {query[:40]}...")
         return result
     
+    def get_query_embeddings_batch(self, queries: List[str]) -> Tuple[List[Optional[Any]], List[int]]:
+        """
+        Look up several query embeddings in one pass
+        
+        Returns:
+            Tuple of (embeddings with None for misses, indices of the misses) - the
+            misses can then be embedded with a single batched provider call
+        """
+        if not settings.enable_embedding_cache:
+            return [None] * len(queries), list(range(len(queries)))
+        
+        embeddings = [
+            self.query_embedding_cache.get(self._generate_cache_key(query.lower().strip()))
+            for query in queries
+        ]
+        miss_indices = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        
+        if len(miss_indices) < len(queries):
+            conditional_print("⚡ Query embedding cache HITs: %d/%d", len(queries) - len(miss_indices), len(queries))
+        return embeddings, miss_indices
+    
     def set_query_embedding(self, query: str, embedding: Any) -> None:
         """Cache query embedding - CRITICAL FOR LATENCY"""
         if not settings.enable_embedding_cache:
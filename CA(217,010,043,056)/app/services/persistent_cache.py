@@ -58,7 +58,8 @@ class PersistentCacheManager:
             "documents": settings.cache_ttl_seconds * 24 * 3,   # 3 days
             "query_results": settings.cache_ttl_seconds * 6,     # 6 hours
             "processed_docs": settings.cache_ttl_seconds * 24 * 7,  # 7 days
-            "landmark_mappings": settings.cache_ttl_seconds * 24 * 14  # 14 days
+            "landmark_mappings": settings.cache_ttl_seconds * 24 * 14,  # 14 days
+            "translations": settings.cache_ttl_seconds * 24 * 7  # 7 days
         }
         
         # Thread lock for concurrent access
@@ -86,7 +87,7 @@ class PersistentCacheManager:
         self.data_dir.mkdir(exist_ok=True)
         
         # Create subdirectories for each cache type
-        for cache_type in ["embeddings", "documents", "query_results", "processed_docs", "landmark_mappings"]:
+        for cache_type in ["embeddings", "documents", "query_results", "processed_docs", "landmark_mappings", "translations"]:
             (self.metadata_dir / cache_type).mkdir(exist_ok=True)
             (self.data_dir / cache_type).mkdir(exist_ok=True)
     
@@ -1,7 +1,6 @@
 """
 Question Logger Service - Logs questions, document URLs, and responses to JSON files
 """
-import json
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -9,9 +8,9 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 import uuid
 
-from app.core.config import Settings
+import orjson
 
-settings = Settings()
+from app.core.config import settings
 
 
 @dataclass
@@ -128,18 +127,14 @@ class QuestionLogger:
         if not settings.enable_question_logging or not session_id:
             return
         
-        timestamp = datetime.now().isoformat()
-        
-        # Create question log entry
-        question_log = QuestionLog(
+        question_log = self._build_question_log(
             question_id=question_id,
             question=question,
-            timestamp=timestamp,
+            timestamp=datetime.now().isoformat(),
             processing_time=processing_time,
-            answer=answer if settings.log_full_responses else answer[:200] + "..." if len(answer) > 200 else answer,
-            answer_length=len(answer),
+            answer=answer,
             sources_used=sources_used,
-            similarity_scores=similarity_scores[:3] if similarity_scores else [],  # Top 3 scores
+            similarity_scores=similarity_scores,
             error=error
         )
         
@@ -150,13 +145,68 @@ class QuestionLogger:
         print(f"  - Sources used: {sources_used}")
         
         # Store temporarily - will be saved when session ends
-        if not hasattr(self, '_active_sessions'):
-            self._active_sessions = {}
+        self._append_to_session(session_id, [question_log])
+    
+    def log_questions_bulk(self, session_id: str, rows: List[Dict[str, Any]]) -> None:
+        """
+        Log several questions and their responses in one call
         
-        if session_id not in self._active_sessions:
-            self._active_sessions[session_id] = []
+        Args:
+            session_id: Session ID from start_session
+            rows: One dict per question with the keyword arguments of log_question
+                  (question_id, question, processing_time, answer, sources_used,
+                  similarity_scores and optionally error)
+        """
+        if not settings.enable_question_logging or not session_id or not rows:
+            return
+        
+        # One timestamp for the whole batch - the questions were answered together
+        timestamp = datetime.now().isoformat()
+        question_logs = [
+            self._build_question_log(timestamp=timestamp, error=row.get("error"), **{
+                key: row[key] for key in (
+                    "question_id", "question", "processing_time",
+                    "answer", "sources_used", "similarity_scores"
+                )
+            })
+            for row in rows
+        ]
         
-        self._active_sessions[session_id].append(question_log)
+        print(f"Logging {len(question_logs)} questions for session {session_id}")
+        
+        self._append_to_session(session_id, question_logs)
+    
+    def _build_question_log(
+        self,
+        question_id: int,
+        question: str,
+        timestamp: str,
+        processing_time: float,
+        answer: str,
+        sources_used: int,
+        similarity_scores: List[float],
+        error: Optional[str] = None
+    ) -> QuestionLog:
+        """Create a question log entry, truncating the answer when full responses are disabled"""
+        return QuestionLog(
+            question_id=question_id,
+            question=question,
+            timestamp=timestamp,
+            processing_time=processing_time,
+            answer=answer if settings.log_full_responses else answer[:200] + "..." if len(answer) > 200 else answer,
+            answer_length=len(answer),
+            sources_used=sources_used,
+            similarity_scores=similarity_scores[:3] if similarity_scores else [],  # Top 3 scores
+            error=error
+        )
+    
+    def _append_to_session(self, session_id: str, question_logs: List[QuestionLog]) -> None:
+        """Buffer question log entries for a session until end_session saves them"""
+        with self._lock:
+            if not hasattr(self, '_active_sessions'):
+                self._active_sessions = {}
+            
+            self._active_sessions.setdefault(session_id, []).extend(question_logs)
     
     def end_session(
         self,
@@ -208,9 +258,9 @@ class QuestionLogger:
                 filename = f"questions_{today}_{session_id}.json"
                 filepath = self.log_dir / filename
                 
-                # Save to JSON file
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(asdict(session_log), f, indent=2, ensure_ascii=False)
+                # Save to JSON file (orjson encodes straight to UTF-8 bytes)
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(asdict(session_log), option=orjson.OPT_INDENT_2))
                 
                 # Clean up active session
                 del self._active_sessions[session_id]
@@ -274,8 +324,8 @@ class QuestionLogger:
             for log_file in self.log_dir.glob("questions_*.json"):
                 if log_file.stat().st_mtime >= cutoff_date.timestamp():
                     try:
-                        with open(log_file, 'r', encoding='utf-8') as f:
-                            log_data = json.load(f)
+                        with open(log_file, 'rb') as f:
+                            log_data = orjson.loads(f.read())
                             recent_logs.append(log_data)
                     except Exception as e:
                         print(f"Error reading log file {log_file}: {e}")
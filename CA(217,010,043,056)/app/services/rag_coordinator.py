@@ -3,9 +3,10 @@ RAG Coordinator - orchestrates the complete RAG pipeline
 """
 import time
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import hashlib
+import numpy as np
 
 from app.utils.debug import debug_print, info_print, conditional_print
 
@@ -15,12 +16,10 @@ from app.services.embedding_manager import get_embedding_manager
 from app.services.vector_store import get_vector_store, SearchResult
 from app.services.enhanced_answer_generator import get_enhanced_answer_generator as get_answer_generator
 from app.services.lru_cache_manager import get_lru_cache_manager
-from app.core.config import Settings
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
-settings = Settings()
-
 
 @dataclass
 class RAGResponse:
@@ -30,6 +29,14 @@ class RAGResponse:
     doc_id: str
     sources_used: List[Dict[str, Any]]
     pipeline_stats: Dict[str, Any]
+    similarity_scores: np.ndarray = field(init=False)
+    
+    def __post_init__(self):
+        # Top-3 source similarity scores, extracted once for logging and session stats
+        self.similarity_scores = np.asarray(
+            [source.get('similarity_score', 0.0) for source in self.sources_used[:3]],
+            dtype=np.float32
+        )
 
 
 class RAGCoordinator:
@@ -239,7 +246,8 @@ class RAGCoordinator:
         question: str, 
         doc_id: Optional[str] = None,
         k_retrieve: int = 10,
-        max_context_length: int = None
+        max_context_length: int = None,
+        query_embedding: Optional[np.ndarray] = None
     ) -> RAGResponse:
         """
         Answer a question using the RAG pipeline
@@ -249,6 +257,7 @@ class RAGCoordinator:
             doc_id: Optional document ID to filter by
             k_retrieve: Number of chunks to retrieve
             max_context_length: Maximum context length for answer generation (None = use config default)
+            query_embedding: Optional precomputed query embedding (skips embedding the question)
             
         Returns:
             RAGResponse with answer and metadata
@@ -256,20 +265,10 @@ class RAGCoordinator:
         start_time = time.time()
         
         # Check answer cache first
-        should_cache = False
-        if settings.enable_answer_cache and doc_id:
-            doc_info = self.vector_store.get_document_info(doc_id)
-            if doc_info:
-                doc_type = doc_info.get("document_type")
-                if doc_type == "semantic_search":
-                    should_cache = True
+        should_cache = self._should_cache_answer(doc_id)
         
         if should_cache:
-            # Normalize cache key to ignore retrieval parameters for better cache hit rate  
-            normalized_question = question.lower().strip()
-            # Use MD5 hash for consistent cache keys across server restarts
-            hash_value = hashlib.md5(normalized_question.encode()).hexdigest()[:16]
-            cache_key = f"qa:{doc_id}:{hash_value}"
+            cache_key = self._answer_cache_key(question, doc_id)
             cached_response = await self.cache_manager.get_answer_cache(cache_key)
             
             if cached_response:
@@ -286,8 +285,9 @@ class RAGCoordinator:
             # Stage 1: Embedding and Search
             stage_start = time.time()
             
-            # Generate query embedding
-            query_embedding = await self.embedding_manager.encode_query(question)
+            # Generate query embedding unless the caller batch-embedded it already
+            if query_embedding is None:
+                query_embedding = await self.embedding_manager.encode_query(question)
             
             # Vector search
             search_results = self.vector_store.search(
@@ -374,6 +374,53 @@ class RAGCoordinator:
             print(f"Question answering failed: {str(e)}")
             raise
 
+    def _should_cache_answer(self, doc_id: Optional[str]) -> bool:
+        """Answers are cached only for semantic search documents"""
+        if not settings.enable_answer_cache or not doc_id:
+            return False
+        
+        doc_info = self.vector_store.get_document_info(doc_id)
+        return bool(doc_info) and doc_info.get("document_type") == "semantic_search"
+    
+    def _answer_cache_key(self, question: str, doc_id: str) -> str:
+        """Build the answer cache key for a (doc_id, question) pair"""
+        # Normalize cache key to ignore retrieval parameters for better cache hit rate  
+        normalized_question = question.lower().strip()
+        # Use MD5 hash for consistent cache keys across server restarts
+        hash_value = hashlib.md5(normalized_question.encode()).hexdigest()[:16]
+        return f"qa:{doc_id}:{hash_value}"
+    
+    async def get_cached_answers(
+        self,
+        questions: List[str],
+        doc_id: Optional[str] = None
+    ) -> List[Optional[RAGResponse]]:
+        """
+        Look up cached answers for several questions without running the pipeline
+        
+        Args:
+            questions: Questions to look up
+            doc_id: Document ID the questions are asked against
+            
+        Returns:
+            One entry per question - the cached RAGResponse, or None on a miss
+        """
+        if not self._should_cache_answer(doc_id):
+            return [None] * len(questions)
+        
+        cached_responses = []
+        for question in questions:
+            start_time = time.time()
+            cached_response = await self.cache_manager.get_answer_cache(
+                self._answer_cache_key(question, doc_id)
+            )
+            if cached_response:
+                # Update processing time to reflect cache retrieval
+                cached_response.processing_time = time.time() - start_time
+            cached_responses.append(cached_response or None)
+        
+        return cached_responses
+    
     async def answer_question_async(
         self, 
         question: str, 
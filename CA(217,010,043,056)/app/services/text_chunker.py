@@ -6,7 +6,7 @@ import tiktoken
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
-from app.core.config import settings
+from app.core.config import settings, CHUNK_SIZE
 from app.utils.debug import debug_print, info_print
 
 
@@ -46,7 +46,7 @@ class TextChunker:
         # For now, approximate with cl100k_base but adjust token counts by factor
         self.tokenizer = tiktoken.get_encoding("cl100k_base")  
         self.bge_token_adjustment = 1.2  # BGE-M3 typically uses ~20% more tokens than cl100k_base
-        self.max_tokens = settings.chunk_size  # Use configured chunk size from settings
+        self.max_tokens = CHUNK_SIZE  # Use configured chunk size from settings
         self.overlap_tokens = settings.chunk_overlap  # Use configured overlap from settings
     
     def count_tokens(self, text: str) -> int:
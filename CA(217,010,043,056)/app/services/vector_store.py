@@ -69,6 +69,9 @@ class VectorStore:
         self.chunk_metadata: List[ChunkMetadata] = []
         self.documents: Dict[str, DocumentInfo] = {}
         
+        # Per-document summaries kept in sync with self.documents for O(1) listing
+        self._document_index: Dict[str, Dict[str, Any]] = {}
+        
         # File paths
         self.index_path = self.storage_path / "faiss_index.idx"
         self.texts_path = self.storage_path / "chunk_texts.pkl"
@@ -145,6 +148,11 @@ class VectorStore:
                         for doc_id, doc_info in doc_dicts.items()
                     }
                 debug_print(f"Loaded {len(self.documents)} document records")
+            
+            self._document_index = {
+                doc_id: self._summarize_document(doc_info)
+                for doc_id, doc_info in self.documents.items()
+            }
                     
         except Exception as e:
             debug_print(f"Warning: Failed to load existing data: {e}")
@@ -153,6 +161,7 @@ class VectorStore:
             self.chunk_texts = []
             self.chunk_metadata = []
             self.documents = {}
+            self._document_index = {}
     
     def _save_to_disk(self):
         """Save index and metadata to disk"""
@@ -186,10 +195,25 @@ class VectorStore:
     
     def get_document_info(self, doc_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a stored document"""
-        if doc_id not in self.documents:
+        summary = self._document_index.get(doc_id)
+        if summary is None:
             return None
-            
-        doc_info = self.documents[doc_id]
+        
+        return {
+            **summary,
+            "storage_size_mb": self._estimate_storage_size() / 1024 / 1024
+        }
+    
+    def list_documents(self) -> List[Dict[str, Any]]:
+        """Get information about all stored documents from the precomputed index"""
+        storage_size_mb = self._estimate_storage_size() / 1024 / 1024
+        return [
+            {**summary, "storage_size_mb": storage_size_mb}
+            for summary in self._document_index.values()
+        ]
+    
+    def _summarize_document(self, doc_info: DocumentInfo) -> Dict[str, Any]:
+        """Build the document summary served by get_document_info/list_documents"""
         return {
             "doc_id": doc_info.doc_id,
             "source_url": doc_info.source_url,
@@ -199,8 +223,7 @@ class VectorStore:
             "indexed_at": doc_info.indexed_at,
             "total_tokens": doc_info.total_tokens,
             "document_type": doc_info.document_type,
-            "type_confidence": doc_info.type_confidence,
-            "storage_size_mb": self._estimate_storage_size() / 1024 / 1024
+            "type_confidence": doc_info.type_confidence
         }
     
     def _estimate_storage_size(self) -> int:
@@ -307,6 +330,7 @@ class VectorStore:
             document_type=document_metadata.get("document_type", "unknown"),
             type_confidence=document_metadata.get("type_confidence", 0.0)
         )
+        self._document_index[doc_id] = self._summarize_document(self.documents[doc_id])
         
         # Save to disk
         self._save_to_disk()
@@ -500,6 +524,7 @@ class VectorStore:
         
         # Remove document info
         del self.documents[doc_id]
+        self._document_index.pop(doc_id, None)
         
         # Rebuild index
         if self.chunk_texts:
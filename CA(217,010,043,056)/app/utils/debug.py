@@ -1,19 +1,29 @@
 """
 Debug utilities for conditional logging based on configuration
+
+Messages accept logging-style lazy arguments: ``debug_print("Took %.2fs", elapsed)``
+only formats the message when debug_mode is enabled, so hot paths pay no
+string-formatting cost in production.
 """
 from app.core.config import settings
 
-def debug_print(*args, **kwargs):
+def _emit(msg, args, kwargs):
+    """Format lazy %-style arguments and print the message"""
+    if args:
+        msg = msg % args
+    print(msg, **kwargs)
+
+def debug_print(msg="", *args, **kwargs):
     """Conditional debug printing based on config"""
     if settings.debug_mode:
-        print(*args, **kwargs)
+        _emit(msg, args, kwargs)
 
-def info_print(*args, **kwargs):
+def info_print(msg="", *args, **kwargs):
     """Print important info only in debug mode (errors, results, timing)"""
     if settings.debug_mode:
-        print(*args, **kwargs)
+        _emit(msg, args, kwargs)
 
-def conditional_print(*args, **kwargs):
+def conditional_print(msg="", *args, **kwargs):
     """Print only when debug_mode is True - use this instead of direct print() calls"""
     if settings.debug_mode:
-        print(*args, **kwargs)
\ No newline at end of file
+        _emit(msg, args, kwargs)
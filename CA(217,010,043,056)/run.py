@@ -18,9 +18,10 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
-    # Run similar to: uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers 3
+    # Run similar to: uvicorn app.main:create_application --factory --host 0.0.0.0 --port 8000 --workers 3
     uvicorn.run(
-        "app.main:app",
+        "app.main:create_application",
+        factory=True,
         host="0.0.0.0",
         port=8000,
         workers=3,
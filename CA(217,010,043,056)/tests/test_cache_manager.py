@@ -0,0 +1,114 @@
+"""
+Tests for the in-memory CacheManager
+"""
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services import cache_manager as cache_manager_module
+from app.services.cache_manager import CacheManager
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh CacheManager with small limits (settings are frozen, so swap in a copy)"""
+    monkeypatch.setattr(cache_manager_module, "settings", settings.model_copy(update={
+        "enable_embedding_cache": True,
+        "enable_result_caching": True,
+        "embedding_cache_max_size": 3,
+        "query_embedding_cache_max_size": 2,
+        "query_cache_max_size": 4,
+        "answer_cache_max_size": 4,
+    }))
+    return CacheManager()
+
+
+def test_clock_keeps_new_embedding_when_every_entry_is_referenced(cache):
+    for i in range(3):
+        cache.set_embedding(f"chunk {i}", [float(i)] * 4)
+    for i in range(3):
+        assert cache.get_embedding(f"chunk {i}") is not None
+    
+    cache.set_embedding("chunk new", [9.0] * 4)
+    
+    new_embedding = cache.get_embedding("chunk new")
+    assert new_embedding is not None
+    assert new_embedding.dtype == np.float32
+    assert len(cache.embedding_cache) == 3
+
+
+def test_clock_evicts_unreferenced_entry_first(cache):
+    for i in range(3):
+        cache.set_embedding(f"chunk {i}", [float(i)] * 4)
+    # chunk 0 is the oldest but referenced - chunk 1 is the first without a second chance
+    cache.get_embedding("chunk 0")
+    
+    cache.set_embedding("chunk new", [9.0] * 4)
+    
+    assert cache.get_embedding("chunk 0") is not None
+    assert cache.get_embedding("chunk 1") is None
+    assert cache.get_embedding("chunk 2") is not None
+    assert cache.get_embedding("chunk new") is not None
+
+
+def test_expiry_heap_stays_bounded_by_cache_size(cache):
+    for i in range(1000):
+        cache.set_query_embedding(f"question {i}", [float(i)] * 4)
+    for _ in range(1000):
+        cache.set_query_embedding("question 999", [1.0] * 4)
+    
+    heap = cache._expiry_heaps["query_embedding"]
+    assert len(cache.query_embedding_cache) == 2
+    assert len(heap) <= 2 * len(cache.query_embedding_cache) + 1
+    assert {key for _, key in heap} >= set(cache.query_embedding_cache)
+
+
+def test_expired_entries_are_purged(cache, monkeypatch):
+    clock = [1000]
+    monkeypatch.setattr(cache_manager_module, "_now", lambda: clock[0])
+    cache.set_query_embedding("question", [1.0] * 4)
+    assert cache.get_query_embedding("question") is not None
+    
+    clock[0] += int(cache_manager_module.settings.cache_ttl_seconds * 6 * 10) + 1
+    
+    assert cache.get_query_embedding("question") is None
+    assert len(cache.query_embedding_cache) == 0
+    assert cache._bytes["query_embedding"] == 0
+
+
+def test_sharded_cache_enforces_one_global_budget(cache):
+    for doc in ("doc-a", "doc-b", "doc-c"):
+        for i in range(3):
+            cache.set_query_result(f"question {i}", doc, 5, {"doc": doc, "i": i})
+    
+    assert cache.query_cache.size == 4
+    assert sum(len(shard.entries) for shard in cache.query_cache.shards.values()) == 4
+    assert cache.get_cache_stats()["cache_sizes"]["query_cache"] == 4
+    # doc-a was least recently used, so it was emptied first and its shard removed
+    assert "doc-a" not in cache.query_cache.shards
+    assert cache.get_query_result("question 2", "doc-c", 5) == {"doc": "doc-c", "i": 2}
+
+
+def test_reading_a_document_protects_its_shard_from_eviction(cache):
+    cache.set_query_result("question", "doc-a", 5, "a")
+    cache.set_query_result("question", "doc-b", 5, "b")
+    assert cache.get_query_result("question", "doc-a", 5) == "a"
+    
+    for i in range(3):
+        cache.set_query_result(f"question {i}", "doc-c", 5, i)
+    
+    assert cache.get_query_result("question", "doc-a", 5) == "a"
+    assert cache.get_query_result("question", "doc-b", 5) is None
+
+
+def test_untouched_shards_expire_on_periodic_sweep(cache, monkeypatch):
+    clock = [1000]
+    monkeypatch.setattr(cache_manager_module, "_now", lambda: clock[0])
+    cache.set_query_result("question", "doc-idle", 5, "idle")
+    
+    clock[0] += int(cache_manager_module.settings.cache_ttl_seconds * 10) + cache_manager_module._SHARD_SWEEP_INTERVAL
+    cache.set_query_result("question", "doc-active", 5, "active")
+    
+    assert "doc-idle" not in cache.query_cache.shards
+    assert cache.query_cache.size == 1
+    assert cache._bytes["query"] > 0
@@ -0,0 +1,111 @@
+"""
+Tests for the GitHub Copilot provider
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import orjson
+import pytest
+
+from app.services import copilot_provider as copilot_module
+from app.services.copilot_provider import CopilotProvider
+
+
+class _FakeResponse:
+    """Minimal httpx.Response stand-in for a successful completion"""
+    
+    def __init__(self, chunks=()):
+        self.status_code = 200
+        self.content = orjson.dumps({"choices": [{"message": {"content": "ok"}}]})
+        self._chunks = chunks
+    
+    async def aiter_bytes(self):
+        for chunk in self._chunks:
+            yield chunk
+
+
+class _RecordingClient:
+    """Records the JSON payload of each request"""
+    
+    def __init__(self, stream_chunks=()):
+        self.payloads = []
+        self._stream_chunks = stream_chunks
+    
+    async def post(self, url, headers=None, content=None):
+        self.payloads.append(orjson.loads(content))
+        return _FakeResponse()
+    
+    @asynccontextmanager
+    async def stream(self, method, url, headers=None, content=None):
+        self.payloads.append(orjson.loads(content))
+        yield _FakeResponse(self._stream_chunks)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("COPILOT_ACCESS_TOKEN", "test-token")
+    client = _RecordingClient(stream_chunks=[b'data: {"choices": [{"delta": {"content": "hi"}}]}\n', b"data: [DONE]\n"])
+    monkeypatch.setattr(copilot_module, "_get_http_client", lambda: client)
+    return client
+
+
+async def _collect(generator):
+    return [item async for item in generator]
+
+
+def test_generate_answer_payload_uses_per_call_fields(client):
+    provider = CopilotProvider(model="gpt-4o", max_tokens=512)
+    
+    response = asyncio.run(provider.generate_answer("question", temperature=0.3))
+    
+    assert response.content == "ok"
+    assert client.payloads == [{
+        "model": "gpt-4o",
+        "max_tokens": 512,
+        "messages": [{"role": "user", "content": "question"}],
+        "temperature": 0.3
+    }]
+
+
+def test_provider_kwargs_override_call_fields(client):
+    provider = CopilotProvider(model="gpt-4o", temperature=0.0, stream=False, top_p=0.9)
+    
+    asyncio.run(provider.generate_answer("question", temperature=0.7))
+    
+    payload = client.payloads[0]
+    assert payload["temperature"] == 0.0
+    assert payload["stream"] is False
+    assert payload["top_p"] == 0.9
+    assert payload["max_tokens"] == 2048
+
+
+def test_stream_answer_always_streams(client):
+    provider = CopilotProvider(model="gpt-4o", temperature=0.0, stream=False)
+    
+    chunks = asyncio.run(_collect(provider.stream_answer("question", temperature=0.7)))
+    
+    assert chunks == ["hi"]
+    payload = client.payloads[0]
+    assert payload["stream"] is True
+    assert payload["temperature"] == 0.0
+
+
+def _sse_payloads(chunks):
+    return asyncio.run(_collect(CopilotProvider._iter_sse_data(_FakeResponse(chunks))))
+
+
+def test_sse_parser_joins_lines_split_across_chunks():
+    chunks = [b'data: {"a":', b' 1}\r\n', b"\r\ndata: {\"b\": 2}\n\n"]
+    
+    assert _sse_payloads(chunks) == [b'{"a": 1}', b'{"b": 2}']
+
+
+def test_sse_parser_skips_non_data_lines_and_stops_at_done():
+    chunks = [b": keep-alive\nevent: message\ndata: first\n", b"data: [DONE]\ndata: after\n"]
+    
+    assert _sse_payloads(chunks) == [b"first"]
+
+
+def test_sse_parser_yields_unterminated_final_line():
+    assert _sse_payloads([b"data: one\ndata: last"]) == [b"one", b"last"]
+    assert _sse_payloads([b"data: one\ndata: [DONE]"]) == [b"one"]
@@ -0,0 +1,63 @@
+"""
+Tests for directory scanning in DirectoryManager
+"""
+import os
+
+import pytest
+
+from app.core.directories import DirectoryManager
+
+
+def test_scan_tree_counts_files_in_nested_directories(tmp_path):
+    (tmp_path / "nested" / "deeper").mkdir(parents=True)
+    (tmp_path / "a.txt").write_bytes(b"x" * 10)
+    (tmp_path / "nested" / "b.txt").write_bytes(b"y" * 20)
+    (tmp_path / "nested" / "deeper" / "c.txt").write_bytes(b"z" * 30)
+    
+    total_size, disk_usage, file_count = DirectoryManager()._scan_tree(str(tmp_path))
+    
+    assert total_size == 60
+    assert file_count == 3
+    assert disk_usage >= 0
+
+
+@pytest.mark.skipif(not hasattr(os.stat_result, "st_blocks"), reason="st_blocks is POSIX-only")
+def test_scan_tree_reports_allocated_blocks_for_sparse_and_empty_files(tmp_path):
+    sparse = tmp_path / "sparse.bin"
+    with open(sparse, "wb") as f:
+        f.truncate(4 * 1024 * 1024)
+    (tmp_path / "empty.bin").touch()
+    
+    expected_usage = sum(os.stat(path).st_blocks * 512 for path in tmp_path.iterdir())
+    
+    total_size, disk_usage, file_count = DirectoryManager()._scan_tree(str(tmp_path))
+    
+    assert total_size == 4 * 1024 * 1024
+    assert file_count == 2
+    # Unallocated files count at their allocated size (0 blocks), not their apparent size
+    assert disk_usage == expected_usage
+
+
+def test_scan_tree_skips_unreadable_or_removed_subdirectories(tmp_path, monkeypatch):
+    (tmp_path / "unreadable").mkdir()
+    (tmp_path / "unreadable" / "hidden.txt").write_bytes(b"h" * 5)
+    (tmp_path / "removed").mkdir()
+    (tmp_path / "kept").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"x" * 10)
+    (tmp_path / "kept" / "b.txt").write_bytes(b"y" * 20)
+    
+    real_scandir = os.scandir
+    
+    def scandir(path):
+        if os.path.basename(path) == "unreadable":
+            raise PermissionError(13, "Permission denied", path)
+        if os.path.basename(path) == "removed":
+            raise FileNotFoundError(2, "No such file or directory", path)
+        return real_scandir(path)
+    
+    monkeypatch.setattr(os, "scandir", scandir)
+    
+    total_size, disk_usage, file_count = DirectoryManager()._scan_tree(str(tmp_path))
+    
+    assert total_size == 30
+    assert file_count == 2
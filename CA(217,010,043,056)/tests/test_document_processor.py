@@ -0,0 +1,228 @@
+"""
+Tests for document processor text helpers
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pymupdf
+import pytest
+from fastapi import HTTPException
+
+from app.services import document_processor
+from app.services.document_processor import DocumentProcessor, _split_paragraphs
+
+
+def _rejoin(chunks):
+    return "".join(chunk + separator for chunk, separator in chunks)
+
+
+def test_split_paragraphs_groups_short_paragraphs():
+    text = "first paragraph\n\nsecond paragraph\n\nthird paragraph"
+    
+    chunks = _split_paragraphs(text, 40)
+    
+    assert [chunk for chunk, _ in chunks] == ["first paragraph\n\nsecond paragraph", "third paragraph"]
+    assert _rejoin(chunks) == text
+
+
+def test_split_paragraphs_hard_split_keeps_original_separators():
+    long_paragraph = " ".join(f"word{i}" for i in range(40))
+    text = f"intro\n\n{long_paragraph}\n\noutro"
+    
+    chunks = _split_paragraphs(text, 50)
+    
+    assert all(len(chunk) <= 50 for chunk, _ in chunks)
+    # Pieces of the split paragraph are separated by its spaces, not paragraph breaks
+    assert _rejoin(chunks) == text
+    assert chunks[0] == ("intro", "\n\n")
+    assert {separator for _, separator in chunks[1:-1]} == {" "}
+    assert chunks[-1][0].endswith("\n\noutro")
+
+
+def test_split_paragraphs_mid_word_cut_has_no_separator():
+    text = "x" * 25
+    
+    chunks = _split_paragraphs(text, 10)
+    
+    assert chunks == [("x" * 10, ""), ("x" * 10, ""), ("x" * 5, "")]
+
+
+def _make_pdf(page_count: int) -> bytes:
+    pdf_doc = pymupdf.open()
+    for page_num in range(page_count):
+        page = pdf_doc.new_page()
+        page.insert_text((72, 72), f"Page {page_num + 1} " + "plain body text " * 8)
+        page.insert_text((72, 100), "a second line of ordinary text on this page " * 2)
+    data = pdf_doc.tobytes()
+    pdf_doc.close()
+    return data
+
+
+def _serial_texts(processor, pdf_data: bytes) -> list:
+    pdf_doc = pymupdf.open(stream=pdf_data, filetype="pdf")
+    try:
+        return [result[0] for result in processor._extract_page_range(pdf_doc, pdf_data, range(pdf_doc.page_count))]
+    finally:
+        pdf_doc.close()
+
+
+class _BrokenExecutor:
+    """Executor whose workers have died"""
+    
+    def __init__(self):
+        self.shut_down = False
+    
+    def submit(self, fn, *args):
+        future = Future()
+        future.set_exception(BrokenProcessPool("worker died"))
+        return future
+    
+    def shutdown(self, wait=True, cancel_futures=False):
+        self.shut_down = True
+
+
+def test_broken_page_pool_falls_back_to_in_process_extraction(monkeypatch):
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    pdf_data = _make_pdf(4)
+    broken = _BrokenExecutor()
+    monkeypatch.setattr(document_processor, "_page_executor", broken)
+    
+    pdf_doc = pymupdf.open(stream=pdf_data, filetype="pdf")
+    try:
+        results = processor._extract_pages_parallel(pdf_doc, pdf_data)
+    finally:
+        pdf_doc.close()
+    
+    assert [result[0] for result in results] == _serial_texts(processor, pdf_data)
+    assert broken.shut_down
+    assert document_processor._page_executor is None
+
+
+def test_page_pool_workers_match_serial_extraction(monkeypatch):
+    def fail_discard(executor):
+        raise AssertionError("page pool broke")
+    monkeypatch.setattr(document_processor, "_discard_page_executor", fail_discard)
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    pdf_data = _make_pdf(4)
+    
+    pdf_doc = pymupdf.open(stream=pdf_data, filetype="pdf")
+    try:
+        results = processor._extract_pages_parallel(pdf_doc, pdf_data)
+    finally:
+        pdf_doc.close()
+        document_processor.shutdown_page_executor()
+    
+    texts = [result[0] for result in results]
+    assert texts == _serial_texts(processor, pdf_data)
+    assert "Page 4" in texts[3]
+
+
+def test_batch_ocr_bounds_rendered_pages_and_falls_back_per_page(monkeypatch):
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    window = 2 * document_processor.settings.ocr_workers
+    held = {"now": 0, "max": 0}
+    lock = threading.Lock()
+    
+    def render(page):
+        with lock:
+            held["now"] += 1
+            held["max"] = max(held["max"], held["now"])
+        return page
+    
+    def recognize(engine, page):
+        time.sleep(0.002)
+        with lock:
+            held["now"] -= 1
+        if page == 7:
+            raise RuntimeError("recognition failed")
+        return f"text {page}"
+    
+    monkeypatch.setattr(processor, "_get_rapid_ocr", lambda: object(), raising=False)
+    monkeypatch.setattr(processor, "_render_page_array", render, raising=False)
+    monkeypatch.setattr(processor, "_rapidocr_text", recognize, raising=False)
+    monkeypatch.setattr(processor, "extract_text_with_ocr", lambda page: f"fallback {page}", raising=False)
+    
+    texts = processor.extract_text_with_ocr_batch(list(range(40)))
+    
+    assert held["max"] <= window
+    assert texts[7] == "fallback 7"
+    assert texts[:7] + texts[8:] == [f"text {page}" for page in range(40) if page != 7]
+
+
+def test_page_analysis_cache_hit_still_fills_page_text(monkeypatch):
+    monkeypatch.setattr(document_processor, "_page_analysis_cache", {})
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    pdf_doc = pymupdf.open(stream=_make_pdf(1), filetype="pdf")
+    try:
+        first_cache, second_cache = {}, {}
+        first = processor._analyze_page_complexity(pdf_doc[0], first_cache)
+        second = processor._analyze_page_complexity(pdf_doc[0], second_cache)
+    finally:
+        pdf_doc.close()
+    
+    assert len(document_processor._page_analysis_cache) == 1
+    assert second == first
+    assert second_cache["text"] == first_cache["text"]
+    assert "Page 1" in second_cache["text"]
+
+
+def test_page_analysis_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(document_processor, "_page_analysis_cache", {})
+    monkeypatch.setattr(document_processor, "PAGE_ANALYSIS_CACHE_SIZE", 2)
+    
+    document_processor._cache_page_analysis(b"a", {"page": "a"})
+    document_processor._cache_page_analysis(b"b", {"page": "b"})
+    assert document_processor._get_page_analysis(b"a") == {"page": "a"}
+    document_processor._cache_page_analysis(b"c", {"page": "c"})
+    
+    assert set(document_processor._page_analysis_cache) == {b"a", b"c"}
+
+
+def test_read_local_file_stats_the_file_once(tmp_path, monkeypatch):
+    pdf = tmp_path / "policy.pdf"
+    pdf.write_bytes(b"%PDF-1.4 test")
+    stat_calls = []
+    real_stat = Path.stat
+    
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self)
+        return real_stat(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    # Path.resolve stats the path itself on some Python versions - the path is already absolute
+    monkeypatch.setattr(Path, "resolve", lambda self, strict=False: self)
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    
+    content = asyncio.run(processor._read_local_file(f"file://{pdf}"))
+    
+    assert content == b"%PDF-1.4 test"
+    assert stat_calls == [pdf]
+
+
+def test_read_local_file_maps_denied_stat_to_403(tmp_path, monkeypatch):
+    pdf = tmp_path / "policy.pdf"
+    pdf.write_bytes(b"%PDF-1.4 test")
+    
+    def denied_stat(self, *args, **kwargs):
+        raise PermissionError(13, "Permission denied", str(self))
+    
+    monkeypatch.setattr(Path, "stat", denied_stat)
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(processor._read_local_file(f"file://{pdf}"))
+    
+    assert exc_info.value.status_code == 403
+
+
+def test_read_local_file_missing_file_is_404(tmp_path):
+    processor = DocumentProcessor.__new__(DocumentProcessor)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(processor._read_local_file(f"file://{tmp_path / 'missing.pdf'}"))
+    
+    assert exc_info.value.status_code == 404
@@ -0,0 +1,16 @@
+"""
+Tests for the application module
+"""
+import subprocess
+import sys
+
+
+def test_importing_main_does_not_load_service_stack():
+    # Run in a fresh interpreter - other tests may already have imported the routes
+    result = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, app.main; print('app.api.routes' in sys.modules, 'torch' in sys.modules)"],
+        capture_output=True, text=True, check=True
+    )
+    
+    assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,133 @@
+"""
+End-to-end tests for the /query route
+"""
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# The route module pulls in the embedding and reranking stacks at import time
+pytest.importorskip("torch")
+pytest.importorskip("sentence_transformers")
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import routes
+from app.core.config import BEARER_TOKEN, settings
+from app.services.lru_cache_manager import HighPerformanceCacheManager
+from app.services.rag_coordinator import RAGCoordinator
+
+
+class _FakeEmbeddingManager:
+    def __init__(self):
+        self.batches = []
+
+    async def encode_queries(self, questions):
+        self.batches.append(list(questions))
+        return [np.zeros(4, dtype=np.float32) for _ in questions]
+
+
+class _FakeVectorStore:
+    def get_document_info(self, doc_id):
+        return {"document_type": "semantic_search"}
+
+    def search(self, query_embedding, k, doc_id_filter=None):
+        return [SimpleNamespace(similarity_score=0.5, metadata=SimpleNamespace(doc_id=doc_id_filter))]
+
+
+class _FakeAnswerGenerator:
+    def __init__(self):
+        self.questions = []
+
+    async def generate_answer(self, question, search_results, max_context_length):
+        self.questions.append(question)
+        return SimpleNamespace(
+            answer=f"answer to {question}",
+            context_used=["chunk"],
+            sources=[{"similarity_score": 0.9}],
+            model_info={}
+        )
+
+
+class _FakeQuestionLogger:
+    def start_session(self, document_url, doc_id, metadata):
+        return "session-1"
+
+    def log_questions_bulk(self, session_id, rows):
+        pass
+
+    def end_session(self, session_id, document_url, doc_id, session_metadata):
+        return True
+
+
+@pytest.fixture
+def coordinator(monkeypatch):
+    coordinator = RAGCoordinator.__new__(RAGCoordinator)
+    coordinator.embedding_manager = _FakeEmbeddingManager()
+    coordinator.vector_store = _FakeVectorStore()
+    coordinator.answer_generator = _FakeAnswerGenerator()
+    coordinator.cache_manager = HighPerformanceCacheManager()
+
+    async def process_document(url):
+        return {"status": "cached", "doc_id": "doc-1"}
+
+    coordinator.process_document = process_document
+
+    monkeypatch.setattr(routes, "get_rag_coordinator", lambda: coordinator)
+    monkeypatch.setattr(routes, "get_question_logger", _FakeQuestionLogger)
+    monkeypatch.setattr(routes, "settings", settings.model_copy(update={"max_concurrent_questions": 2}))
+    return coordinator
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(routes.router)
+    return TestClient(app)
+
+
+def _query(client, questions):
+    return client.post(
+        "/query",
+        json={"documents": "https://example.com/policy.pdf", "questions": questions},
+        headers={"Authorization": f"Bearer {BEARER_TOKEN}"}
+    )
+
+
+def test_query_answers_uncached_questions_end_to_end(client, coordinator):
+    response = _query(client, ["What is covered?", "What is excluded?"])
+
+    assert response.status_code == 200
+    assert response.json() == {"answers": ["answer to What is covered?", "answer to What is excluded?"]}
+    assert coordinator.embedding_manager.batches == [["What is covered?", "What is excluded?"]]
+
+
+def test_query_serves_repeated_questions_from_answer_cache(client, coordinator):
+    _query(client, ["What is covered?"])
+
+    response = _query(client, ["What is covered?", "What is excluded?"])
+
+    assert response.status_code == 200
+    assert response.json()["answers"] == ["answer to What is covered?", "answer to What is excluded?"]
+    # Only the new question reaches embedding and answer generation
+    assert coordinator.embedding_manager.batches[-1] == ["What is excluded?"]
+    assert coordinator.answer_generator.questions == ["What is covered?", "What is excluded?"]
+
+
+def test_system_stats_collects_stats_once(client, coordinator):
+    calls = []
+
+    def get_system_stats():
+        calls.append(1)
+        return {"status": "ready"}
+
+    coordinator.get_system_stats = get_system_stats
+    coordinator.answer_generator.api_key = "key"
+
+    response = client.get("/debug/system-stats", headers={"Authorization": f"Bearer {BEARER_TOKEN}"})
+
+    assert response.status_code == 200
+    assert response.json()["statistics"] == {"status": "ready"}
+    assert response.json()["health"]["system_stats"] == {"status": "ready"}
+    assert calls == [1]
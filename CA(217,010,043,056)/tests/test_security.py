@@ -0,0 +1,40 @@
+"""
+Tests for bearer token authentication
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.config import BEARER_TOKEN
+from app.core.security import verify_token
+
+
+def _request(headers: dict):
+    return SimpleNamespace(headers=headers)
+
+
+def test_verify_token_accepts_matching_bearer_token():
+    request = _request({"authorization": f"Bearer {BEARER_TOKEN}"})
+    
+    assert asyncio.run(verify_token(request)) == BEARER_TOKEN
+
+
+@pytest.mark.parametrize("authorization", [
+    None,
+    "",
+    BEARER_TOKEN,
+    f"bearer {BEARER_TOKEN}",
+    f"Bearer {BEARER_TOKEN}x",
+    f"Bearer {BEARER_TOKEN[:-1]}",
+    "Bearer tökén",
+])
+def test_verify_token_rejects_other_headers(authorization):
+    headers = {} if authorization is None else {"authorization": authorization}
+    
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(verify_token(_request(headers)))
+    
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.headers == {"WWW-Authenticate": "Bearer"}